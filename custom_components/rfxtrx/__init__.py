@@ -5,6 +5,7 @@ from __future__ import annotations
 import binascii
 from collections.abc import Callable, Mapping
 import copy
+from functools import partial
 import logging
 from typing import Any, NamedTuple, cast
 
@@ -23,13 +24,10 @@ from homeassistant.const import (
     Platform,
 )
 from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv, device_registry as dr
 from homeassistant.helpers.device_registry import EventDeviceRegistryUpdatedData
-from homeassistant.helpers.dispatcher import (
-    async_dispatcher_connect,
-    async_dispatcher_send,
-)
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -52,6 +50,19 @@ CONNECT_TIMEOUT = 30.0
 
 _LOGGER = logging.getLogger(__name__)
 
+##############################
+from homeassistant.helpers.entity_platform import async_get_current_platform
+
+from .ext import (
+    auto_add as ext_auto_add,
+    device_cache as ext_device_cache,
+    gateway as ext_gateway,
+    off_delay as ext_off_delay,
+    platforms as ext_platforms,
+)
+from .ext.const import DATA_DEVICE_TABLE
+
+##############################
 
 class DeviceTuple(NamedTuple):
     """Representation of a device in rfxtrx."""
@@ -87,22 +98,35 @@ PLATFORMS = [
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up the RFXtrx component."""
     hass.data.setdefault(DOMAIN, {})
+    ##############################
+    ext_off_delay.async_setup_off_delay(hass, entry)
+    ##############################
 
     await async_setup_internal(hass, entry)
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    ##############################
+    await ext_platforms.async_forward_platforms(
+        hass,
+        entry,
+        hass.data[DOMAIN][DATA_DEVICE_TABLE].platforms,
+    )
+    ##############################
 
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload RFXtrx component."""
-    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+    ##############################
+    platforms = ext_platforms.async_get_loaded_platforms(hass)
+    ##############################
+    if not await hass.config_entries.async_unload_platforms(entry, platforms):
         return False
 
     hass.services.async_remove(DOMAIN, SERVICE_SEND)
 
-    rfx_object = hass.data[DOMAIN][DATA_RFXOBJECT]
-    await hass.async_add_executor_job(rfx_object.close_connection)
+    ##############################
+    await hass.async_add_executor_job(ext_gateway.async_get_gateway(hass).close)
+    ##############################
 
     hass.data.pop(DOMAIN)
 
@@ -126,35 +150,47 @@ def _create_rfx(
     else:
         transport = rfxtrxmod.PySerialTransport(config[CONF_DEVICE])
 
-    rfx = rfxtrxmod.Connect(
-        transport,
+    ##############################
+    # Connected in the background by the gateway connection
+    return rfxtrxmod.Connect(
+        ext_gateway.lock_transport(transport),
         event_callback,
         modes=modes,
     )
+    ##############################
 
-    try:
-        rfx.connect(CONNECT_TIMEOUT)
-    except TimeoutError as exc:
-        raise ConfigEntryNotReady("Timeout on connect") from exc
-    except rfxtrxmod.RFXtrxTransportError as exc:
-        raise ConfigEntryNotReady(str(exc)) from exc
 
-    return rfx
+##############################
+class ConfiguredDevice(NamedTuple):
+    """A device of the config entry, parsed once for every platform."""
 
+    event: rfxtrxmod.RFXtrxEvent
+    device_id: DeviceTuple
+    entity_info: dict[str, Any]
 
-def _get_device_lookup(
-    devices: dict[str, dict[str, Any]],
-) -> dict[DeviceTuple, dict[str, Any]]:
-    """Get a lookup structure for devices."""
-    lookup = {}
-    for event_code, event_config in devices.items():
-        if (event := get_rfx_object(event_code)) is None:
+
+def _parse_devices(devices: dict[str, dict[str, Any]]) -> ext_platforms.DeviceTable:
+    """Parse the configured devices into the table shared by the platforms."""
+    table = ext_platforms.DeviceTable()
+    for packet_id, entity_info in devices.items():
+        if (event := get_rfx_object(packet_id)) is None:
+            _LOGGER.error("Invalid device: %s", packet_id)
             continue
         device_id = get_device_id(
-            event.device, data_bits=event_config.get(CONF_DATA_BITS)
+            event.device, data_bits=entity_info.get(CONF_DATA_BITS)
         )
-        lookup[device_id] = event_config
-    return lookup
+        table.add(ConfiguredDevice(event, device_id, entity_info))
+    return table
+
+
+##############################
+
+
+def _get_device_lookup(
+    table: list[ConfiguredDevice],
+) -> dict[DeviceTuple, dict[str, Any]]:
+    """Get a lookup structure for devices."""
+    return {device.device_id: device.entity_info for device in table}
 
 
 async def async_setup_internal(hass: HomeAssistant, entry: ConfigEntry) -> None:
@@ -162,7 +198,12 @@ async def async_setup_internal(hass: HomeAssistant, entry: ConfigEntry) -> None:
     config = entry.data
 
     # Setup some per device config
-    devices = _get_device_lookup(config[CONF_DEVICES])
+    ##############################
+    table = hass.data[DOMAIN][DATA_DEVICE_TABLE] = _parse_devices(config[CONF_DEVICES])
+    devices = _get_device_lookup(table.devices)
+    if config[CONF_AUTOMATIC_ADD]:
+        ext_auto_add.async_setup_auto_add(hass, entry)
+    ##############################
     pt2262_devices: set[str] = set()
 
     device_registry = dr.async_get(hass)
@@ -238,6 +279,10 @@ async def async_setup_internal(hass: HomeAssistant, entry: ConfigEntry) -> None:
         data[CONF_DEVICES][event_code] = config
         hass.config_entries.async_update_entry(entry=entry, data=data)
         devices[device_id] = config
+        ##############################
+        # For any platform that is only set up for this device
+        table.add(ConfiguredDevice(event, device_id, config))
+        ##############################
 
     @callback
     def _remove_device(device_id: DeviceTuple) -> None:
@@ -251,6 +296,9 @@ async def async_setup_internal(hass: HomeAssistant, entry: ConfigEntry) -> None:
         }
         hass.config_entries.async_update_entry(entry=entry, data=data)
         devices.pop(device_id)
+        ##############################
+        table.remove(device_id)
+        ##############################
 
     @callback
     def _updated_device(event: Event[EventDeviceRegistryUpdatedData]) -> None:
@@ -264,19 +312,31 @@ async def async_setup_internal(hass: HomeAssistant, entry: ConfigEntry) -> None:
             _remove_device(device_id)
 
     # Initialize library
-    rfx_object = await hass.async_add_executor_job(
+    ##############################
+    create_rfx = partial(
         _create_rfx, config, lambda event: hass.add_job(async_handle_receive, event)
     )
+    rfx_object = await hass.async_add_executor_job(create_rfx)
 
     hass.data[DOMAIN][DATA_RFXOBJECT] = rfx_object
+    gateway = ext_gateway.async_setup_gateway(
+        hass, entry, create_rfx, rfx_object, CONNECT_TIMEOUT
+    )
+    ##############################
 
     entry.async_on_unload(
         hass.bus.async_listen(dr.EVENT_DEVICE_REGISTRY_UPDATED, _updated_device)
     )
 
+    ##############################
+    ext_device_cache.async_get_device_cache(hass).async_setup(entry)
+    ##############################
+
     def _shutdown_rfxtrx(event: Event) -> None:
         """Close connection with RFXtrx."""
-        rfx_object.close_connection()
+        ##############################
+        gateway.close()
+        ##############################
 
     entry.async_on_unload(
         hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _shutdown_rfxtrx)
@@ -284,7 +344,11 @@ async def async_setup_internal(hass: HomeAssistant, entry: ConfigEntry) -> None:
 
     def send(call: ServiceCall) -> None:
         event = call.data[ATTR_EVENT]
-        rfx_object.transport.send(event)
+        ##############################
+        if not gateway.connected:
+            raise HomeAssistantError("The RFXtrx gateway is not connected")
+        hass.data[DOMAIN][DATA_RFXOBJECT].transport.send(event)
+        ##############################
 
     hass.services.async_register(DOMAIN, SERVICE_SEND, send, schema=SERVICE_SEND_SCHEMA)
 
@@ -310,16 +374,14 @@ async def async_setup_platform_entry(
 
     # Add entities from config
     entities = []
-    for packet_id, entity_info in entry_data[CONF_DEVICES].items():
-        if (event := get_rfx_object(packet_id)) is None:
-            _LOGGER.error("Invalid device: %s", packet_id)
-            continue
+    ##############################
+    table: ext_platforms.DeviceTable = hass.data[DOMAIN][DATA_DEVICE_TABLE]
+    platform = Platform(async_get_current_platform().domain)
+    for event, device_id, entity_info in table.for_platform(platform):
         if not supported(event):
             continue
+        ##############################
 
-        device_id = get_device_id(
-            event.device, data_bits=entity_info.get(CONF_DATA_BITS)
-        )
         if device_id in device_ids:
             continue
         device_ids.add(device_id)
@@ -334,17 +396,18 @@ async def async_setup_platform_entry(
         @callback
         def _update(event: rfxtrxmod.RFXtrxEvent, device_id: DeviceTuple) -> None:
             """Handle light updates from the RFXtrx gateway."""
-            if not supported(event):
-                return
-
             if device_id in device_ids:
                 return
             device_ids.add(device_id)
             async_add_entities(constructor(event, event, device_id, {}))
 
+        ##############################
         config_entry.async_on_unload(
-            async_dispatcher_connect(hass, SIGNAL_EVENT, _update)
+            ext_auto_add.async_get_auto_add(hass).async_register(
+                platform, supported, _update
+            )
         )
+        ##############################
 
 
 def get_rfx_object(packetid: str) -> rfxtrxmod.RFXtrxEvent | None:
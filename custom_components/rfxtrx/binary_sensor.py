@@ -14,8 +14,7 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_COMMAND_OFF, CONF_COMMAND_ON, STATE_ON
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
-from homeassistant.helpers import event as evt
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
@@ -31,6 +30,10 @@ from .entity import RfxtrxEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+##############################
+from .ext import off_delay as ext_off_delay
+
+##############################
 
 SENSOR_STATUS_ON = [
     "Panic",
@@ -75,16 +78,17 @@ SENSOR_TYPES = (
 
 SENSOR_TYPES_DICT = {desc.key: desc for desc in SENSOR_TYPES}
 
+##############################
+SENSOR_STATUS_ALL = frozenset((*SENSOR_STATUS_ON, *SENSOR_STATUS_OFF))
+##############################
+
 
 def supported(event: rfxtrxmod.RFXtrxEvent) -> bool:
     """Return whether an event supports binary_sensor."""
     if isinstance(event, rfxtrxmod.ControlEvent):
         return True
     if isinstance(event, rfxtrxmod.SensorEvent):
-        return event.values.get("Sensor Status") in [
-            *SENSOR_STATUS_ON,
-            *SENSOR_STATUS_OFF,
-        ]
+        return event.values.get("Sensor Status") in SENSOR_STATUS_ALL
     return False
 
 
@@ -150,7 +154,6 @@ class RfxtrxBinarySensor(RfxtrxEntity, BinarySensorEntity):
         self.entity_description = entity_description
         self._data_bits = data_bits
         self._off_delay = off_delay
-        self._delay_listener: CALLBACK_TYPE | None = None
         self._cmd_on = cmd_on
         self._cmd_off = cmd_off
 
@@ -166,6 +169,11 @@ class RfxtrxBinarySensor(RfxtrxEntity, BinarySensorEntity):
         if self.is_on and self._off_delay is not None:
             self._attr_is_on = False
 
+        ##############################
+        scheduler = ext_off_delay.async_get_off_delay(self.hass)
+        self.async_on_remove(lambda: scheduler.async_cancel(self))
+        ##############################
+
     def _apply_event_lighting4(self, event: rfxtrxmod.RFXtrxEvent) -> None:
         """Apply event for a lighting 4 device."""
         if self._data_bits is not None:
@@ -217,19 +225,17 @@ class RfxtrxBinarySensor(RfxtrxEntity, BinarySensorEntity):
 
         self.async_write_ha_state()
 
-        if self._delay_listener:
-            self._delay_listener()
-            self._delay_listener = None
-
+        ##############################
+        scheduler = ext_off_delay.async_get_off_delay(self.hass)
         if self.is_on and self._off_delay is not None:
+            scheduler.async_schedule(self, self._off_delay, self._off_delay_listener)
+        else:
+            scheduler.async_cancel(self)
 
-            @callback
-            def off_delay_listener(now: Any) -> None:
-                """Switch device off after a delay."""
-                self._delay_listener = None
-                self._attr_is_on = False
-                self.async_write_ha_state()
+    @callback
+    def _off_delay_listener(self) -> None:
+        """Switch device off after a delay."""
+        self._attr_is_on = False
+        self.async_write_ha_state()
 
-            self._delay_listener = evt.async_call_later(
-                self.hass, self._off_delay, off_delay_listener
-            )
+    ##############################
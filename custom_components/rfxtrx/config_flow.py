@@ -5,13 +5,12 @@ from __future__ import annotations
 import asyncio
 from contextlib import suppress
 import copy
+import functools
 import itertools
 import os
 from typing import Any, TypedDict, cast
 
 import RFXtrx as rfxtrxmod
-import serial
-import serial.tools.list_ports
 import voluptuous as vol
 
 from homeassistant.config_entries import (
@@ -64,11 +63,24 @@ from .const import (
 CONF_EVENT_CODE = "event_code"
 CONF_MANUAL_PATH = "Enter Manually"
 
-RECV_MODES = sorted(itertools.chain(*rfxtrxmod.lowlevel.Status.RECMODES))
-
 ##############################
 from .ext import config_flow as ext_config_flow
 
+
+@functools.cache
+def get_recv_modes() -> list[str]:
+    """Return the receive modes, worked out when a flow first needs them."""
+    return sorted(itertools.chain(*rfxtrxmod.lowlevel.Status.RECMODES))
+
+
+def list_serial_ports() -> list[Any]:
+    """Return the serial ports, importing the port listing on first use."""
+    # Only needed while setting up a serial gateway
+    import serial.tools.list_ports
+
+    return serial.tools.list_ports.comports()
+
+
 ##############################
 
 
@@ -169,7 +181,7 @@ class RfxtrxOptionsFlow(OptionsFlow):
             vol.Optional(
                 CONF_PROTOCOLS,
                 default=self.config_entry.data.get(CONF_PROTOCOLS) or [],
-            ): cv.multi_select(RECV_MODES),
+            ): cv.multi_select(get_recv_modes()),
             vol.Optional(CONF_EVENT_CODE): str,
             vol.Optional(CONF_DEVICE): vol.In(configure_devices),
         }
@@ -584,7 +596,7 @@ class RfxtrxConfigFlow(ConfigFlow, domain=DOMAIN):
             if not errors:
                 return self.async_create_entry(title="RFXTRX", data=data)
 
-        ports = await self.hass.async_add_executor_job(serial.tools.list_ports.comports)
+        ports = await self.hass.async_add_executor_job(list_serial_ports)
         list_of_ports = {}
         for port in ports:
             list_of_ports[port.device] = (
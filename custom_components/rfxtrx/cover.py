@@ -27,7 +27,7 @@ from .ext.const import DEVICE_PACKET_SUBTYPE_LIGHTING2_AC, DEVICE_PACKET_TYPE_LI
 _LOGGER = logging.getLogger(__name__)
 
 ##############################
-from .ext import cover as ext_cover
+from .ext import cover as ext_cover, scene as ext_scene
 
 ##############################
 
@@ -49,6 +49,14 @@ async def async_setup_entry(
 ) -> None:
     """Set up config entry."""
 
+    ##############################
+    await ext_cover.async_load_cover_modules(hass, config_entry)
+    ext_cover.async_setup_trace(hass)
+    await ext_cover.async_setup_frame_timer(hass, config_entry)
+    ext_cover.async_setup_group_index(hass, config_entry)
+    ext_scene.async_setup_move_covers_service(hass, config_entry)
+    ##############################
+
     def _constructor(
         event: rfxtrxmod.RFXtrxEvent,
         auto: rfxtrxmod.RFXtrxEvent | None,
@@ -12,9 +12,14 @@ from homeassistant.core import Context, HomeAssistant
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.typing import ConfigType, TemplateVarsType
 
-from . import DATA_RFXOBJECT, DOMAIN
+from . import DOMAIN
 from .helpers import async_get_device_object
 
+##############################
+from .ext import gateway as ext_gateway
+
+##############################
+
 CONF_DATA = "data"
 CONF_SUBTYPE = "subtype"
 
@@ -95,7 +100,9 @@ async def async_call_action_from_config(
     """Execute a device action."""
     config = ACTION_SCHEMA(config)
 
-    rfx = hass.data[DOMAIN][DATA_RFXOBJECT]
+    ##############################
+    rfx = ext_gateway.async_get_connected_rfx(hass)
+    ##############################
     commands, send_fun = _get_commands(hass, config[CONF_DEVICE_ID], config[CONF_TYPE])
     sub_type = config[CONF_SUBTYPE]
 
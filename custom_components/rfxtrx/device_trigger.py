@@ -8,9 +8,7 @@ from homeassistant.components.device_automation import (
     DEVICE_TRIGGER_BASE_SCHEMA,
     InvalidDeviceAutomationConfig,
 )
-from homeassistant.components.homeassistant.triggers import event as event_trigger
 from homeassistant.const import (
-    ATTR_DEVICE_ID,
     CONF_DEVICE_ID,
     CONF_DOMAIN,
     CONF_PLATFORM,
@@ -21,9 +19,13 @@ from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
 from homeassistant.helpers.typing import ConfigType
 
 from . import DOMAIN
-from .const import EVENT_RFXTRX_EVENT
 from .helpers import async_get_device_object
 
+##############################
+from .ext import device_trigger as ext_device_trigger
+
+##############################
+
 CONF_SUBTYPE = "subtype"
 
 CONF_TYPE_COMMAND = "command"
@@ -92,21 +94,13 @@ async def async_attach_trigger(
     """Attach a trigger."""
     config = TRIGGER_SCHEMA(config)
 
-    event_data = {ATTR_DEVICE_ID: config[CONF_DEVICE_ID]}
-
+    ##############################
     if config[CONF_TYPE] == CONF_TYPE_COMMAND:
-        event_data["values"] = {"Command": config[CONF_SUBTYPE]}
-    elif config[CONF_TYPE] == CONF_TYPE_STATUS:
-        event_data["values"] = {"Status": config[CONF_SUBTYPE]}
-
-    event_config = event_trigger.TRIGGER_SCHEMA(
-        {
-            event_trigger.CONF_PLATFORM: "event",
-            event_trigger.CONF_EVENT_TYPE: EVENT_RFXTRX_EVENT,
-            event_trigger.CONF_EVENT_DATA: event_data,
-        }
-    )
+        value_key = "Command"
+    else:
+        value_key = "Status"
 
-    return await event_trigger.async_attach_trigger(
-        hass, event_config, action, trigger_info, platform_type="device"
+    return ext_device_trigger.async_get_trigger_index(hass).async_attach(
+        config[CONF_DEVICE_ID], value_key, config[CONF_SUBTYPE], action, trigger_info
     )
+    ##############################
@@ -8,6 +8,11 @@ from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
+##############################
+from .ext import diagnostics as ext_diagnostics
+
+##############################
+
 TO_REDACT = {"host"}
 
 
@@ -17,4 +22,7 @@ async def async_get_config_entry_diagnostics(
     """Return diagnostics for a config entry."""
     return {
         "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        ##############################
+        "timing": ext_diagnostics.async_get_timing_diagnostics(hass),
+        ##############################
     }
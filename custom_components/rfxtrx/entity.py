@@ -13,7 +13,15 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from . import DeviceTuple
-from .const import ATTR_EVENT, COMMAND_GROUP_LIST, DATA_RFXOBJECT, DOMAIN, SIGNAL_EVENT
+from .const import ATTR_EVENT, COMMAND_GROUP_LIST, DOMAIN, SIGNAL_EVENT
+
+##############################
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import State
+
+from .ext import gateway as ext_gateway
+
+##############################
 
 
 def _get_identifiers_from_device_tuple(
@@ -35,6 +43,10 @@ class RfxtrxEntity(RestoreEntity):
     _attr_should_poll = False
     _device: rfxtrxmod.RFXtrxDevice
     _event: rfxtrxmod.RFXtrxEvent | None
+    ##############################
+    # Cleared for entities that are passed their packets some other way
+    _myattr_subscribe_events: bool = True
+    ##############################
 
     def __init__(
         self,
@@ -58,13 +70,38 @@ class RfxtrxEntity(RestoreEntity):
 
     async def async_added_to_hass(self) -> None:
         """Restore RFXtrx device state (ON/OFF)."""
+        ##############################
+        # Let mixins later in the MRO, such as the cover groups, register
+        await super().async_added_to_hass()
+        ##############################
         if self._event:
             self._apply_event(self._event)
 
+        ##############################
+        if not self._myattr_subscribe_events:
+            return
+        ##############################
         self.async_on_remove(
             async_dispatcher_connect(self.hass, SIGNAL_EVENT, self._handle_event)
         )
 
+    ##############################
+    @property
+    def available(self) -> bool:
+        """Return if the gateway is connected."""
+        return ext_gateway.async_is_connected(self.hass)
+
+    async def async_get_last_state(self) -> State | None:
+        """Get the state from the previous run, unless it was unavailable."""
+        # Saved while the gateway was not connected, so it has no attributes
+        # and says nothing about the device
+        old_state = await super().async_get_last_state()
+        if old_state is None or old_state.state == STATE_UNAVAILABLE:
+            return None
+        return old_state
+
+    ##############################
+
     @property
     def extra_state_attributes(self) -> dict[str, str] | None:
         """Return the device state attributes."""
@@ -119,5 +156,7 @@ class RfxtrxCommandEntity(RfxtrxEntity):
     async def _async_send[*_Ts](
         self, fun: Callable[[rfxtrxmod.PySerialTransport, *_Ts], None], *args: *_Ts
     ) -> None:
-        rfx_object: rfxtrxmod.Connect = self.hass.data[DOMAIN][DATA_RFXOBJECT]
+        ##############################
+        rfx_object = ext_gateway.async_get_connected_rfx(self.hass)
+        ##############################
         await self.hass.async_add_executor_job(fun, rfx_object.transport, *args)
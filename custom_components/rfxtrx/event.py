@@ -20,6 +20,12 @@ from .entity import RfxtrxEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+##############################
+from .ext.const import ATTR_PRESS
+from .ext.event import BurstMixin
+
+##############################
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -45,14 +51,24 @@ async def async_setup_entry(
         if hasattr(event.device, "COMMANDS"):
             entities.append(
                 RfxtrxEventEntity(
-                    event.device, device_id, "COMMANDS", "Command", "command"
+                    event.device,
+                    device_id,
+                    "COMMANDS",
+                    "Command",
+                    "command",
+                    entity_info,
                 )
             )
 
         if hasattr(event.device, "STATUS"):
             entities.append(
                 RfxtrxEventEntity(
-                    event.device, device_id, "STATUS", "Sensor Status", "status"
+                    event.device,
+                    device_id,
+                    "STATUS",
+                    "Sensor Status",
+                    "status",
+                    entity_info,
                 )
             )
 
@@ -63,7 +79,7 @@ async def async_setup_entry(
     )
 
 
-class RfxtrxEventEntity(RfxtrxEntity, EventEntity):
+class RfxtrxEventEntity(RfxtrxEntity, EventEntity, BurstMixin):
     """Representation of a RFXtrx event."""
 
     def __init__(
@@ -73,13 +89,20 @@ class RfxtrxEventEntity(RfxtrxEntity, EventEntity):
         device_attribute: str,
         value_attribute: str,
         translation_key: str,
+        entity_info: dict[str, Any] | None = None,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(device, device_id)
         commands: dict[int, str] = getattr(device, device_attribute)
         self._attr_name = None
         self._attr_unique_id = "_".join(x for x in device_id)
-        self._attr_event_types = [slugify(command) for command in commands.values()]
+        ##############################
+        self._myattr_slugs = {
+            command: slugify(command) for command in commands.values()
+        }
+        self._attr_event_types = list(self._myattr_slugs.values())
+        self._init_burst(entity_info or {})
+        ##############################
         self._attr_translation_key = translation_key
         self._value_attribute = value_attribute
 
@@ -91,10 +114,15 @@ class RfxtrxEventEntity(RfxtrxEntity, EventEntity):
 
         assert isinstance(event, (ControlEvent, SensorEvent))
 
-        event_type = slugify(event.values[self._value_attribute])
-        if event_type not in self._attr_event_types:
-            _LOGGER.warning("Event type %s is not known", event_type)
+        ##############################
+        value = event.values[self._value_attribute]
+        if (event_type := self._myattr_slugs.get(value)) is None:
+            _LOGGER.warning("Event type %s is not known", slugify(value))
+            return
+
+        if (press := self._burst_press(event_type)) is None:
             return
 
-        self._trigger_event(event_type, event.values)
+        self._trigger_event(event_type, {**event.values, ATTR_PRESS: press})
+        ##############################
         self.async_write_ha_state()
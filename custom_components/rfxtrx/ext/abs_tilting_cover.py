@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable
+from functools import partial
+import itertools
 import logging
+from types import MappingProxyType
 from typing import Any
 
 import RFXtrx as rfxtrxmod
@@ -20,9 +23,10 @@ from homeassistant.const import ATTR_STATE, STATE_CLOSING, STATE_OPENING
 from homeassistant.core import callback
 
 from .. import DeviceTuple
-from ..const import CONF_VENETIAN_BLIND_MODE
+from ..const import CONF_VENETIAN_BLIND_MODE, DOMAIN
 from ..entity import RfxtrxCommandEntity
 from .const import (
+    ATTR_WAIT,
     CONF_CLOSE_SECONDS,
     CONF_COLOUR_ICON,
     CONF_CUSTOM_ICON,
@@ -36,6 +40,8 @@ from .const import (
     CONF_TILT_OPEN_ICON,
     CONF_TILT_POS1_MS,
     CONF_TILT_POS2_MS,
+    CONF_WAIT_FOR_MOVE,
+    DATA_FRAME_TIMER,
     DEF_CLOSE_SECONDS,
     DEF_COLOUR_ICON,
     DEF_CUSTOM_ICON,
@@ -48,7 +54,14 @@ from .const import (
     DEF_TILT_OPEN_ICON,
     DEF_TILT_POS1_MS,
     DEF_TILT_POS2_MS,
+    DEF_WAIT_FOR_MOVE,
 )
+from .frame_timer import FrameTimer, PulseStats
+from .gateway import async_get_connected_rfx
+from .group import GroupMixin
+from .movement import MovementMixin
+from .state_writer import CoalescedWriteMixin
+from .trace import trace
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -57,7 +70,9 @@ TILT_MID_STEP = 2
 TILT_MAX_STEP = 4
 
 
-class AbstractTiltingCover(RfxtrxCommandEntity, CoverEntity):
+class AbstractTiltingCover(
+    RfxtrxCommandEntity, CoverEntity, MovementMixin, CoalescedWriteMixin, GroupMixin
+):
     """Representation of a RFXtrx cover supporting tilt and, optionally, lift."""
 
     _device: rfxtrxmod.RollerTrolDevice | rfxtrxmod.RfyDevice | rfxtrxmod.LightingDevice
@@ -127,10 +142,23 @@ class AbstractTiltingCover(RfxtrxCommandEntity, CoverEntity):
         self._myattr_tilt_pos2_secs = (
             entity_info.get(CONF_TILT_POS2_MS, DEF_TILT_POS2_MS) / 1000
         )
+        self._myattr_wait_for_move = entity_info.get(
+            CONF_WAIT_FOR_MOVE, DEF_WAIT_FOR_MOVE
+        )
 
         self._myattr_is_raised = True
         self._myattr_tilt_step = TILT_MIN_STEP
 
+        self._myattr_move_target: tuple[bool, int] | None = None
+        self._myattr_move_origin = 0
+        self._myattr_lift_estimate: float | None = None
+        self._myattr_motor_running = False
+        self._myattr_pulsing = False
+        self._myattr_pulse_stats = PulseStats()
+        self._init_group(device_id, entity_info)
+        self._init_resync(entity_info)
+        self._init_pictures()
+
     async def async_added_to_hass(self) -> None:
         """Restore device state."""
         await super().async_added_to_hass()
@@ -151,10 +179,9 @@ class AbstractTiltingCover(RfxtrxCommandEntity, CoverEntity):
                     old_tilt_pos = 0
 
                 _LOGGER.info(
-                    "async_added_to_hass: old_pos = "
-                    + str(old_pos)
-                    + " old_tilt = "
-                    + str(old_tilt_pos)
+                    "async_added_to_hass: old_pos = %s old_tilt = %s",
+                    old_pos,
+                    old_tilt_pos,
                 )
 
                 if old_pos < 50:
@@ -164,46 +191,33 @@ class AbstractTiltingCover(RfxtrxCommandEntity, CoverEntity):
 
     async def async_set_cover_position(self, **kwargs: Any) -> None:
         """Move the cover to a specific position."""
-        if not (self._is_moving):
-            if ATTR_POSITION in kwargs:
-                position = kwargs[ATTR_POSITION]
-                if position > 85:
-                    _LOGGER.debug("async_set_cover_position: RAISING cover")
-                    await self._async_raise_blind()
-                    # await self._async_wait_and_set_position(self._myattr_open_secs, True, TILT_MIN_STEP)
-                elif position < 15:
-                    _LOGGER.debug("async_set_cover_position: closing cover to CLOSED")
-                    await self._async_tilt_blind_to_step(TILT_MIN_STEP)
-                else:
-                    _LOGGER.debug("async_set_cover_position: closing cover to OPEN")
-                    await self._async_tilt_blind_to_step(TILT_MID_STEP)
-        else:
-            _LOGGER.debug("async_set_cover_position: cover is in motion - ignoring")
+        if ATTR_POSITION in kwargs:
+            is_raised, tilt_step = self._position_target(kwargs[ATTR_POSITION])
+            _LOGGER.debug(
+                "async_set_cover_position: raised = %s tilt step = %s",
+                is_raised,
+                tilt_step,
+            )
+            await self._async_move_to(is_raised, tilt_step, kwargs.get(ATTR_WAIT))
 
     async def async_toggle(self, **kwargs: Any) -> None:
         """Toggle the entity."""
         if self._is_moving:
             _LOGGER.debug("toggle: cover is in motion - ignoring")
         elif self._myattr_is_raised or self._myattr_tilt_step != TILT_MIN_STEP:
-            await self._async_tilt_blind_to_step(TILT_MIN_STEP)
+            await self._async_move_to(False, TILT_MIN_STEP, kwargs.get(ATTR_WAIT))
         else:
-            await self._async_tilt_blind_to_step(TILT_MID_STEP)
+            await self._async_move_to(False, TILT_MID_STEP, kwargs.get(ATTR_WAIT))
 
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Move the cover up."""
-        if not (self._is_moving):
-            _LOGGER.debug("async_open_cover: tilting cover to open")
-            await self._async_tilt_blind_to_step(TILT_MID_STEP)
-        else:
-            _LOGGER.debug("async_open_cover: cover is in motion - ignoring")
+        _LOGGER.debug("async_open_cover: tilting cover to open")
+        await self._async_move_to(False, TILT_MID_STEP, kwargs.get(ATTR_WAIT))
 
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Move the cover down."""
-        if not (self._is_moving):
-            _LOGGER.debug("async_close_cover: tilting cover to closed")
-            await self._async_tilt_blind_to_step(TILT_MIN_STEP)
-        else:
-            _LOGGER.debug("async_close_cover: cover is in motion - ignoring")
+        _LOGGER.debug("async_close_cover: tilting cover to closed")
+        await self._async_move_to(False, TILT_MIN_STEP, kwargs.get(ATTR_WAIT))
 
     async def async_stop_cover(self, **kwargs: Any) -> None:
         """Stop the cover."""
@@ -211,6 +225,7 @@ class AbstractTiltingCover(RfxtrxCommandEntity, CoverEntity):
             _LOGGER.debug("async_stop_cover: cover is not in motion - ignoring")
         else:
             _LOGGER.debug("async_stop_cover: stopping cover")
+            self._async_cancel_movement()
             self._attr_is_closing = False
             self._attr_is_opening = False
             self.async_write_ha_state()
@@ -221,35 +236,27 @@ class AbstractTiltingCover(RfxtrxCommandEntity, CoverEntity):
 
     async def async_open_cover_tilt(self, **kwargs: Any) -> None:
         """Tilt the cover up."""
-        if not (self._is_moving):
-            _LOGGER.debug("async_open_cover_tilt: increasing tilt pos")
-            await self._async_tilt_blind_to_step(self._myattr_tilt_step + 1)
-        else:
-            _LOGGER.debug("async_open_cover_tilt: cover is in motion - ignoring")
+        _LOGGER.debug("async_open_cover_tilt: increasing tilt pos")
+        await self._async_move_to(
+            False, self._myattr_tilt_step + 1, kwargs.get(ATTR_WAIT)
+        )
 
     async def async_close_cover_tilt(self, **kwargs: Any) -> None:
         """Tilt the cover down."""
-        if not (self._is_moving):
-            _LOGGER.debug("async_close_cover_tilt: decreasing tilt pos")
-            await self._async_tilt_blind_to_step(self._myattr_tilt_step - 1)
-        else:
-            _LOGGER.debug("async_close_cover_tilt: cover is in motion - ignoring")
+        _LOGGER.debug("async_close_cover_tilt: decreasing tilt pos")
+        await self._async_move_to(
+            False, self._myattr_tilt_step - 1, kwargs.get(ATTR_WAIT)
+        )
 
     async def async_set_cover_tilt_position(self, **kwargs: Any) -> None:
         """Move the cover tilt to a specific position."""
-        if not (self._is_moving):
-            if ATTR_TILT_POSITION in kwargs:
-                tilt_position = self._tilt_to_steps(kwargs[ATTR_TILT_POSITION])
+        if ATTR_TILT_POSITION in kwargs:
+            tilt_position = self._tilt_to_steps(kwargs[ATTR_TILT_POSITION])
 
-                _LOGGER.debug(
-                    "async_set_cover_tilt_position: setting position "
-                    + str(tilt_position)
-                )
-                await self._async_tilt_blind_to_step(tilt_position)
-        else:
             _LOGGER.debug(
-                "async_set_cover_tilt_position: cover is in motion - ignoring"
+                "async_set_cover_tilt_position: setting position %s", tilt_position
             )
+            await self._async_move_to(False, tilt_position, kwargs.get(ATTR_WAIT))
 
     async def async_stop_cover_tilt(self, **kwargs: Any) -> None:
         """Stop the cover tilt."""
@@ -257,18 +264,14 @@ class AbstractTiltingCover(RfxtrxCommandEntity, CoverEntity):
             _LOGGER.debug("async_stop_cover_tilt: cover is not in motion - ignoring")
         else:
             _LOGGER.debug("async_stop_cover_tilt: stopping cover tilt")
+            self._async_cancel_movement()
             self._attr_is_closing = False
             self._attr_is_opening = False
             self.async_write_ha_state()
 
     async def async_update_cover_position(self, **kwargs) -> None:
         """Update the internal position."""
-        _LOGGER.info("Invoked async_update_cover_position")
-
-        old_cover_position = self._attr_current_cover_position
-        old_cover_tilt_position = self._attr_current_cover_tilt_position
-        old_is_closing = self._attr_is_closing
-        old_is_opening = self._attr_is_opening
+        _LOGGER.debug("Invoked async_update_cover_position")
 
         if ATTR_POSITION in kwargs:
             self._attr_current_cover_position = kwargs[ATTR_POSITION]
@@ -291,14 +294,8 @@ class AbstractTiltingCover(RfxtrxCommandEntity, CoverEntity):
                 self._attr_is_closing = False
                 self._attr_is_opening = True
 
-        if (
-            old_cover_position != self._attr_current_cover_position
-            or old_cover_tilt_position != self._attr_current_cover_tilt_position
-            or old_is_closing != self._attr_is_closing
-            or old_is_opening != self._attr_is_opening
-        ):
-            _LOGGER.debug("async_update_cover_position: written new state")
-            self.async_write_ha_state()
+        # Only written if something has changed
+        self.async_write_ha_state()
 
     def _apply_event(self, event: rfxtrxmod.RFXtrxEvent) -> None:
         """Apply command from rfxtrx."""
@@ -317,30 +314,209 @@ class AbstractTiltingCover(RfxtrxCommandEntity, CoverEntity):
         self.async_write_ha_state()
 
     @property
-    def entity_picture(self):
-        if self._myattr_custom_icon:
-            entity_picture = self._entity_picture()
-
-            _LOGGER.debug("Returned entity_picture attribute = " + entity_picture)
-            return entity_picture
-
-        return None
+    def entity_picture(self) -> str | None:
+        """Return the entity picture to use in the frontend."""
+        return self._myattr_pictures.get(self._picture_key())
 
     @property
     def icon(self) -> str | None:
         """Icon of the entity."""
-        if not (self._myattr_custom_icon):
-            icon = self._icon()
-
-            _LOGGER.debug("Returned icon attribute = " + icon)
-            return icon
-
-        return None
+        return self._myattr_icons.get(self._picture_key())
+
+    def _picture_key(self) -> tuple[bool, bool, int]:
+        """Return the key of the current state in the picture tables."""
+        return (bool(self._is_moving), self._myattr_is_raised, self._myattr_tilt_step)
+
+    def _init_pictures(self) -> None:
+        """Work out the picture or icon for every state up front.
+
+        The options that pick a picture do not change once the entity is
+        created, so a state write only needs to look the state up.
+        """
+        pictures: dict[tuple[bool, bool, int], str | None] = {}
+        icons: dict[tuple[bool, bool, int], str | None] = {}
+        for key in itertools.product(
+            (False, True), (False, True), range(TILT_MIN_STEP, TILT_MAX_STEP + 1)
+        ):
+            if self._myattr_custom_icon:
+                pictures[key] = self._entity_picture(*key)
+            else:
+                icons[key] = self._icon(*key)
+        self._myattr_pictures = MappingProxyType(pictures)
+        self._myattr_icons = MappingProxyType(icons)
 
     @property
     def _is_moving(self) -> bool | None:
         return self._attr_is_opening or self._attr_is_closing
 
+    async def _async_move_to(
+        self, is_raised: bool, tilt_step: int, wait: bool | None
+    ) -> None:
+        """Move the blind to a new state, preempting any movement in progress."""
+        target = (is_raised, tilt_step)
+        if (
+            not self._is_moving
+            and self._at_target(target)
+            and self._skip_redundant_move()
+        ):
+            _LOGGER.debug("_async_move_to: already at target - skipping")
+            trace(self.hass, self.entity_id, "skip", str(target))
+            return
+        if self._is_moving:
+            if target == self._myattr_move_target:
+                _LOGGER.debug("_async_move_to: already moving to target - ignoring")
+                return
+            self._preempt_movement()
+
+        self._myattr_move_target = target
+        trace(self.hass, self.entity_id, "move", str(target), self._scene_secs(target))
+        self._myattr_move_origin = self._attr_current_cover_position
+        if is_raised:
+            await self._async_run_movement(self._async_raise_blind(), wait)
+        else:
+            await self._async_run_movement(
+                self._async_tilt_blind_to_step(tilt_step), wait
+            )
+
+    def _preempt_movement(self) -> None:
+        """Abandon the movement in progress, estimating where the blind got to.
+
+        The blind is assumed to travel at a constant rate so the lift is
+        interpolated from the time spent travelling. The tilt cannot be
+        interpolated so it is taken from whichever end of the movement
+        the blind is nearer to.
+        """
+        fraction = self._travel_fraction()
+        # A pulse cancelled before its stop leaves the motor running
+        motor_running = fraction is None or fraction < 1 or self._myattr_pulsing
+        trace(
+            self.hass,
+            self.entity_id,
+            "preempt",
+            str(self._myattr_move_target),
+            self._move_secs,
+            None if fraction is None else fraction * self._move_secs,
+        )
+        self._async_cancel_movement()
+
+        if self._myattr_move_target is None or fraction is None:
+            self._attr_is_opening = False
+            self._attr_is_closing = False
+        else:
+            is_raised, tilt_step = self._myattr_move_target
+            origin = self._myattr_move_origin
+            target_position = self._lift_position(is_raised, tilt_step)
+            estimate = origin + (target_position - origin) * fraction
+            if fraction < 0.5:
+                tilt_step = self._myattr_tilt_step
+            self._set_position(estimate > 80, tilt_step)
+            self._attr_current_cover_position = round(estimate)
+            self._myattr_lift_estimate = estimate
+
+        self._myattr_motor_running = motor_running
+        _LOGGER.debug(
+            "_preempt_movement: position estimate = %s motor running = %s",
+            self._attr_current_cover_position,
+            motor_running,
+        )
+
+    def _position_target(self, position: int) -> tuple[bool, int]:
+        """Return the raised state and tilt step for a HA position."""
+        if position > 85:
+            return (True, TILT_MIN_STEP)
+        if position < 15:
+            return (False, TILT_MIN_STEP)
+        return (False, TILT_MID_STEP)
+
+    def _scene_target(
+        self, position: int | None, tilt_position: int | None
+    ) -> tuple[bool, int]:
+        """Return the state a scene position and tilt map to for this cover."""
+        if tilt_position is not None:
+            tilt_step = self._tilt_to_steps(tilt_position)
+            return (False, min(max(tilt_step, TILT_MIN_STEP), TILT_MAX_STEP))
+        if position is not None:
+            return self._position_target(position)
+        return (self._myattr_is_raised, self._myattr_tilt_step)
+
+    def _at_target(self, target: tuple[bool, int]) -> bool:
+        """Return whether the cover is at, or already heading for, a target."""
+        if self._is_moving:
+            return target == self._myattr_move_target
+        is_raised, tilt_step = target
+        if is_raised:
+            return self._myattr_is_raised
+        return not self._myattr_is_raised and tilt_step == self._myattr_tilt_step
+
+    def _scene_secs(self, target: tuple[bool, int]) -> float:
+        """Return the expected time for the cover to reach a target."""
+        is_raised, _ = target
+        if is_raised or self._myattr_is_raised:
+            return self._lift_secs(is_raised)
+        return self._myattr_sync_secs
+
+    async def _async_start_scene_move(self, target: tuple[bool, int]) -> None:
+        """Start moving to a target, returning once the first frame is sent."""
+        is_raised, tilt_step = target
+        await self._async_move_to(is_raised, tilt_step, False)
+
+    def _lift_position(self, is_raised: bool, tilt_step: int) -> int:
+        """Return the HA position for a raised state and tilt step."""
+        if is_raised:
+            return 100
+        if tilt_step <= TILT_MIN_STEP or tilt_step >= TILT_MAX_STEP:
+            return 0
+        if tilt_step == TILT_MID_STEP:
+            return 30
+        return 15
+
+    def _lift_secs(self, raising: bool) -> float:
+        """Return the time to allow for the blind to finish lifting or lowering.
+
+        After a preempted movement the time is scaled to the distance left
+        from the estimated position. Otherwise the full time is allowed
+        unless the blind is already at the end it is heading for.
+        """
+        if self._myattr_lift_estimate is not None:
+            if raising:
+                secs = self._myattr_open_secs * (100 - self._myattr_lift_estimate)
+            else:
+                secs = self._myattr_close_secs * self._myattr_lift_estimate
+            return max(secs / 100, self._myattr_sync_secs)
+        if raising:
+            return (
+                self._myattr_sync_secs
+                if self._myattr_is_raised
+                else self._myattr_open_secs
+            )
+        return (
+            self._myattr_sync_secs
+            if not (self._myattr_is_raised)
+            else self._myattr_close_secs
+        )
+
+    def _group_state(self) -> tuple[bool, int, bool | None, bool | None, int | None]:
+        """Return the state model to copy to the group members."""
+        return (
+            self._myattr_is_raised,
+            self._myattr_tilt_step,
+            self._attr_is_opening,
+            self._attr_is_closing,
+            self._attr_current_cover_position,
+        )
+
+    def _apply_group_state(
+        self, state: tuple[bool, int, bool | None, bool | None, int | None]
+    ) -> None:
+        """Take on the state model of a group."""
+        is_raised, tilt_step, is_opening, is_closing, position = state
+        # The group frame has taken over from anything this blind was doing
+        self._async_cancel_movement()
+        self._set_position(is_raised, tilt_step)
+        self._attr_is_opening = is_opening
+        self._attr_is_closing = is_closing
+        self._attr_current_cover_position = position
+
     def _tilt_to_steps(self, tilt_position) -> int:
         return int(round(tilt_position / (100 / TILT_MAX_STEP)))
 
@@ -363,6 +539,9 @@ class AbstractTiltingCover(RfxtrxCommandEntity, CoverEntity):
         """Translate my tilt position to HA position
         None is unknown, 0 is closed, 100 is fully open."""
 
+        self._myattr_lift_estimate = None
+        self._myattr_motor_running = False
+
         if self._myattr_is_raised:
             self._attr_is_closed = False
             self._attr_current_cover_position = 100
@@ -391,15 +570,14 @@ class AbstractTiltingCover(RfxtrxCommandEntity, CoverEntity):
         self._attr_is_closing = False
 
         _LOGGER.debug(
-            "_set_position; set new position - raised = "
-            + str(self._myattr_is_raised)
-            + " tilt = "
-            + str(self._myattr_tilt_step)
+            "_set_position; set new position - raised = %s tilt = %s",
+            self._myattr_is_raised,
+            self._myattr_tilt_step,
         )
 
     async def _async_wait_and_set_position(self, delay, is_raised, tilt_step) -> None:
         if delay > 0:
-            _LOGGER.info("_async_wait_and_set_position: Waiting secs = " + str(delay))
+            _LOGGER.debug("_async_wait_and_set_position: Waiting secs = %s", delay)
 
             if is_raised and not (self._myattr_is_raised):
                 self._attr_is_closing = False
@@ -416,39 +594,36 @@ class AbstractTiltingCover(RfxtrxCommandEntity, CoverEntity):
 
             self.async_write_ha_state()
 
+            self._start_travel(delay)
             await asyncio.sleep(delay)
 
         # If the blind is still closing then we have finished. Otherwise assume we were interrupted
         if self._is_moving:
-            _LOGGER.info(
+            _LOGGER.debug(
                 "_async_wait_and_set_position: Finished blind action, setting state"
             )
             self._set_position(is_raised, tilt_step)
             self.async_write_ha_state()
         else:
-            _LOGGER.info(
+            _LOGGER.debug(
                 "_async_wait_and_set_position: Finished blind action, state not as expected - not saving new state"
             )
 
-    def _entity_picture(self) -> str | None:
-        """Return the entity_picture property."""
+    def _entity_picture(
+        self, is_moving: bool, is_raised: bool, tilt_step: int
+    ) -> str | None:
+        """Return the entity_picture property for a state."""
         raise Exception("_entity_picture has not been implemented")
 
-    def _icon(self) -> str | None:
-        """Return the icon property."""
-        if self._is_moving and self._myattr_tilt_open_icon != "":
+    def _icon(self, is_moving: bool, is_raised: bool, tilt_step: int) -> str | None:
+        """Return the icon property for a state."""
+        if is_moving and self._myattr_tilt_open_icon != "":
             return self._myattr_tilt_open_icon
-        if self._myattr_is_raised and self._myattr_tilt_lifted_icon != "":
+        if is_raised and self._myattr_tilt_lifted_icon != "":
             return self._myattr_tilt_lifted_icon
-        if (
-            self._myattr_tilt_step == TILT_MIN_STEP
-            and self._myattr_tilt_closed_icon != ""
-        ):
+        if tilt_step == TILT_MIN_STEP and self._myattr_tilt_closed_icon != "":
             return self._myattr_tilt_closed_icon
-        if (
-            self._myattr_tilt_step == TILT_MID_STEP
-            and self._myattr_tilt_open_icon != ""
-        ):
+        if tilt_step == TILT_MID_STEP and self._myattr_tilt_open_icon != "":
             return self._myattr_tilt_open_icon
         if self._myattr_partial_is_closed and self._myattr_tilt_closed_icon != "":
             return self._myattr_tilt_closed_icon
@@ -462,38 +637,98 @@ class AbstractTiltingCover(RfxtrxCommandEntity, CoverEntity):
 
     async def _async_raise_blind(self):
         """Lift the cover."""
-        _LOGGER.info("Invoked _async_raise_blind")
+        _LOGGER.debug("Invoked _async_raise_blind")
         raise Exception("_async_raise_blind has not been implemented")
 
     async def _async_lower_blind(self):
         """Lower the cover."""
-        _LOGGER.info("Invoked _async_lower_blind")
+        _LOGGER.debug("Invoked _async_lower_blind")
         raise Exception("_async_lower_blind has not been implemented")
 
     async def _async_stop_blind(self):
         """Stop the cover."""
-        _LOGGER.info("Invoked _async_stop_blind")
+        _LOGGER.debug("Invoked _async_stop_blind")
         raise Exception("_async_stop_blind has not been implemented")
 
     async def _async_tilt_blind_to_step(self, tilt_step):
         """Move the cover tilt to a preset position."""
-        _LOGGER.info(
-            "Invoked _async_tilt_blind_to_mid_step; tilt_step = " + str(tilt_step)
-        )
+        _LOGGER.debug("Invoked _async_tilt_blind_to_step; tilt_step = %s", tilt_step)
         raise Exception("_async_tilt_blind_to_mid_step has not been implemented")
 
     async def _async_send(
         self, fun: Callable[[rfxtrxmod.PySerialTransport, *_Ts], None], *args: *_Ts
     ) -> None:
         """Send a command to the motor."""
-        _LOGGER.info("Invoked _async_send; command = " + fun.__name__)
+        _LOGGER.debug("Invoked _async_send; command = %s", fun.__name__)
         await super()._async_send(fun, *args)
+        trace(self.hass, self.entity_id, "tx", fun.__name__)
+        self._notify_frame_sent()
+
+    async def _async_send_pulse(
+        self, fun: Callable[[rfxtrxmod.PySerialTransport], None], secs: float
+    ) -> None:
+        """Send a command and then a stop secs after it was transmitted."""
+        _LOGGER.debug(
+            "Invoked _async_send_pulse; command = %s secs = %s", fun.__name__, secs
+        )
+
+        timer: FrameTimer | None = self.hass.data[DOMAIN].get(DATA_FRAME_TIMER)
+        if timer is None:
+            await self._async_send(fun)
+            self._start_travel(secs)
+            self._myattr_pulsing = True
+            try:
+                await asyncio.sleep(secs)
+                await self._async_send(self._device.send_stop)
+            finally:
+                self._myattr_pulsing = False
+            return
+
+        transport = async_get_connected_rfx(self.hass).transport
+        pulse = timer.pulse(
+            partial(fun, transport), partial(self._device.send_stop, transport), secs
+        )
+        try:
+            await asyncio.wrap_future(pulse.started)
+            self._start_travel(secs)
+            self._myattr_pulsing = True
+            self._notify_frame_sent()
+            timing = await asyncio.wrap_future(pulse.stopped)
+        except asyncio.CancelledError:
+            pulse.cancel()
+            raise
+        finally:
+            self._myattr_pulsing = False
+
+        trace(
+            self.hass,
+            self.entity_id,
+            "pulse",
+            fun.__name__,
+            timing.requested,
+            timing.width,
+        )
+        if self._myattr_pulse_stats.add(timing):
+            _LOGGER.warning(
+                "%s: stop frame missed its deadline by %.0f ms",
+                self.entity_id,
+                timing.error * 1000,
+            )
+        _LOGGER.debug(
+            "_async_send_pulse: requested %.3f secs, sent %.3f secs",
+            timing.requested,
+            timing.width,
+        )
+
+    def timing_diagnostics(self) -> dict[str, Any]:
+        """Return the pulse timing statistics for diagnostics."""
+        return self._myattr_pulse_stats.as_dict()
 
     async def _async_send_repeat(
         self, fun: Callable[[rfxtrxmod.PySerialTransport, *_Ts], None], *args: *_Ts
     ) -> None:
         """Repeating send a command to the motor."""
-        _LOGGER.info("Invoked _async_send_repeat; command = " + fun.__name__)
+        _LOGGER.debug("Invoked _async_send_repeat; command = %s", fun.__name__)
 
         if self._myattr_repetitions >= 2:
             for _ in range(self._myattr_repetitions - 1):
@@ -0,0 +1,146 @@
+"""Automatic add routing for RFXtrx platforms."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+from typing import TYPE_CHECKING
+
+import RFXtrx as rfxtrxmod
+
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.const import Platform
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from ..const import DOMAIN, SIGNAL_EVENT
+from .const import DATA_AUTO_ADD
+from .platforms import (
+    PLATFORM_SUPPORTED,
+    VALUE_DEPENDENT_PLATFORMS,
+    async_load_platforms_for_event,
+)
+
+if TYPE_CHECKING:
+    from .. import DeviceTuple
+
+_LOGGER = logging.getLogger(__name__)
+
+type Supported = Callable[[rfxtrxmod.RFXtrxEvent], bool]
+type AddDevice = Callable[[rfxtrxmod.RFXtrxEvent, DeviceTuple], None]
+type Registration = tuple[Platform, Supported, AddDevice]
+
+
+class AutoAddRouter:
+    """Offer the first packet of each device to the platforms once.
+
+    With automatic add on, every platform used to check every packet
+    against its own supported() predicate. Instead a single listener
+    works out which platforms support a device from the first packet
+    seen from it and hands the packet to just those. Any later packet
+    from the same device costs a single dict lookup.
+
+    A device that needs a platform that is not set up yet has it set up
+    first. The platform is then offered the next packet of the device.
+
+    Some platforms only support a device for some of the values in its
+    packets, such as the siren for a security device that reports a
+    panic. Such a platform keeps being offered the packets of a device
+    of a kind it may support until it accepts one.
+    """
+
+    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+        """Initialize the router."""
+        self._hass = hass
+        self._config_entry = config_entry
+        self._platforms: list[Registration] = []
+        # The platforms still to be offered the later packets of each device
+        self._seen: dict[DeviceTuple, list[Registration]] = {}
+
+    @callback
+    def async_setup(self) -> None:
+        """Start routing packets to the platforms."""
+        self._config_entry.async_on_unload(
+            async_dispatcher_connect(
+                self._hass, SIGNAL_EVENT, self._async_handle_event
+            )
+        )
+
+    @callback
+    def async_register(
+        self, platform: Platform, supported: Supported, add: AddDevice
+    ) -> CALLBACK_TYPE:
+        """Register a platform to be offered new devices."""
+        registration = (platform, supported, add)
+        self._platforms.append(registration)
+        # Devices seen before this platform was set up have not been offered to it
+        self._seen.clear()
+
+        @callback
+        def _async_unregister() -> None:
+            self._platforms.remove(registration)
+            for waiting in self._seen.values():
+                if registration in waiting:
+                    waiting.remove(registration)
+
+        return _async_unregister
+
+    @callback
+    def _async_handle_event(
+        self, event: rfxtrxmod.RFXtrxEvent, device_id: DeviceTuple
+    ) -> None:
+        """Offer the packet of a device not seen before to its platforms."""
+        if (waiting := self._seen.get(device_id)) is not None:
+            if waiting:
+                self._async_offer(event, device_id, waiting)
+            return
+
+        waiting = [
+            registration
+            for registration in self._platforms
+            if registration[0] in VALUE_DEPENDENT_PLATFORMS
+            and PLATFORM_SUPPORTED[registration[0]](event)
+        ]
+        # Until the entry is loaded the platforms the device needs cannot be
+        # set up, so it is offered again once they can be
+        if self._config_entry.state is ConfigEntryState.LOADED:
+            self._seen[device_id] = waiting
+            async_load_platforms_for_event(self._hass, self._config_entry, event)
+
+        adds = [
+            registration
+            for registration in self._platforms
+            if registration not in waiting and registration[1](event)
+        ]
+        _LOGGER.debug("Device %s is supported by %s platforms", device_id, len(adds))
+        for _, _, add in adds:
+            add(event, device_id)
+        self._async_offer(event, device_id, waiting)
+
+    @callback
+    def _async_offer(
+        self,
+        event: rfxtrxmod.RFXtrxEvent,
+        device_id: DeviceTuple,
+        waiting: list[Registration],
+    ) -> None:
+        """Offer a packet to the platforms that depend on its values."""
+        for registration in list(waiting):
+            _, supported, add = registration
+            if supported(event):
+                waiting.remove(registration)
+                add(event, device_id)
+
+
+@callback
+def async_setup_auto_add(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Start the router used by the platforms to add new devices."""
+    router = AutoAddRouter(hass, config_entry)
+    router.async_setup()
+    hass.data[DOMAIN][DATA_AUTO_ADD] = router
+
+
+@callback
+def async_get_auto_add(hass: HomeAssistant) -> AutoAddRouter:
+    """Return the router used by the platforms to add new devices."""
+    return hass.data[DOMAIN][DATA_AUTO_ADD]
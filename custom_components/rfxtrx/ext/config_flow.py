@@ -5,17 +5,29 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+import RFXtrx as rfxtrxmod
 import voluptuous as vol
 
+from homeassistant.const import Platform
 from homeassistant.helpers.typing import VolDictType
 
 from .const import (
     CONF_CLOSE_SECONDS,
     CONF_COLOUR_ICON,
     CONF_CUSTOM_ICON,
+    CONF_EVENT_BURST_MS,
+    CONF_EVENT_LONG_PRESS_MS,
+    CONF_GROUP_MEMBERS,
     CONF_OPEN_SECONDS,
     CONF_PARTIAL_CLOSED,
+    CONF_RESYNC_COMMANDS,
+    CONF_RESYNC_HOURS,
     CONF_ROLLER_MID_ON_CLOSE,
+    CONF_SENSOR_AGGREGATE,
+    CONF_SENSOR_DEADBAND,
+    CONF_SENSOR_HEARTBEAT,
+    CONF_SENSOR_MIN_INTERVAL,
+    CONF_SENSOR_WINDOW,
     CONF_SIGNAL_REPETITIONS,
     CONF_SIGNAL_REPETITIONS_DELAY_MS,
     CONF_STATE_SUPPORT,
@@ -28,12 +40,24 @@ from .const import (
     CONF_TILT_OPEN_ICON,
     CONF_TILT_POS1_MS,
     CONF_TILT_POS2_MS,
+    CONF_TILT_PRESS_MS,
+    CONF_WAIT_FOR_MOVE,
     DEF_CLOSE_SECONDS,
     DEF_COLOUR_ICON,
     DEF_CUSTOM_ICON,
+    DEF_EVENT_BURST_MS,
+    DEF_EVENT_LONG_PRESS_MS,
+    DEF_GROUP_MEMBERS,
     DEF_OPEN_SECONDS,
     DEF_PARTIAL_CLOSED,
+    DEF_RESYNC_COMMANDS,
+    DEF_RESYNC_HOURS,
     DEF_ROLLER_MID_ON_CLOSE,
+    DEF_SENSOR_AGGREGATE,
+    DEF_SENSOR_DEADBAND,
+    DEF_SENSOR_HEARTBEAT,
+    DEF_SENSOR_MIN_INTERVAL,
+    DEF_SENSOR_WINDOW,
     DEF_SIGNAL_REPETITIONS,
     DEF_SIGNAL_REPETITIONS_DELAY_MS,
     DEF_STATE_SUPPORT,
@@ -46,12 +70,15 @@ from .const import (
     DEF_TILT_OPEN_ICON,
     DEF_TILT_POS1_MS,
     DEF_TILT_POS2_MS,
+    DEF_TILT_PRESS_MS,
+    DEF_WAIT_FOR_MOVE,
     DEVICE_PACKET_SUBTYPE_BLINDST19,
     DEVICE_PACKET_SUBTYPE_LIGHTING2_AC,
     DEVICE_PACKET_TYPE_BLINDS1,
     DEVICE_PACKET_TYPE_LIGHTING2,
     DEVICE_PACKET_TYPE_RFY,
 )
+from .platforms import PLATFORM_SUPPORTED
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -67,6 +94,7 @@ def update_device_options(device: dict[str, Any], user_input: dict[str, Any]) ->
     device[CONF_SYNC_SECONDS] = user_input.get(CONF_SYNC_SECONDS, DEF_SYNC_SECONDS)
     device[CONF_TILT_POS1_MS] = user_input.get(CONF_TILT_POS1_MS, DEF_TILT_POS1_MS)
     device[CONF_TILT_POS2_MS] = user_input.get(CONF_TILT_POS2_MS, DEF_TILT_POS2_MS)
+    device[CONF_TILT_PRESS_MS] = user_input.get(CONF_TILT_PRESS_MS, DEF_TILT_PRESS_MS)
     device[CONF_CUSTOM_ICON] = user_input.get(CONF_CUSTOM_ICON, DEF_CUSTOM_ICON)
     device[CONF_COLOUR_ICON] = user_input.get(CONF_COLOUR_ICON, DEF_COLOUR_ICON)
     device[CONF_PARTIAL_CLOSED] = user_input.get(
@@ -90,6 +118,38 @@ def update_device_options(device: dict[str, Any], user_input: dict[str, Any]) ->
     device[CONF_TILT_LIFTED_ICON] = user_input.get(
         CONF_TILT_LIFTED_ICON, DEF_TILT_LIFTED_ICON
     )
+    device[CONF_WAIT_FOR_MOVE] = user_input.get(CONF_WAIT_FOR_MOVE, DEF_WAIT_FOR_MOVE)
+    device[CONF_GROUP_MEMBERS] = user_input.get(CONF_GROUP_MEMBERS, DEF_GROUP_MEMBERS)
+    device[CONF_RESYNC_COMMANDS] = user_input.get(
+        CONF_RESYNC_COMMANDS, DEF_RESYNC_COMMANDS
+    )
+    device[CONF_RESYNC_HOURS] = user_input.get(CONF_RESYNC_HOURS, DEF_RESYNC_HOURS)
+    device[CONF_SENSOR_DEADBAND] = user_input.get(
+        CONF_SENSOR_DEADBAND, DEF_SENSOR_DEADBAND
+    )
+    device[CONF_SENSOR_MIN_INTERVAL] = user_input.get(
+        CONF_SENSOR_MIN_INTERVAL, DEF_SENSOR_MIN_INTERVAL
+    )
+    device[CONF_SENSOR_HEARTBEAT] = user_input.get(
+        CONF_SENSOR_HEARTBEAT, DEF_SENSOR_HEARTBEAT
+    )
+    device[CONF_SENSOR_AGGREGATE] = user_input.get(
+        CONF_SENSOR_AGGREGATE, DEF_SENSOR_AGGREGATE
+    )
+    device[CONF_SENSOR_WINDOW] = user_input.get(CONF_SENSOR_WINDOW, DEF_SENSOR_WINDOW)
+    device[CONF_EVENT_BURST_MS] = user_input.get(
+        CONF_EVENT_BURST_MS, DEF_EVENT_BURST_MS
+    )
+    device[CONF_EVENT_LONG_PRESS_MS] = user_input.get(
+        CONF_EVENT_LONG_PRESS_MS, DEF_EVENT_LONG_PRESS_MS
+    )
+
+
+def _has_event_entity(event: rfxtrxmod.RFXtrxEvent) -> bool:
+    """Return whether the event platform makes an entity for a device."""
+    return PLATFORM_SUPPORTED[Platform.EVENT](event) and (
+        hasattr(event.device, "COMMANDS") or hasattr(event.device, "STATUS")
+    )
 
 
 def update_data_schema(data_schema: VolDictType, device_object, device_data) -> None:
@@ -135,6 +195,10 @@ def update_data_schema(data_schema: VolDictType, device_object, device_data) ->
                     CONF_TILT_POS2_MS,
                     default=device_data.get(CONF_TILT_POS2_MS, DEF_TILT_POS2_MS),
                 ): int,
+                vol.Optional(
+                    CONF_TILT_PRESS_MS,
+                    default=device_data.get(CONF_TILT_PRESS_MS, DEF_TILT_PRESS_MS),
+                ): int,
                 vol.Optional(
                     CONF_CUSTOM_ICON,
                     default=device_data.get(CONF_CUSTOM_ICON, DEF_CUSTOM_ICON),
@@ -169,6 +233,24 @@ def update_data_schema(data_schema: VolDictType, device_object, device_data) ->
                         CONF_ROLLER_MID_ON_CLOSE, DEF_ROLLER_MID_ON_CLOSE
                     ),
                 ): bool,
+                vol.Optional(
+                    CONF_WAIT_FOR_MOVE,
+                    default=device_data.get(CONF_WAIT_FOR_MOVE, DEF_WAIT_FOR_MOVE),
+                ): bool,
+                vol.Optional(
+                    CONF_GROUP_MEMBERS,
+                    default=device_data.get(CONF_GROUP_MEMBERS, DEF_GROUP_MEMBERS),
+                ): str,
+                vol.Optional(
+                    CONF_RESYNC_COMMANDS,
+                    default=device_data.get(
+                        CONF_RESYNC_COMMANDS, DEF_RESYNC_COMMANDS
+                    ),
+                ): int,
+                vol.Optional(
+                    CONF_RESYNC_HOURS,
+                    default=device_data.get(CONF_RESYNC_HOURS, DEF_RESYNC_HOURS),
+                ): int,
             }
         )
     elif (
@@ -244,5 +326,69 @@ def update_data_schema(data_schema: VolDictType, device_object, device_data) ->
                     CONF_PARTIAL_CLOSED,
                     default=device_data.get(CONF_PARTIAL_CLOSED, DEF_PARTIAL_CLOSED),
                 ): bool,
+                vol.Optional(
+                    CONF_WAIT_FOR_MOVE,
+                    default=device_data.get(CONF_WAIT_FOR_MOVE, DEF_WAIT_FOR_MOVE),
+                ): bool,
+                vol.Optional(
+                    CONF_RESYNC_COMMANDS,
+                    default=device_data.get(
+                        CONF_RESYNC_COMMANDS, DEF_RESYNC_COMMANDS
+                    ),
+                ): int,
+                vol.Optional(
+                    CONF_RESYNC_HOURS,
+                    default=device_data.get(CONF_RESYNC_HOURS, DEF_RESYNC_HOURS),
+                ): int,
+            }
+        )
+
+    if isinstance(device_object, rfxtrxmod.SensorEvent):
+        # Add sensor update throttling and aggregation options
+        data_schema.update(
+            {
+                vol.Optional(
+                    CONF_SENSOR_DEADBAND,
+                    default=device_data.get(CONF_SENSOR_DEADBAND, DEF_SENSOR_DEADBAND),
+                ): str,
+                vol.Optional(
+                    CONF_SENSOR_MIN_INTERVAL,
+                    default=device_data.get(
+                        CONF_SENSOR_MIN_INTERVAL, DEF_SENSOR_MIN_INTERVAL
+                    ),
+                ): int,
+                vol.Optional(
+                    CONF_SENSOR_HEARTBEAT,
+                    default=device_data.get(
+                        CONF_SENSOR_HEARTBEAT, DEF_SENSOR_HEARTBEAT
+                    ),
+                ): int,
+                vol.Optional(
+                    CONF_SENSOR_AGGREGATE,
+                    default=device_data.get(
+                        CONF_SENSOR_AGGREGATE, DEF_SENSOR_AGGREGATE
+                    ),
+                ): str,
+                vol.Optional(
+                    CONF_SENSOR_WINDOW,
+                    default=device_data.get(CONF_SENSOR_WINDOW, DEF_SENSOR_WINDOW),
+                ): int,
+            }
+        )
+
+    if _has_event_entity(device_object):
+        # Add event burst options
+        data_schema.update(
+            {
+                vol.Optional(
+                    CONF_EVENT_BURST_MS,
+                    default=device_data.get(CONF_EVENT_BURST_MS, DEF_EVENT_BURST_MS),
+                ): int,
+                vol.Optional(
+                    CONF_EVENT_LONG_PRESS_MS,
+                    default=device_data.get(
+                        CONF_EVENT_LONG_PRESS_MS, DEF_EVENT_LONG_PRESS_MS
+                    ),
+                ): int,
             }
         )
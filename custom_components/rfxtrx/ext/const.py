@@ -10,6 +10,17 @@ CONF_PARTIAL_CLOSED = "partial_closed"
 CONF_SIGNAL_REPETITIONS_DELAY_MS = "signal_repetition_delay"
 CONF_SIGNAL_REPETITIONS = "signal_repetitions"
 CONF_ROLLER_MID_ON_CLOSE = "roller_mid_on_close"
+CONF_WAIT_FOR_MOVE = "wait_for_movement"
+CONF_GROUP_MEMBERS = "group_members"
+CONF_RESYNC_COMMANDS = "resync_commands"
+CONF_RESYNC_HOURS = "resync_hours"
+CONF_SENSOR_DEADBAND = "sensor_deadband"
+CONF_SENSOR_MIN_INTERVAL = "sensor_min_interval"
+CONF_SENSOR_HEARTBEAT = "sensor_heartbeat"
+CONF_SENSOR_AGGREGATE = "sensor_aggregate"
+CONF_SENSOR_WINDOW = "sensor_window"
+CONF_EVENT_BURST_MS = "event_burst_ms"
+CONF_EVENT_LONG_PRESS_MS = "event_long_press_ms"
 
 CONF_SUPPORTS_MID = "midpoint_supported"
 CONF_STEPS_MID = "midpoint_steps"
@@ -21,6 +32,7 @@ CONF_TILT_LIFTED_ICON = "tilt_lifted_icon"
 
 CONF_TILT_POS1_MS = "tilt1_ms"
 CONF_TILT_POS2_MS = "tilt2_ms"
+CONF_TILT_PRESS_MS = "tilt_press_ms"
 
 DEF_STATE_SUPPORT = True
 DEF_CLOSE_SECONDS = 16
@@ -35,9 +47,21 @@ DEF_PARTIAL_CLOSED = True
 DEF_SIGNAL_REPETITIONS_DELAY_MS = 250
 DEF_SIGNAL_REPETITIONS = 1
 DEF_ROLLER_MID_ON_CLOSE = True
+DEF_WAIT_FOR_MOVE = False
+DEF_GROUP_MEMBERS = ""
+DEF_RESYNC_COMMANDS = 5
+DEF_RESYNC_HOURS = 0
+DEF_SENSOR_DEADBAND = ""
+DEF_SENSOR_MIN_INTERVAL = 0
+DEF_SENSOR_HEARTBEAT = 0
+DEF_SENSOR_AGGREGATE = ""
+DEF_SENSOR_WINDOW = 300
+DEF_EVENT_BURST_MS = 500
+DEF_EVENT_LONG_PRESS_MS = 0
 
 DEF_TILT_POS1_MS = 1750
 DEF_TILT_POS2_MS = 1750
+DEF_TILT_PRESS_MS = 0
 
 DEF_TILT_OPEN_ICON = ""
 DEF_TILT_CLOSED_ICON = ""
@@ -55,6 +79,23 @@ SVC_UPDATE_POSITION = "update_cover_position"
 SVC_INCREASE_TILT = "increase_cover_tilt"
 SVC_DECREASE_TILT = "decrease_cover_tilt"
 SVC_SET_MOVEMENT_ALLOWED = "set_movement_allowed"
+SVC_MOVE_COVERS = "move_covers"
+
+DATA_FRAME_TIMER = "frame_timer"
+DATA_GROUP_INDEX = "group_index"
+DATA_TRACE = "trace"
+DATA_OFF_DELAY = "off_delay"
+DATA_DEVICE_TABLE = "device_table"
+DATA_AUTO_ADD = "auto_add"
+DATA_PLATFORMS = "platforms"
+DATA_GATEWAY = "gateway"
 
 ATTR_AUTO_REPEAT = "repeat_automatically"
 ATTR_MOVEMENT_ALLOWED = "allowed"
+ATTR_WAIT = "wait"
+ATTR_COVERS = "covers"
+ATTR_PRESS = "press"
+
+PRESS = "press"
+PRESS_LONG = "long_press"
+PRESS_RELEASE = "release"
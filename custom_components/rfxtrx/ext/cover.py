@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+import importlib
 import logging
 
 import voluptuous as vol
@@ -12,16 +14,24 @@ from homeassistant.components.cover import (
     CoverEntity,
     CoverEntityFeature,
 )
-from homeassistant.const import ATTR_STATE
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import ATTR_STATE, Platform
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity_platform
 
 from ..const import (
+    CONF_AUTOMATIC_ADD,
     CONF_VENETIAN_BLIND_MODE,
     CONST_VENETIAN_BLIND_MODE_EU,
     CONST_VENETIAN_BLIND_MODE_US,
+    DOMAIN,
 )
 from .const import (
     CONF_STATE_SUPPORT,
+    DATA_DEVICE_TABLE,
+    DATA_FRAME_TIMER,
+    DATA_GROUP_INDEX,
+    DATA_TRACE,
     DEF_STATE_SUPPORT,
     DEVICE_PACKET_SUBTYPE_BLINDST19,
     DEVICE_PACKET_SUBTYPE_LIGHTING2_AC,
@@ -30,13 +40,49 @@ from .const import (
     DEVICE_PACKET_TYPE_RFY,
     SVC_UPDATE_POSITION,
 )
-from .louvolite_vogue_blind import LouvoliteVogueBlind
-from .somfy_roller_blind import SomfyRollerBlind
-from .somfy_venetian_blind import SomfyVenetianBlind
-from .timed_shutter_cover import TimedShutterCover
+from .frame_timer import FrameTimer
+from .group import CoverGroupIndex
+from .trace import TraceBuffer
 
 _LOGGER = logging.getLogger(__name__)
 
+# The modules of the cover classes by packet type. They are only imported
+# once a device of the packet type is set up.
+COVER_MODULES: dict[int, tuple[str, ...]] = {
+    DEVICE_PACKET_TYPE_BLINDS1: ("louvolite_vogue_blind",),
+    DEVICE_PACKET_TYPE_LIGHTING2: ("timed_shutter_cover",),
+    DEVICE_PACKET_TYPE_RFY: ("somfy_roller_blind", "somfy_venetian_blind"),
+}
+
+
+def _cover_class(module: str, name: str) -> type[CoverEntity]:
+    """Return a cover class, importing its module if needed."""
+    return getattr(importlib.import_module(f".{module}", __package__), name)
+
+
+def load_cover_modules(packet_types: Iterable[int]) -> None:
+    """Import the modules of the cover classes for the packet types."""
+    for packet_type in packet_types:
+        for module in COVER_MODULES.get(packet_type, ()):
+            importlib.import_module(f".{module}", __package__)
+
+
+async def async_load_cover_modules(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> None:
+    """Import the cover classes the devices may need, off the event loop."""
+    if config_entry.data[CONF_AUTOMATIC_ADD]:
+        # Any kind of cover may turn up
+        packet_types: Iterable[int] = COVER_MODULES
+    else:
+        packet_types = {
+            int(device.device_id.packettype, 16)
+            for device in hass.data[DOMAIN][DATA_DEVICE_TABLE].for_platform(
+                Platform.COVER
+            )
+        }
+    await hass.async_add_executor_job(load_cover_modules, packet_types)
+
 
 def create_cover_entity(
     device, device_id, entity_info, event=None
@@ -56,7 +102,7 @@ def create_cover_entity(
             _LOGGER.info(
                 "Detected a Louvolite Vogue vertical blind - let's go stateful!"
             )
-            return LouvoliteVogueBlind(
+            return _cover_class("louvolite_vogue_blind", "LouvoliteVogueBlind")(
                 device=device, device_id=device_id, entity_info=entity_info, event=event
             )
         if int(device_id[0], 16) == DEVICE_PACKET_TYPE_RFY:
@@ -66,14 +112,14 @@ def create_cover_entity(
                 CONST_VENETIAN_BLIND_MODE_EU,
             ):
                 _LOGGER.info("Detected a Somfy RFY venetian blind - let's go stateful!")
-                return SomfyVenetianBlind(
+                return _cover_class("somfy_venetian_blind", "SomfyVenetianBlind")(
                     device=device,
                     device_id=device_id,
                     entity_info=entity_info,
                     event=event,
                 )
             _LOGGER.info("Detected a Somfy RFY roller blind - let's go stateful!")
-            return SomfyRollerBlind(
+            return _cover_class("somfy_roller_blind", "SomfyRollerBlind")(
                 device=device,
                 device_id=device_id,
                 entity_info=entity_info,
@@ -84,12 +130,40 @@ def create_cover_entity(
             and int(device_id[1], 16) == DEVICE_PACKET_SUBTYPE_LIGHTING2_AC
         ):
             _LOGGER.info("Detected a Lighting2 AC blinds - let's go stateful!")
-            return TimedShutterCover(
+            return _cover_class("timed_shutter_cover", "TimedShutterCover")(
                 device=device, device_id=device_id, entity_info=entity_info, event=event
             )
     return None
 
 
+async def async_setup_frame_timer(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> None:
+    """Start the thread used to time pulses for the covers."""
+    timer = FrameTimer()
+    timer.start()
+    hass.data[DOMAIN][DATA_FRAME_TIMER] = timer
+
+    async def _async_stop_timer() -> None:
+        await hass.async_add_executor_job(timer.stop)
+
+    config_entry.async_on_unload(_async_stop_timer)
+
+
+@callback
+def async_setup_trace(hass: HomeAssistant) -> None:
+    """Start the trace of cover motion and frames."""
+    hass.data[DOMAIN][DATA_TRACE] = TraceBuffer()
+
+
+@callback
+def async_setup_group_index(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Start the index used to fan group frames out to the covers."""
+    index = CoverGroupIndex()
+    index.async_setup(hass, config_entry)
+    hass.data[DOMAIN][DATA_GROUP_INDEX] = index
+
+
 async def async_define_sync_services() -> None:
     """Define sync services for covers."""
     platform = entity_platform.current_platform.get()
@@ -0,0 +1,108 @@
+"""Device object cache for RFXtrx device automations."""
+
+from __future__ import annotations
+
+import logging
+
+from RFXtrx import RFXtrxDevice, get_device
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+
+from ..const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Kept outside the data of the config entry, as automations outlive reloads
+DATA_DEVICE_CACHE = f"{DOMAIN}_device_cache"
+
+
+class DeviceObjectCache:
+    """RFXtrx device objects by device registry id.
+
+    Validating and attaching device triggers and actions each need the
+    device object, and with many device automations the same device is
+    looked up over and over at startup. The objects, which also carry
+    the command and status tables, are made once per registry id and
+    dropped whenever the registry entry changes. The registry is only
+    followed while the config entry is loaded, and nothing is cached
+    while it is not.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._devices: dict[str, RFXtrxDevice] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_setup(self, config_entry: ConfigEntry) -> None:
+        """Cache device objects while a config entry is loaded."""
+        self._unsub = self._hass.bus.async_listen(
+            dr.EVENT_DEVICE_REGISTRY_UPDATED, self._async_invalidate
+        )
+        config_entry.async_on_unload(self._async_unload)
+        self.async_prewarm(config_entry)
+
+    @callback
+    def _async_unload(self) -> None:
+        """Stop following the registry and drop the cached device objects."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        self._devices.clear()
+
+    @callback
+    def async_get(self, device_id: str) -> RFXtrxDevice:
+        """Return the device object for a device registry id."""
+        if self._unsub is None:
+            return self._async_load(device_id)
+        if (device := self._devices.get(device_id)) is None:
+            device = self._devices[device_id] = self._async_load(device_id)
+        return device
+
+    @callback
+    def async_prewarm(self, config_entry: ConfigEntry) -> None:
+        """Load the device objects of every device of a config entry."""
+        registry = dr.async_get(self._hass)
+        for registry_device in dr.async_entries_for_config_entry(
+            registry, config_entry.entry_id
+        ):
+            try:
+                self.async_get(registry_device.id)
+            except ValueError:
+                _LOGGER.debug("No device object for %s", registry_device.id)
+
+    @callback
+    def _async_load(self, device_id: str) -> RFXtrxDevice:
+        """Make the device object for a device registry id."""
+        # Imported here as the package imports this module while loading
+        from .. import get_device_tuple_from_identifiers
+
+        registry_device = dr.async_get(self._hass).async_get(device_id)
+        if registry_device is None:
+            raise ValueError(f"Device {device_id} not found")
+
+        device_tuple = get_device_tuple_from_identifiers(registry_device.identifiers)
+        if device_tuple is None:
+            raise ValueError(f"Device {device_id} is not an RFXtrx device")
+
+        return get_device(
+            int(device_tuple[0], 16), int(device_tuple[1], 16), device_tuple[2]
+        )
+
+    @callback
+    def _async_invalidate(
+        self, event: Event[dr.EventDeviceRegistryUpdatedData]
+    ) -> None:
+        """Drop the device object of a device whose registry entry changed."""
+        self._devices.pop(event.data["device_id"], None)
+
+
+@callback
+def async_get_device_cache(hass: HomeAssistant) -> DeviceObjectCache:
+    """Return the device object cache, creating it if needed."""
+    if (cache := hass.data.get(DATA_DEVICE_CACHE)) is None:
+        cache = hass.data[DATA_DEVICE_CACHE] = DeviceObjectCache(hass)
+    return cache
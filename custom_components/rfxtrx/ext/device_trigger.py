@@ -0,0 +1,110 @@
+"""Device trigger index for RFXtrx."""
+
+from __future__ import annotations
+
+from collections import Counter
+import logging
+from typing import Any
+
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
+from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
+
+from ..const import DOMAIN, EVENT_RFXTRX_EVENT
+
+_LOGGER = logging.getLogger(__name__)
+
+# Kept outside the data of the config entry, as triggers outlive reloads
+DATA_TRIGGER_INDEX = f"{DOMAIN}_trigger_index"
+
+type TriggerKey = tuple[str, str, str]
+
+
+class DeviceTriggerIndex:
+    """Index of the device triggers by device, type and subtype.
+
+    Attached as plain event triggers, every RFXtrx event would be matched
+    against the event data of every RFXtrx device trigger. Instead one
+    listener looks up the triggers for the device and value of each
+    event, and only runs those.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self._hass = hass
+        self._triggers: dict[TriggerKey, list[tuple[HassJob, dict[str, Any]]]] = {}
+        self._value_keys: Counter[str] = Counter()
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_attach(
+        self,
+        device_id: str,
+        value_key: str,
+        subtype: str,
+        action: TriggerActionType,
+        trigger_info: TriggerInfo,
+    ) -> CALLBACK_TYPE:
+        """Attach a trigger for a value of a device."""
+        key = (device_id, value_key, subtype)
+        entry = (
+            HassJob(action, f"rfxtrx device trigger {trigger_info}"),
+            trigger_info["trigger_data"],
+        )
+        self._triggers.setdefault(key, []).append(entry)
+        self._value_keys[value_key] += 1
+        if self._unsub is None:
+            self._unsub = self._hass.bus.async_listen(
+                EVENT_RFXTRX_EVENT, self._async_handle_event
+            )
+
+        @callback
+        def _async_detach() -> None:
+            entries = self._triggers[key]
+            entries.remove(entry)
+            if not entries:
+                del self._triggers[key]
+            self._value_keys[value_key] -= 1
+            if not self._value_keys[value_key]:
+                del self._value_keys[value_key]
+            if not self._triggers and self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+
+        return _async_detach
+
+    @callback
+    def _async_handle_event(self, event: Event) -> None:
+        """Run the triggers that match an event."""
+        if (device_id := event.data.get(ATTR_DEVICE_ID)) is None:
+            return
+        if not (values := event.data.get("values")):
+            return
+
+        for value_key in self._value_keys:
+            if (subtype := values.get(value_key)) is None:
+                continue
+            for job, trigger_data in self._triggers.get(
+                (device_id, value_key, subtype), ()
+            ):
+                self._hass.loop.call_soon(
+                    self._hass.async_run_hass_job,
+                    job,
+                    {
+                        "trigger": {
+                            **trigger_data,
+                            "platform": "device",
+                            "event": event,
+                            "description": f"event '{event.event_type}'",
+                        }
+                    },
+                    event.context,
+                )
+
+
+@callback
+def async_get_trigger_index(hass: HomeAssistant) -> DeviceTriggerIndex:
+    """Return the index of the device triggers, creating it if needed."""
+    if (index := hass.data.get(DATA_TRIGGER_INDEX)) is None:
+        index = hass.data[DATA_TRIGGER_INDEX] = DeviceTriggerIndex(hass)
+    return index
@@ -0,0 +1,30 @@
+"""Diagnostics for RFXtrx stateful blinds."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_platform
+
+from ..const import DOMAIN
+from .const import DATA_FRAME_TIMER, DATA_TRACE
+
+
+def async_get_timing_diagnostics(hass: HomeAssistant) -> dict[str, Any]:
+    """Return the frame timing statistics of the timer and each cover."""
+    timer = hass.data.get(DOMAIN, {}).get(DATA_FRAME_TIMER)
+    trace = hass.data.get(DOMAIN, {}).get(DATA_TRACE)
+    covers: dict[str, Any] = {}
+    for platform in entity_platform.async_get_platforms(hass, DOMAIN):
+        for entity in platform.entities.values():
+            if (diagnostics := getattr(entity, "timing_diagnostics", None)) is not None:
+                covers[entity.entity_id] = diagnostics()
+            if (writes := getattr(entity, "write_diagnostics", None)) is not None:
+                covers.setdefault(entity.entity_id, {}).update(writes())
+
+    return {
+        "frame_timer": timer.diagnostics() if timer is not None else None,
+        "covers": covers,
+        "trace": trace.as_list() if trace is not None else None,
+    }
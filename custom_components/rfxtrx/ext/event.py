@@ -0,0 +1,94 @@
+"""Burst collapsing for RFXtrx event entities."""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+from homeassistant.components.event import EventEntity
+from homeassistant.core import callback
+from homeassistant.helpers.entity import Entity
+
+from .const import (
+    ATTR_PRESS,
+    CONF_EVENT_BURST_MS,
+    CONF_EVENT_LONG_PRESS_MS,
+    DEF_EVENT_BURST_MS,
+    DEF_EVENT_LONG_PRESS_MS,
+    PRESS,
+    PRESS_LONG,
+    PRESS_RELEASE,
+)
+from .off_delay import async_get_off_delay
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BurstMixin(Entity):
+    """Mixin to turn a burst of repeated frames into a single press.
+
+    Holding a remote button sends the same frame over and over. Frames
+    with the same command that follow each other within the burst gap
+    are treated as one press. If long presses are enabled, a burst that
+    lasts for the long press time also gives a long press, and a release
+    once the frames stop.
+    """
+
+    def _init_burst(self, entity_info: dict[str, Any]) -> None:
+        """Initialize the burst state from the device options."""
+        self._myattr_burst_secs = (
+            entity_info.get(CONF_EVENT_BURST_MS, DEF_EVENT_BURST_MS) / 1000
+        )
+        self._myattr_long_press_secs = (
+            entity_info.get(CONF_EVENT_LONG_PRESS_MS, DEF_EVENT_LONG_PRESS_MS) / 1000
+        )
+        self._myattr_burst_type: str | None = None
+        self._myattr_burst_start = 0.0
+        self._myattr_burst_last = 0.0
+        self._myattr_long_pressed = False
+
+    def _burst_press(self, event_type: str) -> str | None:
+        """Return the press to fire for a frame, or None if it is a repeat."""
+        if not self._myattr_burst_secs:
+            return PRESS
+        now = time.monotonic()
+        repeat = (
+            event_type == self._myattr_burst_type
+            and now - self._myattr_burst_last < self._myattr_burst_secs
+        )
+        self._myattr_burst_last = now
+        if self._myattr_long_press_secs:
+            async_get_off_delay(self.hass).async_schedule(
+                self, self._myattr_burst_secs, self._async_burst_ended
+            )
+
+        if not repeat:
+            self._myattr_burst_type = event_type
+            self._myattr_burst_start = now
+            self._myattr_long_pressed = False
+            return PRESS
+        if (
+            self._myattr_long_press_secs
+            and not self._myattr_long_pressed
+            and now - self._myattr_burst_start >= self._myattr_long_press_secs
+        ):
+            self._myattr_long_pressed = True
+            return PRESS_LONG
+        return None
+
+    @callback
+    def _async_burst_ended(self) -> None:
+        """Fire a release if the burst that has just ended was a long press."""
+        assert isinstance(self, EventEntity)
+        if self._myattr_long_pressed and self._myattr_burst_type is not None:
+            _LOGGER.debug("Release of %s", self._myattr_burst_type)
+            self._trigger_event(self._myattr_burst_type, {ATTR_PRESS: PRESS_RELEASE})
+            self.async_write_ha_state()
+        self._myattr_burst_type = None
+        self._myattr_long_pressed = False
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop any release still waiting to happen."""
+        async_get_off_delay(self.hass).async_cancel(self)
+        return await super().async_will_remove_from_hass()
@@ -0,0 +1,316 @@
+"""Precise frame timing for RFXtrx stateful covers."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from concurrent.futures import CancelledError, Future
+from dataclasses import dataclass
+from functools import partial
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# Sleep until this close to a deadline and then spin for the rest
+SPIN_SECS = 0.002
+
+# Time the transceiver is kept busy by each frame, so frames must be at
+# least this far apart to be sent on time
+FRAME_SECS = 0.1
+
+# A stop frame sent later than this after its deadline missed it
+DEADLINE_TOLERANCE_SECS = 0.01
+
+type Slot = tuple[float, float]
+
+
+@dataclass(slots=True)
+class PulseTiming:
+    """Transmit timestamps of a start/stop frame pair."""
+
+    requested: float
+    started: float
+    stopped: float
+
+    @property
+    def width(self) -> float:
+        """Return the time between the two frames being transmitted."""
+        return self.stopped - self.started
+
+    @property
+    def error(self) -> float:
+        """Return how much longer the pulse was than requested."""
+        return self.width - self.requested
+
+
+@dataclass(slots=True)
+class Pulse:
+    """A start/stop frame pair queued on the timer."""
+
+    started: Future[float]
+    stopped: Future[PulseTiming]
+    cancelled: bool = False
+    release: Callable[[], None] | None = None
+
+    def cancel(self) -> None:
+        """Drop whichever frames have not been sent yet and free their slots."""
+        self.cancelled = True
+        if self.release is not None:
+            self.release()
+            self.release = None
+
+
+@dataclass(slots=True)
+class PulseStats:
+    """Summary of the pulse width errors seen by a cover."""
+
+    count: int = 0
+    last: PulseTiming | None = None
+    max_error: float = 0
+    total_error: float = 0
+    missed: int = 0
+
+    def add(self, timing: PulseTiming) -> bool:
+        """Add a pulse to the summary, returning whether it missed its deadline."""
+        self.count += 1
+        self.last = timing
+        self.total_error += abs(timing.error)
+        self.max_error = max(self.max_error, abs(timing.error))
+        if timing.error <= DEADLINE_TOLERANCE_SECS:
+            return False
+        self.missed += 1
+        return True
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the summary for diagnostics, in milliseconds."""
+        return {
+            "pulses": self.count,
+            "last_requested_ms": (
+                round(self.last.requested * 1000, 1) if self.last else None
+            ),
+            "last_width_ms": round(self.last.width * 1000, 1) if self.last else None,
+            "mean_abs_error_ms": (
+                round(self.total_error / self.count * 1000, 2) if self.count else None
+            ),
+            "max_abs_error_ms": round(self.max_error * 1000, 2),
+            "missed_deadlines": self.missed,
+        }
+
+
+class FrameTimer:
+    """Send frames at precise times from a dedicated thread.
+
+    Waiting for a frame on the event loop is at the mercy of whatever
+    else the loop is doing, so a pulse timed with asyncio.sleep gets
+    stretched whenever the loop is busy. This thread only sends frames,
+    sleeping until just before each deadline and spinning for the last
+    couple of milliseconds. A stop frame is chained to its start frame
+    on the thread, so the width of a pulse does not depend on the loop
+    at all. Timestamps use time.monotonic and are taken once each frame
+    has been handed to the transceiver.
+
+    Frames are sent earliest deadline first, but two frames due at the
+    same moment cannot both go out on time. So each frame reserves the
+    slot in which the transceiver will be sending it, and a pulse is
+    given the earliest start for which neither its start nor its stop
+    frame overlaps a slot already reserved. Starts are staggered ahead
+    of time instead of stops overrunning when several covers move at
+    once.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the timer."""
+        self._queue: list[tuple[float, int, Callable[[], bool]]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._running = False
+        self._slots: list[Slot] = []
+        self.frames_sent = 0
+        self.max_late = 0.0
+
+    def start(self) -> None:
+        """Start the timer thread."""
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run, name="rfxtrx_frame_timer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the timer thread once the frames already due have been sent."""
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def send_at(self, deadline: float, fun: Callable[[], None]) -> Future[float]:
+        """Send a frame at a monotonic deadline, returning when it was sent."""
+        self._reserve_at(deadline, (0,))
+        return self._send_at(deadline, fun)
+
+    def send(self, fun: Callable[[], None]) -> Future[float]:
+        """Send a frame in the first free slot, returning when it was sent."""
+        deadline, _ = self._reserve((0,))
+        return self._send_at(deadline, fun)
+
+    def pulse(
+        self,
+        start: Callable[[], None],
+        stop: Callable[[], None],
+        secs: float,
+        stagger: bool = True,
+    ) -> Pulse:
+        """Send a start frame and then a stop frame secs after it was sent.
+
+        Without stagger the start is sent straight away, as when the start
+        has already been sent by a remote, and only the stop is reserved.
+        """
+        if stagger:
+            deadline, slots = self._reserve((0, secs))
+        else:
+            deadline = time.monotonic()
+            slots = self._reserve_at(deadline, (secs,))
+        pulse = Pulse(Future(), Future(), release=partial(self._release, slots))
+        pulse.started.set_running_or_notify_cancel()
+        pulse.stopped.set_running_or_notify_cancel()
+
+        def _start() -> None:
+            if pulse.cancelled:
+                raise CancelledError
+            start()
+
+        def _stop() -> None:
+            if pulse.cancelled:
+                raise CancelledError
+            stop()
+
+        def _stopped(sent: float) -> None:
+            pulse.stopped.set_result(PulseTiming(secs, pulse.started.result(), sent))
+
+        def _started(sent: float) -> None:
+            pulse.started.set_result(sent)
+            # Always queue the stop, even when shutting down, so that the
+            # motor is not left running
+            self._push(sent + secs, self._action(_stop, _stopped, pulse.stopped))
+
+        self._schedule(deadline, _start, _started, pulse.started)
+        return pulse
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return the timer statistics for diagnostics."""
+        return {
+            "frames_sent": self.frames_sent,
+            "max_late_ms": round(self.max_late * 1000, 2),
+        }
+
+    def _send_at(self, deadline: float, fun: Callable[[], None]) -> Future[float]:
+        """Queue a frame whose slot has already been reserved."""
+        future: Future[float] = Future()
+        future.set_running_or_notify_cancel()
+        self._schedule(deadline, fun, future.set_result, future)
+        return future
+
+    def _reserve(self, offsets: tuple[float, ...]) -> tuple[float, list[Slot]]:
+        """Reserve slots at offsets from the earliest start they all fit."""
+        start = time.monotonic()
+        with self._condition:
+            self._slots = [slot for slot in self._slots if slot[1] > start]
+            while True:
+                clash = next(
+                    (
+                        slot_end - offset
+                        for offset in offsets
+                        for slot_start, slot_end in self._slots
+                        if slot_start < start + offset + FRAME_SECS
+                        and start + offset < slot_end
+                    ),
+                    None,
+                )
+                if clash is None:
+                    break
+                start = clash
+            slots = self._reserve_at(start, offsets)
+        return start, slots
+
+    def _reserve_at(self, start: float, offsets: tuple[float, ...]) -> list[Slot]:
+        """Reserve slots at offsets from start whether or not they are free."""
+        slots = [(start + offset, start + offset + FRAME_SECS) for offset in offsets]
+        with self._condition:
+            self._slots.extend(slots)
+        return slots
+
+    def _release(self, slots: list[Slot]) -> None:
+        """Free the slots of frames that will no longer be sent."""
+        now = time.monotonic()
+        with self._condition:
+            for slot in slots:
+                # A frame already being sent keeps the transceiver busy
+                if slot[0] > now and slot in self._slots:
+                    self._slots.remove(slot)
+
+    def _schedule(
+        self,
+        deadline: float,
+        fun: Callable[[], None],
+        done: Callable[[float], None],
+        future: Future[Any],
+    ) -> None:
+        if not self._running:
+            future.set_exception(RuntimeError("Frame timer is not running"))
+            return
+        self._push(deadline, self._action(fun, done, future))
+
+    @staticmethod
+    def _action(
+        fun: Callable[[], None], done: Callable[[float], None], future: Future[Any]
+    ) -> Callable[[], bool]:
+        def _send() -> bool:
+            try:
+                fun()
+            except Exception as exc:
+                future.set_exception(exc)
+                return False
+            done(time.monotonic())
+            return True
+
+        return _send
+
+    def _push(self, deadline: float, action: Callable[[], bool]) -> None:
+        with self._condition:
+            heapq.heappush(self._queue, (deadline, next(self._counter), action))
+            self._condition.notify()
+
+    def _run(self) -> None:
+        """Send frames as they fall due."""
+        while True:
+            with self._condition:
+                while True:
+                    if not self._queue:
+                        if not self._running:
+                            return
+                        self._condition.wait()
+                        continue
+                    remaining = self._queue[0][0] - time.monotonic()
+                    if remaining <= SPIN_SECS:
+                        break
+                    self._condition.wait(remaining - SPIN_SECS)
+                deadline, _, action = heapq.heappop(self._queue)
+
+            while time.monotonic() < deadline:
+                pass
+
+            self.max_late = max(self.max_late, time.monotonic() - deadline)
+            try:
+                sent = action()
+            except Exception:
+                _LOGGER.exception("Error in frame timer")
+                continue
+            if sent:
+                self.frames_sent += 1
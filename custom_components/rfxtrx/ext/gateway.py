@@ -0,0 +1,159 @@
+"""Background gateway connection for RFXtrx."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import logging
+import threading
+
+import RFXtrx as rfxtrxmod
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_platform
+
+from ..const import DATA_RFXOBJECT, DOMAIN
+from .const import DATA_GATEWAY
+
+_LOGGER = logging.getLogger(__name__)
+
+# Wait before the first retry, doubling up to the maximum
+CONNECT_RETRY_SECS = 10
+CONNECT_RETRY_MAX_SECS = 300
+
+
+def lock_transport[_T: rfxtrxmod.RFXtrxTransport](transport: _T) -> _T:
+    """Make the frames written to a transport go out one at a time.
+
+    Frames are written from the frame timer thread, from executor jobs
+    for the entities and device actions, from the send service and by
+    the connection itself. Two threads writing at once can interleave
+    the bytes of their frames, so every write takes the same lock.
+    """
+    lock = threading.Lock()
+    send = transport.send
+
+    def _send(data: bytes | bytearray) -> None:
+        with lock:
+            send(data)
+
+    transport.send = _send  # type: ignore[method-assign]
+    return transport
+
+
+class GatewayConnection:
+    """Connect to the RFXtrx gateway without holding up setup.
+
+    Connecting waits for the gateway to answer, and a slow or rebooting
+    ser2net host used to stall startup or fail the entry and retry its
+    whole setup. Instead the entities are set up at once from the device
+    table, restored but unavailable, while the connection is made here in
+    the background, retrying as needed. The entities become available
+    once the gateway is connected.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        create_rfx: Callable[[], rfxtrxmod.Connect],
+        rfx_object: rfxtrxmod.Connect,
+        timeout: float,
+    ) -> None:
+        """Initialize the connection."""
+        self._hass = hass
+        self._create_rfx = create_rfx
+        self._rfx_object = rfx_object
+        self._timeout = timeout
+        self.connected = False
+
+    async def async_run(self) -> None:
+        """Connect to the gateway, retrying until it answers."""
+        delay = CONNECT_RETRY_SECS
+        while True:
+            attempt = self._hass.async_add_executor_job(
+                self._rfx_object.connect, self._timeout
+            )
+            try:
+                await asyncio.shield(attempt)
+            except asyncio.CancelledError:
+                # The attempt carries on in its thread, so close it if it connects
+                attempt.add_done_callback(self._async_close_attempt)
+                raise
+            except (TimeoutError, rfxtrxmod.RFXtrxTransportError) as exc:
+                _LOGGER.warning(
+                    "Unable to connect to the RFXtrx gateway (%s), retrying in %s secs",
+                    str(exc) or "timeout",
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, CONNECT_RETRY_MAX_SECS)
+                # A connection object cannot be connected again once it has failed
+                self._rfx_object = await self._hass.async_add_executor_job(
+                    self._create_rfx
+                )
+                self._hass.data[DOMAIN][DATA_RFXOBJECT] = self._rfx_object
+                continue
+            break
+
+        _LOGGER.debug("Connected to the RFXtrx gateway")
+        self.connected = True
+        self._async_write_states()
+
+    @callback
+    def _async_close_attempt(self, attempt: asyncio.Future[None]) -> None:
+        """Close a connection that was made after setup was abandoned."""
+        if not attempt.cancelled() and attempt.exception() is None:
+            self._hass.async_add_executor_job(self._rfx_object.close_connection)
+
+    @callback
+    def _async_write_states(self) -> None:
+        """Write the state of every entity now that they are available."""
+        for platform in entity_platform.async_get_platforms(self._hass, DOMAIN):
+            for entity in platform.entities.values():
+                entity.async_write_ha_state()
+
+    def close(self) -> None:
+        """Close the connection to the gateway, if it was made."""
+        if self.connected:
+            self.connected = False
+            self._rfx_object.close_connection()
+
+
+@callback
+def async_setup_gateway(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    create_rfx: Callable[[], rfxtrxmod.Connect],
+    rfx_object: rfxtrxmod.Connect,
+    timeout: float,
+) -> GatewayConnection:
+    """Start connecting to the gateway in the background."""
+    gateway = GatewayConnection(hass, create_rfx, rfx_object, timeout)
+    hass.data[DOMAIN][DATA_GATEWAY] = gateway
+    config_entry.async_create_background_task(
+        hass, gateway.async_run(), "rfxtrx gateway connect"
+    )
+    return gateway
+
+
+@callback
+def async_get_gateway(hass: HomeAssistant) -> GatewayConnection:
+    """Return the connection to the gateway."""
+    return hass.data[DOMAIN][DATA_GATEWAY]
+
+
+@callback
+def async_is_connected(hass: HomeAssistant) -> bool:
+    """Return whether the gateway is connected."""
+    gateway: GatewayConnection | None = hass.data.get(DOMAIN, {}).get(DATA_GATEWAY)
+    return gateway is not None and gateway.connected
+
+
+@callback
+def async_get_connected_rfx(hass: HomeAssistant) -> rfxtrxmod.Connect:
+    """Return the rfx object to send with, if the gateway is connected."""
+    if not async_is_connected(hass):
+        raise HomeAssistantError("The RFXtrx gateway is not connected")
+    return hass.data[DOMAIN][DATA_RFXOBJECT]
@@ -0,0 +1,217 @@
+"""Group support for RFXtrx stateful covers."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+import RFXtrx as rfxtrxmod
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import Entity
+
+from .. import DeviceTuple
+from ..const import COMMAND_GROUP_LIST, DOMAIN, SIGNAL_EVENT
+from .const import CONF_GROUP_MEMBERS, DATA_GROUP_INDEX
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def parse_group_members(members: str) -> list[str]:
+    """Split a comma separated list of member ids."""
+    return [member.strip() for member in members.split(",") if member.strip()]
+
+
+class CoverGroupIndex:
+    """Index of the stateful covers and the groups they belong to.
+
+    Each cover only listens for frames addressed to itself, so a frame
+    sent to a group by a remote would otherwise go unnoticed by the
+    members. Rather than have every cover check every frame against its
+    groups, the memberships are indexed once as covers are added. A
+    single listener then looks up each received frame and applies it to
+    exactly the covers in the group, writing their states in one batch.
+
+    Two kinds of group are indexed: RFY group units configured with
+    their members, and the house code of Lighting2 style devices, which
+    respond to the "Group on" and "Group off" commands. Frames are only
+    applied to covers that can work out their state from a frame, which
+    the RFY blinds cannot.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self.covers: dict[DeviceTuple, GroupMixin] = {}
+        self._groups: dict[DeviceTuple, list[DeviceTuple]] = {}
+        self._houses: dict[tuple[str, str, str], set[DeviceTuple]] = {}
+
+    @callback
+    def async_setup(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+        """Start listening for group frames."""
+        config_entry.async_on_unload(
+            async_dispatcher_connect(hass, SIGNAL_EVENT, self._async_handle_event)
+        )
+
+    @callback
+    def async_add(self, cover: GroupMixin) -> None:
+        """Add a cover to the index."""
+        device_id = cover._device_id
+        self.covers[device_id] = cover
+        if cover._myattr_group_members:
+            self._groups[device_id] = cover._myattr_group_members
+        if cover._myattr_follows_group_frames:
+            self._houses.setdefault(_house_key(device_id), set()).add(device_id)
+
+    @callback
+    def async_remove(self, cover: GroupMixin) -> None:
+        """Remove a cover from the index."""
+        device_id = cover._device_id
+        if self.covers.get(device_id) is not cover:
+            return
+        del self.covers[device_id]
+        self._groups.pop(device_id, None)
+        if (house := self._houses.get(_house_key(device_id))) is None:
+            return
+        house.discard(device_id)
+        if not house:
+            del self._houses[_house_key(device_id)]
+
+    @callback
+    def _async_handle_event(
+        self, event: rfxtrxmod.RFXtrxEvent, device_id: DeviceTuple
+    ) -> None:
+        """Apply a group frame to the covers in the group."""
+        members: Any = self._groups.get(device_id)
+        if (
+            members is None
+            and isinstance(event, rfxtrxmod.ControlEvent)
+            and event.values.get("Command") in COMMAND_GROUP_LIST
+        ):
+            members = self._houses.get(_house_key(device_id))
+        if not members:
+            return
+
+        # The addressed device has already handled its own frame
+        covers = [
+            cover
+            for member in members
+            if member != device_id
+            and (cover := self.covers.get(member)) is not None
+            and cover._myattr_follows_group_frames
+        ]
+        if not covers:
+            return
+        _LOGGER.debug("Group frame for %s applies to %s covers", device_id, len(covers))
+        for cover in covers:
+            cover._apply_group_event(event)
+        for cover in covers:
+            cover.async_write_ha_state()
+
+
+def _house_key(device_id: DeviceTuple) -> tuple[str, str, str]:
+    """Return the key of the house code that a device belongs to."""
+    group_id, _, _ = device_id.id_string.partition(":")
+    return (device_id.packettype, device_id.subtype, group_id)
+
+
+@callback
+def async_get_group_index(hass: HomeAssistant) -> CoverGroupIndex:
+    """Return the index of the stateful covers."""
+    return hass.data[DOMAIN][DATA_GROUP_INDEX]
+
+
+class GroupMixin(Entity):
+    """Mixin to let a cover drive the state of the covers in its group.
+
+    An RFY group unit moves every blind in the group with a single frame,
+    so the group is configured as a cover in its own right with the ids
+    of its members. Whenever the group writes its state the same state is
+    applied to each member, so the members follow the group without any
+    frames being sent to them individually.
+    """
+
+    _device_id: DeviceTuple
+    _myattr_group_members: list[DeviceTuple] = []
+    _myattr_group_pushed: Any = None
+    # Set by covers that implement _apply_group_event
+    _myattr_follows_group_frames = False
+
+    def _init_group(self, device_id: DeviceTuple, entity_info: dict[str, Any]) -> None:
+        """Read the group members from the device configuration."""
+        self._myattr_group_members = [
+            DeviceTuple(device_id.packettype, device_id.subtype, member)
+            for member in parse_group_members(entity_info.get(CONF_GROUP_MEMBERS, ""))
+            if member != device_id.id_string
+        ]
+
+    async def async_added_to_hass(self) -> None:
+        """Register the cover so that groups can find it."""
+        await super().async_added_to_hass()
+        async_get_group_index(self.hass).async_add(self)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Unregister the cover."""
+        async_get_group_index(self.hass).async_remove(self)
+        return await super().async_will_remove_from_hass()
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state to the state machine and to any group members."""
+        super().async_write_ha_state()
+        if self._myattr_group_members:
+            self._async_update_group_members()
+
+    @callback
+    def _async_update_group_members(self) -> None:
+        """Apply the state of this group to each of its members."""
+        state = self._group_state()
+        # Only push a change so that a write that leaves the group as it
+        # was does not undo anything the members have done since
+        if state == self._myattr_group_pushed:
+            return
+        self._myattr_group_pushed = state
+
+        covers = async_get_group_index(self.hass).covers
+        for device_id in self._myattr_group_members:
+            member = covers.get(device_id)
+            if member is None or member is self:
+                continue
+            if type(member) is not type(self):
+                _LOGGER.warning(
+                    "%s: group member %s is a different type of cover - ignoring",
+                    self.entity_id,
+                    member.entity_id,
+                )
+                continue
+            member._apply_group_state(state)
+            member.async_write_ha_state()
+
+    def _group_state(self) -> Any:
+        """Return the state model to copy to the group members."""
+        raise Exception("_group_state has not been implemented")
+
+    def _apply_group_state(self, state: Any) -> None:
+        """Take on the state model of a group."""
+        raise Exception("_apply_group_state has not been implemented")
+
+    def _apply_group_event(self, event: rfxtrxmod.RFXtrxEvent) -> None:
+        """Apply a frame received for a group this cover belongs to."""
+        raise Exception("_apply_group_event has not been implemented")
+
+    def _scene_target(self, position: int | None, tilt_position: int | None) -> Any:
+        """Return the state a scene position and tilt map to for this cover."""
+        raise Exception("_scene_target has not been implemented")
+
+    def _at_target(self, target: Any) -> bool:
+        """Return whether the cover is at, or already heading for, a target."""
+        raise Exception("_at_target has not been implemented")
+
+    def _scene_secs(self, target: Any) -> float:
+        """Return the expected time for the cover to reach a target."""
+        raise Exception("_scene_secs has not been implemented")
+
+    async def _async_start_scene_move(self, target: Any) -> None:
+        """Start moving to a target, returning once the first frame is sent."""
+        raise Exception("_async_start_scene_move has not been implemented")
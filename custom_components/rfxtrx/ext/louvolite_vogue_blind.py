@@ -54,27 +54,29 @@ class LouvoliteVogueBlind(AbstractTiltingCover):
             {ATTR_MANUFACTURER: MANUFACTURER_NAME, ATTR_MODEL: DEVICE_TYPE}
         )
 
-    def _entity_picture(self) -> str | None:
-        """Return the entity_picture property."""
-        if self._is_moving:
+    def _entity_picture(
+        self, is_moving: bool, is_raised: bool, tilt_step: int
+    ) -> str | None:
+        """Return the entity_picture property for a state."""
+        if is_moving:
             icon = "move.svg"
             closed = False
-        elif self._myattr_is_raised:
+        elif is_raised:
             icon = "open.svg"
             closed = False
-        elif self._myattr_tilt_step == TILT_MIN_STEP:
+        elif tilt_step == TILT_MIN_STEP:
             icon = "00.svg"
             closed = True
-        elif self._myattr_tilt_step == 1:
+        elif tilt_step == 1:
             icon = "25.svg"
             closed = self._myattr_partial_is_closed
-        elif self._myattr_tilt_step == TILT_MID_STEP:
+        elif tilt_step == TILT_MID_STEP:
             icon = "50.svg"
             closed = False
-        elif self._myattr_tilt_step == 3:
+        elif tilt_step == 3:
             icon = "75.svg"
             closed = self._myattr_partial_is_closed
-        elif self._myattr_tilt_step == TILT_MAX_STEP:
+        elif tilt_step == TILT_MAX_STEP:
             icon = "99.svg"
             closed = True
         else:
@@ -90,23 +92,21 @@ class LouvoliteVogueBlind(AbstractTiltingCover):
 
     async def _async_raise_blind(self) -> None:
         """Lift the cover."""
-        _LOGGER.info("Invoked _async_raise_blind")
+        _LOGGER.debug("Invoked _async_raise_blind")
         await self._async_tilt_blind_to_step(TILT_MID_STEP)
 
     async def _async_lower_blind(self) -> None:
         """Lower the cover."""
-        _LOGGER.info("Invoked _async_lower_blind")
+        _LOGGER.debug("Invoked _async_lower_blind")
         await self._async_tilt_blind_to_step(TILT_MIN_STEP)
 
     async def _async_stop_blind(self) -> None:
         """Stop the cover."""
-        _LOGGER.info("Invoked _async_stop_blind")
+        _LOGGER.debug("Invoked _async_stop_blind")
 
     async def _async_tilt_blind_to_step(self, tilt_step) -> None:
         """Move the cover tilt to a preset position."""
-        _LOGGER.info(
-            "Invoked _async_tilt_blind_to_mid_step; tilt_step = " + str(tilt_step)
-        )
+        _LOGGER.debug("Invoked _async_tilt_blind_to_step; tilt_step = %s", tilt_step)
 
         if tilt_step == 0:
             self._attr_is_closing = True
@@ -128,8 +128,8 @@ class LouvoliteVogueBlind(AbstractTiltingCover):
             self.async_write_ha_state()
 
             _LOGGER.debug(
-                "_async_tilt_blind_to_step; tilting CMD_VOGUE_45_DEGREES and waiting "
-                + str(self._myattr_tilt_pos1_secs)
+                "_async_tilt_blind_to_step; tilting CMD_VOGUE_45_DEGREES and waiting %s",
+                self._myattr_tilt_pos1_secs,
             )
             await self._async_send_repeat(
                 self._device.send_command, CMD_VOGUE_45_DEGREES
@@ -143,8 +143,8 @@ class LouvoliteVogueBlind(AbstractTiltingCover):
             self.async_write_ha_state()
 
             _LOGGER.debug(
-                "_async_tilt_blind_to_step; tilting CMD_VOGUE_90_DEGREES and waiting "
-                + str(self._myattr_tilt_pos2_secs)
+                "_async_tilt_blind_to_step; tilting CMD_VOGUE_90_DEGREES and waiting %s",
+                self._myattr_tilt_pos2_secs,
             )
             await self._async_send_repeat(
                 self._device.send_command, CMD_VOGUE_90_DEGREES
@@ -159,8 +159,8 @@ class LouvoliteVogueBlind(AbstractTiltingCover):
             self.async_write_ha_state()
 
             _LOGGER.debug(
-                "_async_tilt_blind_to_step; tilting CMD_VOGUE_135_DEGREES and waiting "
-                + str(self._myattr_tilt_pos2_secs)
+                "_async_tilt_blind_to_step; tilting CMD_VOGUE_135_DEGREES and waiting %s",
+                self._myattr_tilt_pos2_secs,
             )
             await self._async_send_repeat(
                 self._device.send_command, CMD_VOGUE_135_DEGREES
@@ -174,8 +174,8 @@ class LouvoliteVogueBlind(AbstractTiltingCover):
             self.async_write_ha_state()
 
             _LOGGER.debug(
-                "_async_tilt_blind_to_step; tilting CMD_VOGUE_CLOSE_CW and waiting "
-                + str(self._myattr_tilt_pos2_secs)
+                "_async_tilt_blind_to_step; tilting CMD_VOGUE_CLOSE_CW and waiting %s",
+                self._myattr_tilt_pos2_secs,
             )
             await self._async_send_repeat(self._device.send_command, CMD_VOGUE_CLOSE_CW)
             await self._async_wait_and_set_position(
@@ -0,0 +1,150 @@
+"""Background movement support for RFXtrx stateful covers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Coroutine
+import logging
+import time
+from typing import Any
+
+from homeassistant.helpers.entity import Entity
+
+from .const import (
+    CONF_RESYNC_COMMANDS,
+    CONF_RESYNC_HOURS,
+    DEF_RESYNC_COMMANDS,
+    DEF_RESYNC_HOURS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class MovementMixin(Entity):
+    """Mixin to run cover movements as background tasks.
+
+    The motors take many seconds to travel and report nothing back, so
+    the movement is tracked by waiting for the configured travel time.
+    Rather than holding the service call for all of that time the
+    movement runs as a cancellable background task and the service
+    returns as soon as the first frame has been sent. Setting wait keeps
+    the old behaviour of returning once the movement has completed.
+
+    The start and expected length of the travel are recorded so that a
+    movement that is preempted by a new command can estimate how far
+    the blind got.
+
+    A command to move to the state the blind is already in is skipped,
+    sending nothing and waiting for nothing. As the tracked state can
+    drift from the real blind, the command is sent anyway once enough
+    commands have been skipped or enough time has passed since anything
+    was last sent.
+    """
+
+    _move_task: asyncio.Task[None] | None = None
+    _move_frame_sent: asyncio.Event | None = None
+    _myattr_wait_for_move: bool = False
+    _move_started: float | None = None
+    _move_secs: float = 0
+    _myattr_resync_commands: int = 0
+    _myattr_resync_hours: float = 0
+    _myattr_skipped_moves: int = 0
+    _myattr_last_sent: float | None = None
+
+    def _init_resync(self, entity_info: dict[str, Any]) -> None:
+        """Read the resync options from the device configuration."""
+        self._myattr_resync_commands = entity_info.get(
+            CONF_RESYNC_COMMANDS, DEF_RESYNC_COMMANDS
+        )
+        self._myattr_resync_hours = entity_info.get(CONF_RESYNC_HOURS, DEF_RESYNC_HOURS)
+
+    def _skip_redundant_move(self) -> bool:
+        """Return whether a move to the current state can be skipped."""
+        if self._myattr_skipped_moves >= self._myattr_resync_commands:
+            return False
+        if self._myattr_resync_hours and (
+            # Nothing sent since startup, so the restored state may be stale
+            self._myattr_last_sent is None
+            or time.monotonic() - self._myattr_last_sent
+            >= self._myattr_resync_hours * 3600
+        ):
+            return False
+        self._myattr_skipped_moves += 1
+        return True
+
+    async def _async_run_movement(
+        self, movement: Coroutine[Any, Any, None], wait: bool | None = None
+    ) -> None:
+        """Start a movement and return once its first frame has been sent."""
+        self._async_cancel_movement()
+        self._move_started = None
+        self._myattr_skipped_moves = 0
+        self._myattr_last_sent = time.monotonic()
+
+        frame_sent = asyncio.Event()
+        self._move_frame_sent = frame_sent
+        task = self.hass.async_create_background_task(
+            movement, f"{self.entity_id} movement"
+        )
+        self._move_task = task
+        task.add_done_callback(self._async_movement_done)
+
+        if wait is None:
+            wait = self._myattr_wait_for_move
+
+        if wait:
+            await asyncio.wait((task,))
+        else:
+            frame_wait = asyncio.create_task(frame_sent.wait())
+            try:
+                await asyncio.wait(
+                    (task, frame_wait), return_when=asyncio.FIRST_COMPLETED
+                )
+            finally:
+                frame_wait.cancel()
+
+        # Raise anything that went wrong before we stopped waiting
+        if task.done() and not task.cancelled():
+            task.result()
+
+    def _async_cancel_movement(self) -> bool:
+        """Cancel any movement in progress, returning whether there was one."""
+        task = self._move_task
+        self._move_task = None
+        if task is None or task.done():
+            return False
+
+        _LOGGER.debug("%s: cancelling movement in progress", self.entity_id)
+        task.cancel()
+        return True
+
+    def _async_movement_done(self, task: asyncio.Task[None]) -> None:
+        """Tidy up once a movement task has finished."""
+        if self._move_task is task:
+            self._move_task = None
+            self._move_started = None
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            _LOGGER.error("%s: movement failed: %s", self.entity_id, exc)
+
+    def _start_travel(self, secs: float) -> None:
+        """Record that the blind has started travelling for secs."""
+        self._move_started = time.monotonic()
+        self._move_secs = secs
+
+    def _travel_fraction(self) -> float | None:
+        """Return how much of the current travel has elapsed, if travelling."""
+        if self._move_started is None:
+            return None
+        if self._move_secs <= 0:
+            return 1.0
+        return min((time.monotonic() - self._move_started) / self._move_secs, 1.0)
+
+    def _notify_frame_sent(self) -> None:
+        """Release a service call waiting for the first frame of a movement."""
+        if self._move_frame_sent is not None:
+            self._move_frame_sent.set()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Run when entity will be removed from hass."""
+        self._async_cancel_movement()
+        return await super().async_will_remove_from_hass()
@@ -0,0 +1,104 @@
+"""Shared off delay timer for RFXtrx binary sensors and sirens."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Hashable
+import heapq
+from itertools import count
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from ..const import DOMAIN
+from .const import DATA_OFF_DELAY
+
+
+class OffDelayScheduler:
+    """Single loop timer for every off delay of the integration.
+
+    Motion sensors and the like repeat their "on" packet every few
+    seconds while active, and each repeat pushes the off delay back.
+    Rather than cancel and create a loop timer for every packet, the
+    deadlines are kept here with one timer armed for the earliest. A
+    repeat only moves the deadline of its entity on; the stale heap entry
+    is found to be early when it comes up and is queued again then.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._loop = hass.loop
+        self._deadlines: dict[Hashable, tuple[float, Callable[[], None]]] = {}
+        self._heap: list[tuple[float, int, Hashable]] = []
+        self._seq = count()
+        self._timer: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_schedule(
+        self, key: Hashable, delay: float, action: Callable[[], None]
+    ) -> None:
+        """Run an action after a delay, replacing any pending for the key."""
+        deadline = self._loop.time() + delay
+        pending = self._deadlines.get(key)
+        self._deadlines[key] = (deadline, action)
+        if pending is not None and pending[0] <= deadline:
+            return
+        heapq.heappush(self._heap, (deadline, next(self._seq), key))
+        self._async_arm()
+
+    @callback
+    def async_cancel(self, key: Hashable) -> None:
+        """Cancel the pending action for the key, if any."""
+        self._deadlines.pop(key, None)
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel every pending action."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._deadlines.clear()
+        self._heap.clear()
+
+    @callback
+    def _async_arm(self) -> None:
+        """Arm the timer for the earliest deadline."""
+        if not self._heap:
+            return
+        when = self._heap[0][0]
+        if self._timer is not None:
+            if self._timer.when() <= when:
+                return
+            self._timer.cancel()
+        self._timer = self._loop.call_at(when, self._async_fire)
+
+    @callback
+    def _async_fire(self) -> None:
+        """Run the actions whose deadlines have passed."""
+        self._timer = None
+        now = self._loop.time()
+        while self._heap and self._heap[0][0] <= now:
+            _, _, key = heapq.heappop(self._heap)
+            if (pending := self._deadlines.get(key)) is None:
+                continue
+            deadline, action = pending
+            if deadline > now:
+                heapq.heappush(self._heap, (deadline, next(self._seq), key))
+                continue
+            del self._deadlines[key]
+            action()
+        self._async_arm()
+
+
+@callback
+def async_setup_off_delay(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Start the scheduler shared by every off delay."""
+    scheduler = OffDelayScheduler(hass)
+    hass.data[DOMAIN][DATA_OFF_DELAY] = scheduler
+    config_entry.async_on_unload(scheduler.async_stop)
+
+
+@callback
+def async_get_off_delay(hass: HomeAssistant) -> OffDelayScheduler:
+    """Return the scheduler shared by every off delay."""
+    return hass.data[DOMAIN][DATA_OFF_DELAY]
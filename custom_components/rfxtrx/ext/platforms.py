@@ -0,0 +1,179 @@
+"""Platform selection for RFXtrx config entries."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+import logging
+from typing import TYPE_CHECKING
+
+import RFXtrx as rfxtrxmod
+
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
+
+from ..const import DEVICE_PACKET_TYPE_LIGHTING4, DOMAIN
+from .const import (
+    DATA_PLATFORMS,
+    DEVICE_PACKET_SUBTYPE_LIGHTING2_AC,
+    DEVICE_PACKET_TYPE_LIGHTING2,
+)
+
+if TYPE_CHECKING:
+    from .. import ConfiguredDevice, DeviceTuple
+
+_LOGGER = logging.getLogger(__name__)
+
+
+# These mirror the supported() checks of the platforms without importing
+# them. They may accept a device the platform then makes nothing for, but
+# must never reject one that it would, which the tests check against the
+# platforms themselves.
+
+
+def _binary_sensor(event: rfxtrxmod.RFXtrxEvent) -> bool:
+    return isinstance(event, rfxtrxmod.ControlEvent) or (
+        isinstance(event, rfxtrxmod.SensorEvent) and "Sensor Status" in event.values
+    )
+
+
+def _cover(event: rfxtrxmod.RFXtrxEvent) -> bool:
+    return (
+        event.device.packettype == DEVICE_PACKET_TYPE_LIGHTING2
+        and event.device.subtype == DEVICE_PACKET_SUBTYPE_LIGHTING2_AC
+    ) or bool(event.device.known_to_be_rollershutter)
+
+
+def _event(event: rfxtrxmod.RFXtrxEvent) -> bool:
+    return (
+        isinstance(event, (rfxtrxmod.ControlEvent, rfxtrxmod.SensorEvent))
+        and event.device.packettype != DEVICE_PACKET_TYPE_LIGHTING4
+    )
+
+
+def _light(event: rfxtrxmod.RFXtrxEvent) -> bool:
+    return (
+        isinstance(event.device, rfxtrxmod.LightingDevice)
+        and event.device.known_to_be_dimmable
+    )
+
+
+def _sensor(event: rfxtrxmod.RFXtrxEvent) -> bool:
+    return isinstance(event, (rfxtrxmod.ControlEvent, rfxtrxmod.SensorEvent))
+
+
+def _siren(event: rfxtrxmod.RFXtrxEvent) -> bool:
+    return isinstance(event.device, rfxtrxmod.ChimeDevice) or (
+        isinstance(event.device, rfxtrxmod.SecurityDevice)
+        and isinstance(event, rfxtrxmod.SensorEvent)
+    )
+
+
+def _switch(event: rfxtrxmod.RFXtrxEvent) -> bool:
+    return (
+        isinstance(event.device, rfxtrxmod.LightingDevice)
+        and not event.device.known_to_be_dimmable
+        and not event.device.known_to_be_rollershutter
+    ) or isinstance(event.device, rfxtrxmod.RfyDevice)
+
+
+# Platforms whose supported() depends on the values in a packet, rather
+# than on the kind of device alone
+VALUE_DEPENDENT_PLATFORMS = frozenset({Platform.BINARY_SENSOR, Platform.SIREN})
+
+PLATFORM_SUPPORTED: dict[Platform, Callable[[rfxtrxmod.RFXtrxEvent], bool]] = {
+    Platform.BINARY_SENSOR: _binary_sensor,
+    Platform.COVER: _cover,
+    Platform.EVENT: _event,
+    Platform.LIGHT: _light,
+    Platform.SENSOR: _sensor,
+    Platform.SIREN: _siren,
+    Platform.SWITCH: _switch,
+}
+
+
+def platforms_for_event(event: rfxtrxmod.RFXtrxEvent) -> set[Platform]:
+    """Return the platforms that may make entities for a packet."""
+    return {
+        platform
+        for platform, supported in PLATFORM_SUPPORTED.items()
+        if supported(event)
+    }
+
+
+class DeviceTable:
+    """The configured devices, partitioned by the platforms they may use.
+
+    The platforms for a device are worked out once, when it is added to
+    the table, so that each platform only goes through its own partition
+    when it is set up. Devices added automatically are added here too,
+    for a platform that is only set up once such a device turns up.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the table."""
+        self.devices: list[ConfiguredDevice] = []
+        self._partitions: dict[Platform, list[ConfiguredDevice]] = {}
+
+    def add(self, device: ConfiguredDevice) -> None:
+        """Add a device to the partitions of its platforms."""
+        self.devices.append(device)
+        for platform in platforms_for_event(device.event):
+            self._partitions.setdefault(platform, []).append(device)
+
+    def remove(self, device_id: DeviceTuple) -> None:
+        """Remove a device from the table."""
+        self.devices = [
+            device for device in self.devices if device.device_id != device_id
+        ]
+        for platform, partition in self._partitions.items():
+            self._partitions[platform] = [
+                device for device in partition if device.device_id != device_id
+            ]
+
+    def for_platform(self, platform: Platform) -> list[ConfiguredDevice]:
+        """Return the devices a platform may make entities for."""
+        return self._partitions.get(platform, [])
+
+    @property
+    def platforms(self) -> set[Platform]:
+        """Return the platforms that may make entities for the devices."""
+        return {platform for platform, devices in self._partitions.items() if devices}
+
+
+async def async_forward_platforms(
+    hass: HomeAssistant, config_entry: ConfigEntry, platforms: Iterable[Platform]
+) -> None:
+    """Set up the given platforms that are not already set up."""
+    loaded: set[Platform] = hass.data[DOMAIN].setdefault(DATA_PLATFORMS, set())
+    # Sorted so that the platforms are always set up in the same order
+    new = sorted(set(platforms) - loaded)
+    if not new:
+        return
+    loaded.update(new)
+    _LOGGER.debug("Setting up platforms %s", new)
+    await hass.config_entries.async_forward_entry_setups(config_entry, new)
+
+
+@callback
+def async_load_platforms_for_event(
+    hass: HomeAssistant, config_entry: ConfigEntry, event: rfxtrxmod.RFXtrxEvent
+) -> None:
+    """Set up any platforms a new device needs that are not set up yet."""
+    # Until the entry is loaded its own setup is still forwarding platforms
+    if config_entry.state is not ConfigEntryState.LOADED:
+        return
+    platforms = platforms_for_event(event)
+    if platforms <= async_get_loaded_platforms(hass):
+        return
+    config_entry.async_create_task(
+        hass,
+        async_forward_platforms(hass, config_entry, platforms),
+        "rfxtrx forward platforms",
+    )
+
+
+@callback
+def async_get_loaded_platforms(hass: HomeAssistant) -> set[Platform]:
+    """Return the platforms that have been set up."""
+    return hass.data[DOMAIN].get(DATA_PLATFORMS, set())
@@ -0,0 +1,154 @@
+"""Multi-cover scene support for RFXtrx stateful covers."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, NamedTuple
+
+import voluptuous as vol
+
+from homeassistant.components.cover import ATTR_POSITION, ATTR_TILT_POSITION
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+
+from ..const import DOMAIN
+from .const import ATTR_COVERS, SVC_MOVE_COVERS
+from .group import CoverGroupIndex, GroupMixin, async_get_group_index
+
+_LOGGER = logging.getLogger(__name__)
+
+_UNSET = object()
+
+_PERCENT = vol.All(vol.Coerce(int), vol.Range(min=0, max=100))
+
+MOVE_COVERS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_COVERS): {
+            cv.entity_id: vol.Schema(
+                {
+                    vol.Optional(ATTR_POSITION): _PERCENT,
+                    vol.Optional(ATTR_TILT_POSITION): _PERCENT,
+                }
+            )
+        }
+    }
+)
+
+
+class SceneMove(NamedTuple):
+    """A cover to move to a target as part of a scene."""
+
+    cover: GroupMixin
+    target: Any
+    secs: float
+
+
+def plan_scene(
+    index: CoverGroupIndex, targets: dict[GroupMixin, dict[str, int]]
+) -> list[SceneMove]:
+    """Work out the moves needed to bring a set of covers to their targets.
+
+    Covers that are already at, or heading for, their target are left
+    alone. Where every member of a configured group is heading for the
+    same target the group is moved instead of the members, so a single
+    frame does the work of several. The moves are ordered longest first
+    so that the slowest covers set off first and the scene as a whole is
+    done as early as possible.
+    """
+    wanted: dict[GroupMixin, Any] = {
+        cover: cover._scene_target(
+            target.get(ATTR_POSITION), target.get(ATTR_TILT_POSITION)
+        )
+        for cover, target in targets.items()
+    }
+    moves: dict[GroupMixin, Any] = {
+        cover: target
+        for cover, target in wanted.items()
+        if not cover._at_target(target)
+    }
+
+    # Try the largest groups first so that they take as many members as
+    # possible
+    groups = sorted(
+        (cover for cover in index.covers.values() if cover._myattr_group_members),
+        key=lambda group: len(group._myattr_group_members),
+        reverse=True,
+    )
+    for group in groups:
+        members = [index.covers.get(member) for member in group._myattr_group_members]
+        if any(
+            member is None or type(member) is not type(group) for member in members
+        ):
+            continue
+        group_targets = {wanted.get(member, _UNSET) for member in members}
+        if len(group_targets) != 1 or _UNSET in group_targets:
+            continue
+        if not any(member in moves for member in members):
+            continue
+        (target,) = group_targets
+        if group in wanted and wanted[group] != target:
+            continue
+        if group._at_target(target):
+            continue
+        for member in members:
+            moves.pop(member, None)
+        moves[group] = target
+        _LOGGER.debug(
+            "plan_scene: moving group %s instead of %s covers",
+            group.entity_id,
+            len(members),
+        )
+
+    return sorted(
+        (
+            SceneMove(cover, target, cover._scene_secs(target))
+            for cover, target in moves.items()
+        ),
+        key=lambda move: move.secs,
+        reverse=True,
+    )
+
+
+@callback
+def async_setup_move_covers_service(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> None:
+    """Register the service to move several covers at once."""
+
+    async def _async_move_covers(call: ServiceCall) -> None:
+        index = async_get_group_index(hass)
+        by_entity_id = {cover.entity_id: cover for cover in index.covers.values()}
+
+        targets: dict[GroupMixin, dict[str, int]] = {}
+        for entity_id, target in call.data[ATTR_COVERS].items():
+            if (cover := by_entity_id.get(entity_id)) is None:
+                raise HomeAssistantError(f"{entity_id} is not an RFXtrx stateful cover")
+            targets[cover] = target
+
+        moves = plan_scene(index, targets)
+        _LOGGER.debug(
+            "move_covers: %s covers need %s moves", len(targets), len(moves)
+        )
+        # Each move is started once the frame of the one before it has
+        # been sent, so the frames go out in the planned order. One cover
+        # failing does not skip the others.
+        failures: list[str] = []
+        for move in moves:
+            try:
+                await move.cover._async_start_scene_move(move.target)
+            except Exception as exc:
+                failures.append(f"{move.cover.entity_id}: {exc}")
+        if failures:
+            raise HomeAssistantError(
+                f"Unable to move {len(failures)} of {len(moves)} covers: "
+                + "; ".join(failures)
+            )
+
+    hass.services.async_register(
+        DOMAIN, SVC_MOVE_COVERS, _async_move_covers, schema=MOVE_COVERS_SCHEMA
+    )
+    config_entry.async_on_unload(
+        lambda: hass.services.async_remove(DOMAIN, SVC_MOVE_COVERS)
+    )
@@ -0,0 +1,367 @@
+"""Sensor update throttling, aggregation and dispatch for RFXtrx."""
+
+from __future__ import annotations
+
+from array import array
+import dataclasses
+import logging
+import time
+from typing import TYPE_CHECKING, Any, cast
+
+import RFXtrx as rfxtrxmod
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import Entity
+
+from .. import DeviceTuple
+from ..const import SIGNAL_EVENT
+from .const import (
+    CONF_SENSOR_AGGREGATE,
+    CONF_SENSOR_DEADBAND,
+    CONF_SENSOR_HEARTBEAT,
+    CONF_SENSOR_MIN_INTERVAL,
+    CONF_SENSOR_WINDOW,
+    DEF_SENSOR_AGGREGATE,
+    DEF_SENSOR_DEADBAND,
+    DEF_SENSOR_HEARTBEAT,
+    DEF_SENSOR_MIN_INTERVAL,
+    DEF_SENSOR_WINDOW,
+)
+
+if TYPE_CHECKING:
+    from ..sensor import RfxtrxSensor, RfxtrxSensorEntityDescription
+
+_LOGGER = logging.getLogger(__name__)
+
+# Aggregation modes; "peak" adds a separate sensor for the maximum
+AGGREGATE_MODES = ("mean", "min", "max", "peak")
+
+# Number of samples kept for each aggregated sensor
+AGGREGATE_SIZE = 256
+
+# Appended to the key of a peak sensor
+PEAK_SUFFIX = " peak"
+
+
+def _split_option(option: str) -> list[tuple[str | None, str]]:
+    """Split a comma separated list of key=value pairs.
+
+    A value given without a key is returned with a key of None.
+    """
+    items = []
+    for item in option.split(","):
+        if not item.strip():
+            continue
+        key, _, value = item.rpartition("=")
+        items.append((key.strip() or None, value.strip()))
+    return items
+
+
+def parse_deadband(deadband: str) -> dict[str | None, float]:
+    """Parse a deadband option into the deadband for each sensor key.
+
+    The option is either a single number used for every sensor of the
+    device, or a comma separated list of key=number pairs such as
+    "Temperature=0.2, Humidity=1". The default for any other key is
+    stored under None.
+    """
+    deadbands: dict[str | None, float] = {}
+    for key, value in _split_option(deadband):
+        try:
+            deadbands[key] = float(value)
+        except ValueError:
+            _LOGGER.warning("Ignoring invalid sensor deadband '%s'", value)
+    return deadbands
+
+
+def parse_aggregate(aggregate: str) -> dict[str, str]:
+    """Parse an aggregate option into the mode for each sensor key.
+
+    The option is a comma separated list of key=mode pairs such as
+    "Energy usage=mean, Wind gust=peak".
+    """
+    modes: dict[str, str] = {}
+    for key, mode in _split_option(aggregate):
+        if key is None or mode not in AGGREGATE_MODES:
+            _LOGGER.warning("Ignoring invalid sensor aggregate '%s=%s'", key, mode)
+            continue
+        modes[key] = mode
+    return modes
+
+
+def _as_float(value: Any) -> float | None:
+    """Return a sensor value as a number, if it is one."""
+    if isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class SensorThrottle:
+    """Decide which sensor readings are worth writing to the state machine.
+
+    Many sensors report every few seconds with values that only jitter,
+    and every write becomes a recorder row. A reading is dropped if it is
+    within the deadband of the last value written, or if it arrives less
+    than the minimum interval after the last write. The first reading
+    after the heartbeat has passed is always written so that the sensor
+    still shows signs of life.
+    """
+
+    def __init__(self, deadband: float, min_interval: float, heartbeat: float) -> None:
+        """Initialize the throttle."""
+        self._deadband = deadband
+        self._min_interval = min_interval
+        self._heartbeat = heartbeat
+        self._last_value: Any = None
+        self._last_write: float | None = None
+        self.writes_saved = 0
+
+    def should_write(self, value: Any) -> bool:
+        """Return whether a reading should be written, recording it if so."""
+        now = time.monotonic()
+        if self._last_write is not None and not self._due(value, now):
+            self.writes_saved += 1
+            return False
+        self._last_value = value
+        self._last_write = now
+        return True
+
+    def _due(self, value: Any, now: float) -> bool:
+        """Return whether a reading after the first should be written."""
+        assert self._last_write is not None
+        elapsed = now - self._last_write
+        if self._heartbeat and elapsed >= self._heartbeat:
+            return True
+        if self._min_interval and elapsed < self._min_interval:
+            return False
+        if self._deadband:
+            new = _as_float(value)
+            old = _as_float(self._last_value)
+            if new is not None and old is not None:
+                return abs(new - old) >= self._deadband
+        return True
+
+
+class SensorAggregate:
+    """Mean, minimum or maximum of the recent readings of a sensor.
+
+    Energy meters and weather stations report every few seconds. Rather
+    than publish every sample, the samples are kept in a fixed size ring
+    buffer of plain doubles and the aggregate over the window is only
+    worked out, and published, once per window. A window is closed by
+    the first reading after it, so the readings before a gap are still
+    published together with that reading.
+    """
+
+    def __init__(self, mode: str, window: float, size: int = AGGREGATE_SIZE) -> None:
+        """Initialize the aggregate."""
+        self._mode = mode
+        self._window = window
+        self._times = array("d", bytes(8 * size))
+        self._values = array("d", bytes(8 * size))
+        self._start = 0
+        self._count = 0
+        self._published: float | None = None
+        self.value: float | None = None
+
+    def add(self, value: Any) -> bool:
+        """Add a reading and return whether the aggregate is due to publish."""
+        if (sample := _as_float(value)) is None:
+            # Show the reading itself, and start a new window with the next
+            self._count = 0
+            self._published = None
+            self.value = None
+            return True
+        now = time.monotonic()
+        size = len(self._values)
+        end = (self._start + self._count) % size
+        self._times[end] = now
+        self._values[end] = sample
+        if self._count == size:
+            self._start = (self._start + 1) % size
+        else:
+            self._count += 1
+
+        if (since := self._published) is not None and now - since < self._window:
+            return False
+        self._published = now
+        self.value = self._aggregate(since)
+        return True
+
+    def _aggregate(self, since: float | None) -> float:
+        """Return the aggregate of the readings since the last one published."""
+        size = len(self._values)
+        samples = [
+            self._values[index]
+            for index in (
+                (self._start + offset) % size for offset in range(self._count)
+            )
+            if since is None or self._times[index] > since
+        ]
+        if self._mode == "mean":
+            value = sum(samples) / len(samples)
+        elif self._mode == "min":
+            value = min(samples)
+        else:
+            value = max(samples)
+        return round(value, 2)
+
+
+class SensorBundle:
+    """The sensors of one device, updated together from each packet.
+
+    A single packet usually carries several values, such as temperature,
+    humidity, battery and signal level, each shown by its own sensor.
+    The bundle looks up the sensors for the values in the packet once,
+    rather than every sensor checking every packet for itself.
+    """
+
+    def __init__(self, device_id: DeviceTuple) -> None:
+        """Initialize the bundle."""
+        self.device_id = device_id
+        self.sensors: dict[str, RfxtrxSensor] = {}
+
+    @callback
+    def async_handle_event(self, event: rfxtrxmod.RFXtrxEvent) -> None:
+        """Update the sensors for the values in a packet."""
+        values = event.values
+        sensors = [
+            sensor
+            for sensor in self.sensors.values()
+            if sensor._myattr_value_key in values and _should_write(sensor, values)
+        ]
+        if not sensors:
+            return
+
+        _LOGGER.debug(
+            "Sensor update (Device ID: %s Class: %s Sub: %s Sensors: %s)",
+            event.device.id_string,
+            event.device.__class__.__name__,
+            event.device.subtype,
+            len(sensors),
+        )
+        for sensor in sensors:
+            sensor._apply_event(event)
+        for sensor in sensors:
+            sensor.async_write_ha_state()
+
+
+def _should_write(sensor: RfxtrxSensor, values: dict[str, Any]) -> bool:
+    """Return whether a reading in a packet should be written to a sensor."""
+    value = sensor.entity_description.convert(values[sensor._myattr_value_key])
+    if (aggregate := sensor._myattr_aggregate) is not None:
+        if not aggregate.add(value):
+            return False
+        if aggregate.value is not None:
+            value = aggregate.value
+    return (throttle := sensor._myattr_throttle) is None or throttle.should_write(
+        value
+    )
+
+
+class SensorIndex:
+    """Index of the sensor bundles of a config entry by device.
+
+    One dispatcher listener serves every sensor: each packet is passed
+    to the bundle of its device, if there is one, with a single lookup.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._bundles: dict[DeviceTuple, SensorBundle] = {}
+
+    @callback
+    def async_setup(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+        """Start passing packets to the sensor bundles."""
+        config_entry.async_on_unload(
+            async_dispatcher_connect(hass, SIGNAL_EVENT, self._async_handle_event)
+        )
+
+    @callback
+    def async_add(self, sensor: RfxtrxSensor) -> CALLBACK_TYPE:
+        """Add a sensor to the bundle of its device."""
+        device_id = sensor._device_id
+        key = cast(str, sensor.unique_id)
+        if (bundle := self._bundles.get(device_id)) is None:
+            bundle = self._bundles[device_id] = SensorBundle(device_id)
+        bundle.sensors[key] = sensor
+
+        @callback
+        def _async_remove() -> None:
+            if bundle.sensors.get(key) is sensor:
+                del bundle.sensors[key]
+            if not bundle.sensors and self._bundles.get(device_id) is bundle:
+                del self._bundles[device_id]
+
+        return _async_remove
+
+    @callback
+    def _async_handle_event(
+        self, event: rfxtrxmod.RFXtrxEvent, device_id: DeviceTuple
+    ) -> None:
+        """Pass a packet to the bundle of its device."""
+        if (bundle := self._bundles.get(device_id)) is not None:
+            bundle.async_handle_event(event)
+
+
+def peak_descriptions(
+    descriptions: list[RfxtrxSensorEntityDescription], entity_info: dict[str, Any]
+) -> list[RfxtrxSensorEntityDescription]:
+    """Return the descriptions of the peak sensors a device has set."""
+    peaks = {
+        key
+        for key, mode in _split_option(
+            entity_info.get(CONF_SENSOR_AGGREGATE, DEF_SENSOR_AGGREGATE)
+        )
+        if mode == "peak"
+    }
+    return [
+        dataclasses.replace(
+            description,
+            key=f"{description.key}{PEAK_SUFFIX}",
+            translation_key=None,
+            name=f"{description.key}{PEAK_SUFFIX}",
+        )
+        for description in descriptions
+        if description.key in peaks
+    ]
+
+
+def init_sensors(
+    index: SensorIndex, sensors: list[Entity], entity_info: dict[str, Any]
+) -> None:
+    """Set up the sensors of a device to be updated through the index.
+
+    Each sensor is also given a throttle and an aggregate if the device
+    has them set. Peak sensors take their readings from the sensor they
+    are the peak of. The heartbeat only applies to a throttle, as
+    without a deadband or minimum interval every reading is written.
+    """
+    deadbands = parse_deadband(
+        entity_info.get(CONF_SENSOR_DEADBAND, DEF_SENSOR_DEADBAND)
+    )
+    min_interval = entity_info.get(CONF_SENSOR_MIN_INTERVAL, DEF_SENSOR_MIN_INTERVAL)
+    heartbeat = entity_info.get(CONF_SENSOR_HEARTBEAT, DEF_SENSOR_HEARTBEAT)
+    modes = parse_aggregate(
+        entity_info.get(CONF_SENSOR_AGGREGATE, DEF_SENSOR_AGGREGATE)
+    )
+    window = entity_info.get(CONF_SENSOR_WINDOW, DEF_SENSOR_WINDOW)
+
+    for sensor in sensors:
+        sensor._myattr_index = index
+        sensor._myattr_subscribe_events = False
+        key = sensor.entity_description.key
+        if key.endswith(PEAK_SUFFIX):
+            key = sensor._myattr_value_key = key.removesuffix(PEAK_SUFFIX)
+            sensor._myattr_aggregate = SensorAggregate("max", window)
+        elif (mode := modes.get(key)) not in (None, "peak"):
+            sensor._myattr_aggregate = SensorAggregate(mode, window)
+        if deadbands or min_interval:
+            sensor._myattr_throttle = SensorThrottle(
+                deadbands.get(key, deadbands.get(None, 0)), min_interval, heartbeat
+            )
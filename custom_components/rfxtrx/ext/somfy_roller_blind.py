@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable
+import itertools
 import logging
+from types import MappingProxyType
 from typing import Any
 
 import RFXtrx as rfxtrxmod
@@ -20,6 +22,7 @@ from homeassistant.core import callback
 
 from ..entity import RfxtrxCommandEntity
 from .const import (
+    ATTR_WAIT,
     CONF_CLOSE_SECONDS,
     CONF_COLOUR_ICON,
     CONF_CUSTOM_ICON,
@@ -29,6 +32,7 @@ from .const import (
     CONF_SIGNAL_REPETITIONS,
     CONF_SIGNAL_REPETITIONS_DELAY_MS,
     CONF_SYNC_SECONDS,
+    CONF_WAIT_FOR_MOVE,
     DEF_CLOSE_SECONDS,
     DEF_COLOUR_ICON,
     DEF_CUSTOM_ICON,
@@ -37,7 +41,12 @@ from .const import (
     DEF_ROLLER_MID_ON_CLOSE,
     DEF_SIGNAL_REPETITIONS_DELAY_MS,
     DEF_SYNC_SECONDS,
+    DEF_WAIT_FOR_MOVE,
 )
+from .group import GroupMixin
+from .movement import MovementMixin
+from .state_writer import CoalescedWriteMixin
+from .trace import trace
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -57,7 +66,9 @@ ICON_BLIND_CLOSED = "mdi:roller-shade-closed"
 # Event 071a000002010101 Kitchen
 
 
-class SomfyRollerBlind(RfxtrxCommandEntity, CoverEntity):
+class SomfyRollerBlind(
+    RfxtrxCommandEntity, CoverEntity, MovementMixin, CoalescedWriteMixin, GroupMixin
+):
     """Representation of a SomfyRollerBlind RFXtrx cover supporting lift."""
 
     _device: rfxtrxmod.RollerTrolDevice | rfxtrxmod.RfyDevice | rfxtrxmod.LightingDevice
@@ -109,37 +120,41 @@ class SomfyRollerBlind(RfxtrxCommandEntity, CoverEntity):
         self._myattr_close_to_mid = entity_info.get(
             CONF_ROLLER_MID_ON_CLOSE, DEF_ROLLER_MID_ON_CLOSE
         )
+        self._myattr_wait_for_move = entity_info.get(
+            CONF_WAIT_FOR_MOVE, DEF_WAIT_FOR_MOVE
+        )
 
         self._myattr_lift_step = LIFT_POS_CLOSED
 
+        self._myattr_move_target: int | None = None
+        self._myattr_move_origin = 0
+        self._myattr_lift_estimate: float | None = None
+        self._myattr_motor_running = False
+        self._init_group(device_id, entity_info)
+        self._init_resync(entity_info)
+        self._init_pictures()
+
     async def async_added_to_hass(self) -> None:
         """Restore device state."""
         await super().async_added_to_hass()
 
         if self._event is None:
             old_state = await self.async_get_last_state()
-            if old_state is not None:
-                old_pos = old_state.attributes["current_position"]
+            if (
+                old_state is not None
+                and (old_pos := old_state.attributes.get("current_position"))
+                is not None
+            ):
                 _LOGGER.info("async_added_to_hass: old_pos = %s", old_pos)
 
                 self._set_position(self._pos_to_steps(old_pos))
 
     async def async_set_cover_position(self, **kwargs: Any) -> None:
         """Move the cover to a specific position."""
-        if not (self._is_moving):
-            if ATTR_POSITION in kwargs:
-                position = kwargs[ATTR_POSITION]
-                if position > 85:
-                    _LOGGER.debug("async_set_cover_position: opening cover")
-                    await self._async_move_blind_to_step(LIFT_POS_OPEN)
-                elif position < 15:
-                    _LOGGER.debug("async_set_cover_position: closing cover")
-                    await self._async_move_blind_to_step(LIFT_POS_CLOSED)
-                else:
-                    _LOGGER.debug("async_set_cover_position: closing cover to PARTIAL")
-                    await self._async_move_blind_to_step(LIFT_POS_MID)
-        else:
-            _LOGGER.debug("async_set_cover_position: cover is in motion - ignoring")
+        if ATTR_POSITION in kwargs:
+            step = self._position_step(kwargs[ATTR_POSITION])
+            _LOGGER.debug("async_set_cover_position: moving cover to step %s", step)
+            await self._async_move_to(step, kwargs.get(ATTR_WAIT))
 
     async def async_toggle(self, **kwargs: Any) -> None:
         """Toggle the entity."""
@@ -152,23 +167,17 @@ class SomfyRollerBlind(RfxtrxCommandEntity, CoverEntity):
 
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Move the cover up."""
-        if not (self._is_moving):
-            _LOGGER.debug("async_open_cover: RAISING cover")
-            await self._async_move_blind_to_step(LIFT_POS_OPEN)
-        else:
-            _LOGGER.debug("async_open_cover: cover is in motion - ignoring")
+        _LOGGER.debug("async_open_cover: RAISING cover")
+        await self._async_move_to(LIFT_POS_OPEN, kwargs.get(ATTR_WAIT))
 
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Move the cover down."""
-        if not (self._is_moving):
-            if self._myattr_close_to_mid:
-                _LOGGER.debug("async_close_cover: closing cover to PARTIAL")
-                await self._async_move_blind_to_step(LIFT_POS_MID)
-            else:
-                _LOGGER.debug("async_close_cover: closing cover to CLOSED")
-                await self._async_move_blind_to_step(LIFT_POS_CLOSED)
+        if self._myattr_close_to_mid:
+            _LOGGER.debug("async_close_cover: closing cover to PARTIAL")
+            await self._async_move_to(LIFT_POS_MID, kwargs.get(ATTR_WAIT))
         else:
-            _LOGGER.debug("async_close_cover: cover is in motion - ignoring")
+            _LOGGER.debug("async_close_cover: closing cover to CLOSED")
+            await self._async_move_to(LIFT_POS_CLOSED, kwargs.get(ATTR_WAIT))
 
     async def async_stop_cover(self, **kwargs: Any) -> None:
         """Stop the cover."""
@@ -176,15 +185,16 @@ class SomfyRollerBlind(RfxtrxCommandEntity, CoverEntity):
             _LOGGER.debug("async_stop_cover: cover is not in motion - ignoring")
         else:
             _LOGGER.debug("async_stop_cover: stopping cover")
+            self._async_cancel_movement()
             self._attr_is_closing = False
-            self._attr_is_open = False
+            self._attr_is_opening = False
             self.async_write_ha_state()
 
             await self._async_stop_blind()
 
     async def async_update_cover_position(self, **kwargs) -> None:
         """Update the internal position."""
-        _LOGGER.info("Invoked async_update_cover_position")
+        _LOGGER.debug("Invoked async_update_cover_position")
 
     def _apply_event(self, event: rfxtrxmod.RFXtrxEvent) -> None:
         """Apply command from rfxtrx."""
@@ -207,49 +217,190 @@ class SomfyRollerBlind(RfxtrxCommandEntity, CoverEntity):
         return self._attr_is_opening or self._attr_is_closing
 
     @property
-    def entity_picture(self):
-        """Return the icon property."""
-        if self._myattr_custom_icon:
-            if self._is_moving:
-                entity_picture = "move.svg"
-                closed = False
-            elif self._myattr_lift_step == LIFT_POS_OPEN:
-                entity_picture = "99.svg"
-                closed = False
-            elif self._myattr_lift_step == LIFT_POS_MID:
-                entity_picture = "50.svg"
-                closed = self._myattr_partial_is_closed
-            else:
-                entity_picture = "00.svg"
-                closed = True
-
-            if self._myattr_colour_open and not (closed):
-                entity_picture = ICON_PATH + "/active/" + entity_picture
-            else:
-                entity_picture = ICON_PATH + "/inactive/" + entity_picture
-
-            _LOGGER.debug("Returned entity_picture attribute = %s", entity_picture)
-            return entity_picture
-
-        return None
+    def entity_picture(self) -> str | None:
+        """Return the entity picture to use in the frontend."""
+        return self._myattr_pictures.get(self._picture_key())
 
     @property
     def icon(self) -> str | None:
         """Icon of the entity."""
-        if not (self._myattr_custom_icon):
-            if self._is_moving:
-                icon = ICON_BLIND_MID
-            elif self._myattr_lift_step == LIFT_POS_OPEN:
-                icon = ICON_BLIND_OPEN
-            elif self._myattr_lift_step == LIFT_POS_MID:
-                icon = ICON_BLIND_MID
+        return self._myattr_icons.get(self._picture_key())
+
+    def _picture_key(self) -> tuple[bool, int]:
+        """Return the key of the current state in the picture tables."""
+        return (bool(self._is_moving), self._myattr_lift_step)
+
+    def _init_pictures(self) -> None:
+        """Work out the picture or icon for every state up front.
+
+        The options that pick a picture do not change once the entity is
+        created, so a state write only needs to look the state up.
+        """
+        pictures: dict[tuple[bool, int], str | None] = {}
+        icons: dict[tuple[bool, int], str | None] = {}
+        for key in itertools.product(
+            (False, True), (LIFT_POS_CLOSED, LIFT_POS_MID, LIFT_POS_OPEN)
+        ):
+            if self._myattr_custom_icon:
+                pictures[key] = self._entity_picture(*key)
             else:
-                icon = ICON_BLIND_CLOSED
+                icons[key] = self._icon(*key)
+        self._myattr_pictures = MappingProxyType(pictures)
+        self._myattr_icons = MappingProxyType(icons)
+
+    def _entity_picture(self, is_moving: bool, lift_step: int) -> str:
+        """Return the entity_picture property for a state."""
+        if is_moving:
+            entity_picture = "move.svg"
+            closed = False
+        elif lift_step == LIFT_POS_OPEN:
+            entity_picture = "99.svg"
+            closed = False
+        elif lift_step == LIFT_POS_MID:
+            entity_picture = "50.svg"
+            closed = self._myattr_partial_is_closed
+        else:
+            entity_picture = "00.svg"
+            closed = True
+
+        if self._myattr_colour_open and not (closed):
+            return ICON_PATH + "/active/" + entity_picture
+        return ICON_PATH + "/inactive/" + entity_picture
+
+    def _icon(self, is_moving: bool, lift_step: int) -> str:
+        """Return the icon property for a state."""
+        if is_moving:
+            return ICON_BLIND_MID
+        if lift_step == LIFT_POS_OPEN:
+            return ICON_BLIND_OPEN
+        if lift_step == LIFT_POS_MID:
+            return ICON_BLIND_MID
+        return ICON_BLIND_CLOSED
+
+    async def _async_move_to(self, step: int, wait: bool | None) -> None:
+        """Move the blind to a preset position, preempting any movement."""
+        if (
+            not self._is_moving
+            and self._at_target(step)
+            and self._skip_redundant_move()
+        ):
+            _LOGGER.debug("_async_move_to: already at target - skipping")
+            trace(self.hass, self.entity_id, "skip", str(step))
+            return
+        if self._is_moving:
+            if step == self._myattr_move_target:
+                _LOGGER.debug("_async_move_to: already moving to target - ignoring")
+                return
+            self._preempt_movement()
+
+        self._myattr_move_target = step
+        trace(self.hass, self.entity_id, "move", str(step), self._lift_secs(step))
+        self._myattr_move_origin = self._attr_current_cover_position
+        await self._async_run_movement(self._async_move_blind_to_step(step), wait)
+
+    def _preempt_movement(self) -> None:
+        """Abandon the movement in progress, estimating where the blind got to.
+
+        The blind is assumed to travel at a constant rate so the position is
+        interpolated from the time spent travelling.
+        """
+        fraction = self._travel_fraction()
+        motor_running = fraction is None or fraction < 1
+        trace(
+            self.hass,
+            self.entity_id,
+            "preempt",
+            str(self._myattr_move_target),
+            self._move_secs,
+            None if fraction is None else fraction * self._move_secs,
+        )
+        self._async_cancel_movement()
 
-            _LOGGER.debug("Returned icon attribute = %s", icon)
-            return icon
+        if self._myattr_move_target is None or fraction is None:
+            self._attr_is_opening = False
+            self._attr_is_closing = False
+        else:
+            origin = self._myattr_move_origin
+            target_position = self._steps_to_pos(self._myattr_move_target)
+            estimate = origin + (target_position - origin) * fraction
+            self._set_position(self._pos_to_steps(estimate))
+            self._attr_current_cover_position = round(estimate)
+            self._myattr_lift_estimate = estimate
+
+        self._myattr_motor_running = motor_running
+        _LOGGER.debug(
+            "_preempt_movement: position estimate = %s motor running = %s",
+            self._attr_current_cover_position,
+            motor_running,
+        )
+
+    def _position_step(self, position: int) -> int:
+        """Return the preset position for a HA position."""
+        if position > 85:
+            return LIFT_POS_OPEN
+        if position < 15:
+            return LIFT_POS_CLOSED
+        return LIFT_POS_MID
+
+    def _scene_target(self, position: int | None, tilt_position: int | None) -> int:
+        """Return the preset position a scene position maps to."""
+        if position is None:
+            return self._myattr_lift_step
+        return self._position_step(position)
+
+    def _at_target(self, target: int) -> bool:
+        """Return whether the cover is at, or already heading for, a target."""
+        if self._is_moving:
+            return target == self._myattr_move_target
+        return target == self._myattr_lift_step
+
+    def _scene_secs(self, target: int) -> float:
+        """Return the expected time for the cover to reach a target."""
+        return self._lift_secs(target)
+
+    async def _async_start_scene_move(self, target: int) -> None:
+        """Start moving to a target, returning once the first frame is sent."""
+        await self._async_move_to(target, False)
+
+    def _lift_secs(self, step: int) -> float:
+        """Return the time to allow for the blind to reach a preset position.
+
+        After a preempted movement the time is scaled to the distance left
+        from the estimated position.
+        """
+        estimate = self._myattr_lift_estimate
+        if step == LIFT_POS_OPEN:
+            if estimate is None:
+                return self._myattr_open_secs
+            secs = self._myattr_open_secs * (100 - estimate) / 100
+        elif step == LIFT_POS_CLOSED:
+            if estimate is None:
+                return self._myattr_close_secs
+            secs = self._myattr_close_secs * estimate / 100
+        else:
+            return self._myattr_open_secs
+        return max(secs, self._myattr_sync_secs)
+
+    def _group_state(self) -> tuple[int, bool | None, bool | None, int | None]:
+        """Return the state model to copy to the group members."""
+        return (
+            self._myattr_lift_step,
+            self._attr_is_opening,
+            self._attr_is_closing,
+            self._attr_current_cover_position,
+        )
 
-        return None
+    def _apply_group_state(
+        self, state: tuple[int, bool | None, bool | None, int | None]
+    ) -> None:
+        """Take on the state model of a group."""
+        lift_step, is_opening, is_closing, position = state
+        # The group frame has taken over from anything this blind was doing
+        self._async_cancel_movement()
+        self._set_position(lift_step)
+        self._attr_is_opening = is_opening
+        self._attr_is_closing = is_closing
+        self._attr_current_cover_position = position
 
     def _pos_to_steps(self, position) -> int:
         return int(round(position / (100 / LIFT_POS_OPEN)))
@@ -268,6 +419,9 @@ class SomfyRollerBlind(RfxtrxCommandEntity, CoverEntity):
         """Translate my lift position to HA position
         None is unknown, 0 is closed, 100 is fully open."""
 
+        self._myattr_lift_estimate = None
+        self._myattr_motor_running = False
+
         if self._myattr_lift_step == LIFT_POS_CLOSED:
             self._attr_is_closed = True
             self._attr_current_cover_position = 0
@@ -289,7 +443,7 @@ class SomfyRollerBlind(RfxtrxCommandEntity, CoverEntity):
 
     async def _async_wait_and_set_position(self, delay, step) -> None:
         if delay > 0:
-            _LOGGER.info("_async_wait_and_set_position: Waiting secs = %s", delay)
+            _LOGGER.debug("_async_wait_and_set_position: Waiting secs = %s", delay)
 
             if step == LIFT_POS_CLOSED or self._myattr_partial_is_closed:
                 self._attr_is_closing = True
@@ -297,39 +451,40 @@ class SomfyRollerBlind(RfxtrxCommandEntity, CoverEntity):
                 self._attr_is_opening = True
             self.async_write_ha_state()
 
+            self._start_travel(delay)
             await asyncio.sleep(delay)
 
         # If the blind is still closing then we have finished. Otherwise assume we were interrupted
         if self._is_moving:
-            _LOGGER.info(
+            _LOGGER.debug(
                 "_async_wait_and_set_position: Finished blind action, setting state"
             )
             self._set_position(step)
             self.async_write_ha_state()
         else:
-            _LOGGER.info(
+            _LOGGER.debug(
                 "_async_wait_and_set_position: Finished blind action, state not as expected - not saving new state"
             )
 
     async def _async_raise_blind(self) -> None:
         """Lift the cover."""
-        _LOGGER.info("Invoked _async_raise_blind")
+        _LOGGER.debug("Invoked _async_raise_blind")
         await self._async_move_blind_to_step(LIFT_POS_OPEN)
 
     async def _async_lower_blind(self) -> None:
         """Lower the cover."""
-        _LOGGER.info("Invoked _async_lower_blind")
+        _LOGGER.debug("Invoked _async_lower_blind")
         await self._async_move_blind_to_step(LIFT_POS_CLOSED)
 
     async def _async_stop_blind(self) -> None:
         """Stop the cover."""
-        _LOGGER.info("Invoked _async_stop_blind")
+        _LOGGER.debug("Invoked _async_stop_blind")
 
         await self._async_send(self._device.send_stop)
 
     async def _async_move_blind_to_step(self, step) -> None:
         """Move the cover to a preset position."""
-        _LOGGER.info("Invoked _async_move_blind_to_step; step = %s", step)
+        _LOGGER.debug("Invoked _async_move_blind_to_step; step = %s", step)
 
         if step == LIFT_POS_OPEN:
             self._attr_is_opening = True
@@ -339,7 +494,7 @@ class SomfyRollerBlind(RfxtrxCommandEntity, CoverEntity):
             _LOGGER.debug("_async_move_blind_to_step; sending UP and waiting")
             await self._async_send(self._device.send_up05sec)
             await self._async_wait_and_set_position(
-                self._myattr_open_secs, LIFT_POS_OPEN
+                self._lift_secs(LIFT_POS_OPEN), LIFT_POS_OPEN
             )
 
         elif step == LIFT_POS_MID:
@@ -348,10 +503,17 @@ class SomfyRollerBlind(RfxtrxCommandEntity, CoverEntity):
             self._attr_current_cover_position = 50
             self.async_write_ha_state()
 
+            # A stop while the motor is running only halts it, so halt
+            # a preempted movement before asking for the mid point
+            if self._myattr_motor_running:
+                _LOGGER.debug("_async_move_blind_to_step; halting motor")
+                await self._async_send(self._device.send_stop)
+                await asyncio.sleep(self._myattr_repetition_delay)
+
             _LOGGER.debug("_async_move_blind_to_step; sending STOP and waiting")
             await self._async_send(self._device.send_stop)
             await self._async_wait_and_set_position(
-                self._myattr_open_secs, LIFT_POS_MID
+                self._lift_secs(LIFT_POS_MID), LIFT_POS_MID
             )
 
         elif step == LIFT_POS_CLOSED:
@@ -362,21 +524,23 @@ class SomfyRollerBlind(RfxtrxCommandEntity, CoverEntity):
             _LOGGER.debug("_async_move_blind_to_step; sending DOWN and waiting")
             await self._async_send(self._device.send_down05sec)
             await self._async_wait_and_set_position(
-                self._myattr_close_secs, LIFT_POS_CLOSED
+                self._lift_secs(LIFT_POS_CLOSED), LIFT_POS_CLOSED
             )
 
     async def _async_send(
         self, fun: Callable[[rfxtrxmod.PySerialTransport, *_Ts], None], *args: *_Ts
     ) -> None:
         """Send a command to the motor."""
-        _LOGGER.info("Invoked _async_send; command = %s", fun.__name__)
+        _LOGGER.debug("Invoked _async_send; command = %s", fun.__name__)
         await super()._async_send(fun, *args)
+        trace(self.hass, self.entity_id, "tx", fun.__name__)
+        self._notify_frame_sent()
 
     async def _async_send_repeat(
         self, fun: Callable[[rfxtrxmod.PySerialTransport, *_Ts], None], *args: *_Ts
     ) -> None:
         """Repeating send a command to the motor."""
-        _LOGGER.info("Invoked _async_send_repeat; command = %s", fun.__name__)
+        _LOGGER.debug("Invoked _async_send_repeat; command = %s", fun.__name__)
 
         if self._myattr_repetitions >= 2:
             for _ in range(self._myattr_repetitions - 1):
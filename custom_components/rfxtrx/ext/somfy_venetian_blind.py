@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any
+from typing import Any, NamedTuple
 
 import RFXtrx as rfxtrxmod
 
@@ -17,6 +17,7 @@ from .abs_tilting_cover import (
     TILT_MIN_STEP,
     AbstractTiltingCover,
 )
+from .const import CONF_TILT_PRESS_MS, DEF_TILT_PRESS_MS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,6 +25,10 @@ ICON_PATH = "/hacsfiles/rfxtrx-stateful-blinds-icons/icons/venetian"
 MANUFACTURER_NAME = "Somfy"
 DEVICE_TYPE = "Venetian Blind"
 
+# Native 2 s presses a tilt pulse may be sent as
+NATIVE_MAX_PRESSES = 2
+NATIVE_TOLERANCE_SECS = 0.15
+
 # Event 071a000001010101 Office
 # Event 071a000001020101 Front
 # Event 071a000001030101 Back
@@ -35,6 +40,16 @@ DEVICE_TYPE = "Venetian Blind"
 # Event 071a00000106ff01 Living all
 
 
+class TiltStep(NamedTuple):
+    """A step in a planned tilt movement."""
+
+    command: str
+    frames: int
+    secs: float
+    stop: bool
+    tilt_step: int | None
+
+
 class SomfyVenetianBlind(AbstractTiltingCover):
     """Representation of a SomfyVenetianBlind RFXtrx cover."""
 
@@ -56,27 +71,35 @@ class SomfyVenetianBlind(AbstractTiltingCover):
             {ATTR_MANUFACTURER: MANUFACTURER_NAME, ATTR_MODEL: DEVICE_TYPE}
         )
 
-    def _entity_picture(self) -> str | None:
-        """Return the entity_picture property."""
-        if self._is_moving:
+        # How far the blind tilts for one native 2 s press, which depends
+        # on the motor and is off unless it has been measured
+        self._myattr_tilt_press_secs = (
+            entity_info.get(CONF_TILT_PRESS_MS, DEF_TILT_PRESS_MS) / 1000
+        )
+
+    def _entity_picture(
+        self, is_moving: bool, is_raised: bool, tilt_step: int
+    ) -> str | None:
+        """Return the entity_picture property for a state."""
+        if is_moving:
             icon = "move.svg"
             closed = False
-        elif self._myattr_is_raised:
+        elif is_raised:
             icon = "up.svg"
             closed = False
-        elif self._myattr_tilt_step == TILT_MIN_STEP:
+        elif tilt_step == TILT_MIN_STEP:
             icon = "10.svg"
             closed = True
-        elif self._myattr_tilt_step == 1:
+        elif tilt_step == 1:
             icon = "20.svg"
             closed = self._myattr_partial_is_closed
-        elif self._myattr_tilt_step == TILT_MID_STEP:
+        elif tilt_step == TILT_MID_STEP:
             icon = "50.svg"
             closed = False
-        elif self._myattr_tilt_step == 3:
+        elif tilt_step == 3:
             icon = "80.svg"
             closed = self._myattr_partial_is_closed
-        elif self._myattr_tilt_step == TILT_MAX_STEP:
+        elif tilt_step == TILT_MAX_STEP:
             icon = "90.svg"
             closed = True
         else:
@@ -92,36 +115,28 @@ class SomfyVenetianBlind(AbstractTiltingCover):
 
     async def _async_raise_blind(self) -> None:
         """Lift the cover."""
-        _LOGGER.info("Invoked _async_raise_blind")
+        _LOGGER.debug("Invoked _async_raise_blind")
 
-        sync_time = (
-            self._myattr_sync_secs if self._myattr_is_raised else self._myattr_open_secs
-        )
+        sync_time = self._lift_secs(True)
         await self._async_send_repeat(self._device.send_up05sec)
         await self._async_wait_and_set_position(sync_time, True, 0)
 
     async def _async_lower_blind(self) -> None:
         """Lower the cover."""
-        _LOGGER.info("Invoked _async_lower_blind")
+        _LOGGER.debug("Invoked _async_lower_blind")
 
-        sync_time = (
-            self._myattr_sync_secs
-            if not (self._myattr_is_raised)
-            else self._myattr_close_secs
-        )
+        sync_time = self._lift_secs(False)
         await self._async_send_repeat(self._device.send_down05sec)
         await self._async_wait_and_set_position(sync_time, False, 0)
 
     async def _async_stop_blind(self) -> None:
         """Stop the cover."""
-        _LOGGER.info("Invoked _async_stop_blind")
+        _LOGGER.debug("Invoked _async_stop_blind")
         await self._async_send(self._device.send_stop)
 
     async def _async_tilt_blind_to_step(self, tilt_step) -> None:
         """Move the cover tilt to a preset position."""
-        _LOGGER.info(
-            "Invoked _async_tilt_blind_to_mid_step; tilt_step = " + str(tilt_step)
-        )
+        _LOGGER.debug("Invoked _async_tilt_blind_to_step; tilt_step = %s", tilt_step)
 
         # Somfy cannot tilt fully up so instead switch to full down
         if tilt_step >= TILT_MAX_STEP:
@@ -130,49 +145,85 @@ class SomfyVenetianBlind(AbstractTiltingCover):
         if tilt_step == TILT_MIN_STEP:
             _LOGGER.debug("_async_tilt_blind_to_step; tilting to CLOSED and waiting")
             await self._async_lower_blind()
-        else:
-            # Move to mid point if not already there or if we've been told to go there
-            if tilt_step == TILT_MID_STEP or self._myattr_tilt_step != TILT_MID_STEP:
-                sync_time = (
-                    self._myattr_sync_secs
-                    if not (self._myattr_is_raised)
-                    else self._myattr_close_secs
-                )
-
-                _LOGGER.debug(
-                    "_async_tilt_blind_to_step; tilting to MID and waiting "
-                    + str(sync_time)
+            return
+
+        for step in self._plan_tilt(tilt_step):
+            _LOGGER.debug("_async_tilt_blind_to_step; %s", step)
+            if step.tilt_step is None:
+                await self._async_send(getattr(self._device, step.command))
+                await asyncio.sleep(step.secs)
+            elif step.tilt_step == TILT_MID_STEP:
+                await self._async_send(getattr(self._device, step.command))
+                await self._async_wait_and_set_position(
+                    step.secs, False, step.tilt_step
                 )
-                await self._async_send(self._device.send_stop)
-                await self._async_wait_and_set_position(sync_time, False, tilt_step)
-
-            if tilt_step == 1:
+            else:
                 self._attr_is_closing = self._myattr_partial_is_closed
                 self._attr_is_opening = not (self._myattr_partial_is_closed)
                 self.async_write_ha_state()
 
-                _LOGGER.debug(
-                    "_async_tilt_blind_to_step; tilting DOWN and waiting "
-                    + str(self._myattr_tilt_pos1_secs)
-                )
-                await self._async_send(self._device.send_down05sec)
-                await asyncio.sleep(self._myattr_tilt_pos1_secs)
-
-                await self._async_send(self._device.send_stop)
-                self._set_position(False, tilt_step)
-                self.async_write_ha_state()
-            elif tilt_step == 3:
-                self._attr_is_closing = self._myattr_partial_is_closed
-                self._attr_is_opening = not (self._myattr_partial_is_closed)
+                if step.stop:
+                    await self._async_send_pulse(
+                        getattr(self._device, step.command), step.secs
+                    )
+                else:
+                    for _ in range(step.frames):
+                        await self._async_send(getattr(self._device, step.command))
+                        self._start_travel(step.secs)
+                        await asyncio.sleep(step.secs)
+
+                self._set_position(False, step.tilt_step)
                 self.async_write_ha_state()
 
-                _LOGGER.debug(
-                    "_async_tilt_blind_to_step; tilting UP and waiting "
-                    + str(self._myattr_tilt_pos2_secs)
-                )
-                await self._async_send(self._device.send_up05sec)
-                await asyncio.sleep(self._myattr_tilt_pos2_secs)
+    def _plan_tilt(self, tilt_step: int) -> list[TiltStep]:
+        """Plan the shortest sequence of frames to reach a partial tilt step.
+
+        The mid point is the only tilt position the motor knows, so the
+        blind is sent there first unless it is already resting there. Each
+        partial step is reached from the mid point so that any error in
+        the pulse does not build up from one move to the next. If the tilt
+        of a native 2 s press has been set, a pulse that is a whole number
+        of presses is sent with them, avoiding the stop frame which would
+        send the blind to the mid point if it arrived late.
+        """
+        plan: list[TiltStep] = []
+        direct = (
+            not (self._myattr_is_raised)
+            and not (self._myattr_motor_running)
+            and self._myattr_tilt_step == TILT_MID_STEP
+        )
 
-                await self._async_send(self._device.send_stop)
-                self._set_position(False, tilt_step)
-                self.async_write_ha_state()
+        if tilt_step == TILT_MID_STEP or not direct:
+            # A stop while the motor is running only halts it, so halt
+            # a preempted movement before asking for the mid point
+            if self._myattr_motor_running:
+                plan.append(
+                    TiltStep("send_stop", 1, self._myattr_repetition_delay, False, None)
+                )
+            plan.append(
+                TiltStep("send_stop", 1, self._lift_secs(False), False, TILT_MID_STEP)
+            )
+
+        if tilt_step == 1:
+            plan.append(self._plan_pulse(-self._myattr_tilt_pos1_secs, tilt_step))
+        elif tilt_step == 3:
+            plan.append(self._plan_pulse(self._myattr_tilt_pos2_secs, tilt_step))
+
+        return plan
+
+    def _plan_pulse(self, secs: float, tilt_step: int) -> TiltStep:
+        """Plan a tilt pulse of secs, positive for up and negative for down."""
+        up = secs > 0
+        secs = abs(secs)
+
+        if (press_secs := self._myattr_tilt_press_secs) > 0:
+            presses = round(secs / press_secs)
+            if (
+                1 <= presses <= NATIVE_MAX_PRESSES
+                and abs(secs - presses * press_secs) <= NATIVE_TOLERANCE_SECS
+            ):
+                command = "send_up2sec" if up else "send_down2sec"
+                return TiltStep(command, presses, press_secs, False, tilt_step)
+
+        command = "send_up05sec" if up else "send_down05sec"
+        return TiltStep(command, 1, secs, True, tilt_step)
@@ -0,0 +1,76 @@
+"""Coalesced state writes for RFXtrx stateful covers."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.entity import Entity
+
+
+class CoalescedWriteMixin(Entity):
+    """Mixin to merge the state writes made by a cover.
+
+    A single command typically sets the moving flags, an interim position
+    and the final state one after the other, writing the state each time.
+    Instead the first write is deferred to the next iteration of the event
+    loop and any further writes before then are folded into it. When the
+    write does happen it is dropped if nothing visible has changed since
+    the last one, so callers do not need to check for changes themselves.
+    The registry and device entries are part of what is compared, as HA
+    writes the state itself when either is updated, such as on a rename.
+    """
+
+    _write_handle: asyncio.Handle | None = None
+    _myattr_written: tuple[Any, ...] | None = None
+    _myattr_writes: int = 0
+    _myattr_writes_saved: int = 0
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state once the current loop iteration is done."""
+        self._myattr_writes += 1
+        if self._write_handle is not None:
+            self._myattr_writes_saved += 1
+            return
+        self._write_handle = self.hass.loop.call_soon(self._async_flush_state)
+
+    @callback
+    def _async_flush_state(self) -> None:
+        """Write the state if anything has changed since it was last written."""
+        self._write_handle = None
+        if self.hass is None or self.entity_id is None:
+            return
+
+        written = (
+            self.available,
+            self.state,
+            self.state_attributes,
+            self.extra_state_attributes,
+            self.icon,
+            self.entity_picture,
+            self.registry_entry,
+            self.device_entry,
+        )
+        if written == self._myattr_written:
+            self._myattr_writes_saved += 1
+            return
+        self._myattr_written = written
+        super().async_write_ha_state()
+
+    def write_diagnostics(self) -> dict[str, Any]:
+        """Return the state write statistics for diagnostics."""
+        return {
+            "writes": self._myattr_writes,
+            "writes_saved": self._myattr_writes_saved,
+        }
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop any write still waiting to happen."""
+        if self._write_handle is not None:
+            self._write_handle.cancel()
+            self._write_handle = None
+        # The entity may be added again, as when its entity_id is changed
+        self._myattr_written = None
+        return await super().async_will_remove_from_hass()
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+from functools import partial
 import logging
 import time
-from typing import Any
+from typing import Any, NamedTuple
 
 import RFXtrx as rfxtrxmod
 
@@ -19,24 +20,50 @@ from homeassistant.const import ATTR_MANUFACTURER, ATTR_MODEL
 from homeassistant.core import callback
 
 from .. import DeviceTuple
+from ..const import DOMAIN
 from ..entity import RfxtrxCommandEntity
 from .const import (
     CONF_CLOSE_SECONDS,
     CONF_OPEN_SECONDS,
+    DATA_FRAME_TIMER,
     DEF_CLOSE_SECONDS,
     DEF_OPEN_SECONDS,
 )
+from .frame_timer import FrameTimer, Pulse, PulseStats, PulseTiming
+from .gateway import async_get_connected_rfx
+from .group import GroupMixin
+from .state_writer import CoalescedWriteMixin
+from .trace import trace
 
 _LOGGER = logging.getLogger(__name__)
 
 MANUFACTURER_NAME = "Timed Shutter"
 DEVICE_TYPE = "Timed Shutter Blind"
 
+# Time to let the motor reach its end stop before releasing the relay
+END_STOP_SECS = 2
 
-class TimedShutterCover(RfxtrxCommandEntity, CoverEntity):
+
+class Move(NamedTuple):
+    """A movement of the cover timed from its start frame."""
+
+    start_time: float
+    start_pos: float
+    moving_up: bool
+    duration: float
+
+
+def _no_frame() -> None:
+    """Stand in for a frame that the remote has already sent."""
+
+
+class TimedShutterCover(
+    RfxtrxCommandEntity, CoverEntity, CoalescedWriteMixin, GroupMixin
+):
     """Representation of a Timed Shutter RFXtrx cover."""
 
     _device: rfxtrxmod.LightingDevice
+    _myattr_follows_group_frames = True
 
     def __init__(
         self,
@@ -71,6 +98,15 @@ class TimedShutterCover(RfxtrxCommandEntity, CoverEntity):
         self._move_task: asyncio.Task | None = None
         self._target_position: int | None = None
 
+        # The position is tracked as a float and only rounded for HA so
+        # that rounding errors do not build up over a series of moves
+        self._myattr_exact_position: float = self._attr_current_cover_position
+        self._myattr_drift = 0.0
+        self._myattr_moves_since_sync = 0
+        self._myattr_move: Move | None = None
+        self._myattr_pulse: Pulse | None = None
+        self._myattr_pulse_stats = PulseStats()
+
     async def async_added_to_hass(self) -> None:
         """Restore device state."""
         await super().async_added_to_hass()
@@ -78,10 +114,9 @@ class TimedShutterCover(RfxtrxCommandEntity, CoverEntity):
         if self._event is None:
             old_state = await self.async_get_last_state()
             if old_state is not None:
-                self._attr_current_cover_position = old_state.attributes.get(
-                    "current_position", 0
+                self._set_exact_position(
+                    old_state.attributes.get("current_position", 0)
                 )
-                self._attr_is_closed = self._attr_current_cover_position == 0
 
     @property
     def is_opening(self) -> bool:
@@ -119,7 +154,11 @@ class TimedShutterCover(RfxtrxCommandEntity, CoverEntity):
 
         skip_send = kwargs.get("skip_send", False)
         was_opening = self._attr_is_opening
+        move = self._myattr_move
 
+        # Free the slot of the pulse's own stop before sending this one
+        if self._myattr_pulse is not None:
+            self._myattr_pulse.cancel()
         if self._move_task:
             self._move_task.cancel()
             self._move_task = None
@@ -130,12 +169,28 @@ class TimedShutterCover(RfxtrxCommandEntity, CoverEntity):
 
         if not skip_send:
             _LOGGER.debug("Stopping cover by repeating last command")
-            if was_opening:
-                await self._async_send(self._device.send_on)
-            else:
-                await self._async_send(self._device.send_off)
+            command = self._device.send_on if was_opening else self._device.send_off
+            timer: FrameTimer = self.hass.data[DOMAIN][DATA_FRAME_TIMER]
+            transport = async_get_connected_rfx(self.hass).transport
+            stopped = await asyncio.wrap_future(
+                timer.send(partial(command, transport))
+            )
         else:
             _LOGGER.debug("Stopping cover (remote already sent command)")
+            stopped = time.monotonic()
+
+        trace(
+            self.hass,
+            self.entity_id,
+            "stop",
+            "remote" if skip_send else None,
+            None,
+            None if move is None else stopped - move.start_time,
+        )
+        # Correct the position to when the motor was actually stopped
+        if move is not None:
+            self._set_exact_position(self._position_at(move, stopped))
+            self.async_write_ha_state()
 
     async def async_set_cover_position(self, **kwargs: Any) -> None:
         """Move the cover to a specific position."""
@@ -147,100 +202,177 @@ class TimedShutterCover(RfxtrxCommandEntity, CoverEntity):
         if position == self._attr_current_cover_position:
             return
 
+        if self._myattr_pulse is not None:
+            self._myattr_pulse.cancel()
         if self._move_task:
             self._move_task.cancel()
 
         self._target_position = position
         self._move_task = asyncio.create_task(self._async_move_task(skip_send))
 
+    def _scene_target(self, position: int | None, tilt_position: int | None) -> int:
+        """Return the position a scene maps to."""
+        if position is None:
+            return self._attr_current_cover_position
+        return position
+
+    def _at_target(self, target: int) -> bool:
+        """Return whether the cover is at, or already heading for, a target."""
+        if self._move_task:
+            return target == self._target_position
+        return target == self._attr_current_cover_position
+
+    def _scene_secs(self, target: int) -> float:
+        """Return the expected time for the cover to reach a target."""
+        distance = target - self._myattr_exact_position
+        if distance > 0:
+            return self._myattr_open_secs * distance / 100
+        return self._myattr_close_secs * -distance / 100
+
+    async def _async_start_scene_move(self, target: int) -> None:
+        """Start moving to a target."""
+        await self._async_move_to(target, False)
+
+    def _group_state(self) -> float:
+        """Return the state model to copy to the group members."""
+        return self._myattr_exact_position
+
+    def _apply_group_state(self, state: float) -> None:
+        """Take on the state model of a group."""
+        # The group has taken over from anything this cover was doing
+        if self._move_task:
+            self._move_task.cancel()
+            self._move_task = None
+        self._attr_is_opening = False
+        self._attr_is_closing = False
+        self._set_exact_position(state)
+
     async def _async_move_task(self, skip_send: bool) -> None:
         """Update position while moving."""
-        start_pos = self._attr_current_cover_position
+        start_pos = self._myattr_exact_position
         target_pos = self._target_position
 
         moving_up = target_pos > start_pos
         self._attr_is_opening = moving_up
         self._attr_is_closing = not moving_up
 
-        # Send physical command
-        if not skip_send:
-            if moving_up:
-                await self._async_send(self._device.send_on)
-                duration = self._myattr_open_secs
-            else:
-                await self._async_send(self._device.send_off)
-                duration = self._myattr_close_secs
-        else:
-            duration = self._myattr_open_secs if moving_up else self._myattr_close_secs
-
+        duration = self._myattr_open_secs if moving_up else self._myattr_close_secs
         total_distance = abs(target_pos - start_pos)
         # Time to move the distance
         total_time = (total_distance / 100.0) * duration
 
-        start_time = time.time()
+        # The stop frame is sent by the frame timer at a fixed time after
+        # the start frame was transmitted so that the move is not
+        # lengthened by event loop or executor latency. At either end the
+        # stop is held back to let the cover reach its end stop, and then
+        # releases the relay to allow manual operation.
+        stop_time = total_time
+        if target_pos in {0, 100}:
+            stop_time += END_STOP_SECS
+
+        command = self._device.send_on if moving_up else self._device.send_off
+        timer: FrameTimer = self.hass.data[DOMAIN][DATA_FRAME_TIMER]
+        transport = async_get_connected_rfx(self.hass).transport
+        pulse = timer.pulse(
+            _no_frame if skip_send else partial(command, transport),
+            partial(command, transport),
+            stop_time,
+            stagger=not skip_send,
+        )
+        self._myattr_pulse = pulse
 
         _LOGGER.debug(
             "Moving from %s to %s (duration %s)", start_pos, target_pos, total_time
         )
+        trace(self.hass, self.entity_id, "move", str(target_pos), total_time)
 
+        move: Move | None = None
         try:
+            start_time = await asyncio.wrap_future(pulse.started)
+            move = Move(start_time, start_pos, moving_up, duration)
+            self._myattr_move = move
+
             while True:
-                elapsed = time.time() - start_time
-                if elapsed >= total_time:
+                now = time.monotonic()
+                if now - start_time >= total_time:
                     break
 
                 # Update position for UI
-                progress = elapsed / total_time
-                if moving_up:
-                    self._attr_current_cover_position = int(
-                        start_pos + progress * total_distance
-                    )
-                else:
-                    self._attr_current_cover_position = int(
-                        start_pos - progress * total_distance
-                    )
-
+                self._set_exact_position(self._position_at(move, now))
                 self.async_write_ha_state()
                 await asyncio.sleep(0.2)
 
-            # Finished
-            self._attr_current_cover_position = target_pos
-            self._attr_is_closed = self._attr_current_cover_position == 0
-
             if target_pos in {0, 100}:
-                # Wait a moment to ensure the cover has fully stopped
-                # Then send the stop command to release the relay and allow manual operation
+                # The end stop puts the cover exactly where we think it is
+                self._set_exact_position(target_pos)
+                self._myattr_drift = 0.0
+                self._myattr_moves_since_sync = 0
                 _LOGGER.debug("Cover should be fully open/closed, waiting to send stop command")
-                await asyncio.sleep(2)
-                _LOGGER.debug("The cover should now be stopped, sending stop command to release relay")
+                self._add_pulse_timing(await asyncio.wrap_future(pulse.stopped))
+                _LOGGER.debug("The cover should now be stopped, stop command sent to release relay")
             else:
-                # Send stop command if at intermediate position
                 _LOGGER.debug("Stopping cover at intermediate position")
-            if moving_up:
-                await self._async_send(self._device.send_on)
-            else:
-                await self._async_send(self._device.send_off)
+                timing = await asyncio.wrap_future(pulse.stopped)
+                self._add_pulse_timing(timing)
+                self._set_exact_position(self._position_at(move, timing.stopped))
+                self._myattr_drift += self._myattr_exact_position - target_pos
+                self._myattr_moves_since_sync += 1
+                _LOGGER.debug(
+                    "Stopped after %.3f secs at %.2f, drift now %.2f",
+                    timing.width,
+                    self._myattr_exact_position,
+                    self._myattr_drift,
+                )
 
         except asyncio.CancelledError:
             _LOGGER.debug("Movement cancelled")
+            pulse.cancel()
             # Calculate final position based on elapsed time
-            elapsed = time.time() - start_time
-            progress = min(elapsed / total_time, 1.0)
-            if moving_up:
-                self._attr_current_cover_position = int(
-                    start_pos + progress * total_distance
-                )
-            else:
-                self._attr_current_cover_position = int(
-                    start_pos - progress * total_distance
-                )
+            if move is not None:
+                self._set_exact_position(self._position_at(move, time.monotonic()))
             raise
         finally:
             self._attr_is_opening = False
             self._attr_is_closing = False
             self._move_task = None
+            if self._myattr_move is move:
+                self._myattr_move = None
+            if self._myattr_pulse is pulse:
+                self._myattr_pulse = None
             self.async_write_ha_state()
 
+    def _position_at(self, move: Move, when: float) -> float:
+        """Return the position a move has reached at a monotonic time."""
+        travelled = max(when - move.start_time, 0) / move.duration * 100
+        if move.moving_up:
+            return min(move.start_pos + travelled, 100)
+        return max(move.start_pos - travelled, 0)
+
+    def _set_exact_position(self, position: float) -> None:
+        """Set the tracked position and the rounded position shown in HA."""
+        self._myattr_exact_position = position
+        self._attr_current_cover_position = round(position)
+        self._attr_is_closed = self._attr_current_cover_position == 0
+
+    def _add_pulse_timing(self, timing: PulseTiming) -> None:
+        """Record how accurately a stop frame was sent."""
+        trace(self.hass, self.entity_id, "pulse", None, timing.requested, timing.width)
+        if self._myattr_pulse_stats.add(timing):
+            _LOGGER.warning(
+                "%s: stop frame missed its deadline by %.0f ms",
+                self.entity_id,
+                timing.error * 1000,
+            )
+
+    def timing_diagnostics(self) -> dict[str, Any]:
+        """Return the position tracking statistics for diagnostics."""
+        return {
+            "exact_position": round(self._myattr_exact_position, 2),
+            "drift": round(self._myattr_drift, 2),
+            "moves_since_sync": self._myattr_moves_since_sync,
+            **self._myattr_pulse_stats.as_dict(),
+        }
+
     def _apply_event(self, event: rfxtrxmod.RFXtrxEvent) -> None:
         """Apply command from rfxtrx (remote control)."""
         assert isinstance(event, rfxtrxmod.ControlEvent)
@@ -254,12 +386,19 @@ class TimedShutterCover(RfxtrxCommandEntity, CoverEntity):
         if device_id != self._device_id:
             return
 
+        self._apply_remote_command(event)
+        self.async_write_ha_state()
+
+    def _apply_group_event(self, event: rfxtrxmod.RFXtrxEvent) -> None:
+        """Apply a Group on/off frame sent to the house code of the cover."""
+        self._apply_remote_command(event)
+
+    def _apply_remote_command(self, event: rfxtrxmod.RFXtrxEvent) -> None:
+        """Follow a movement started by a remote."""
         # Map remote commands to actions
         # On typically opens, Off typically closes
         command = event.values.get("Command")
-        if command == "On":
+        if command in ("On", "Group on"):
             self.hass.async_create_task(self.async_open_cover(skip_send=True))
-        elif command == "Off":
+        elif command in ("Off", "Group off"):
             self.hass.async_create_task(self.async_close_cover(skip_send=True))
-
-        self.async_write_ha_state()
@@ -0,0 +1,69 @@
+"""Motion and transmit trace for RFXtrx stateful covers."""
+
+from __future__ import annotations
+
+from collections import deque
+import time
+from typing import Any, NamedTuple
+
+from homeassistant.core import HomeAssistant
+
+from ..const import DOMAIN
+from .const import DATA_TRACE
+
+# Number of trace entries kept for diagnostics
+TRACE_SIZE = 200
+
+
+class TraceEntry(NamedTuple):
+    """Something a cover did, with its planned and actual times in secs."""
+
+    when: float
+    entity_id: str | None
+    event: str
+    command: str | None
+    planned: float | None
+    actual: float | None
+
+
+class TraceBuffer:
+    """Fixed size record of the most recent cover motion and frames.
+
+    Adding an entry only appends a tuple to a bounded deque, so tracing
+    every frame costs next to nothing. Nothing is formatted until the
+    trace is read through diagnostics.
+    """
+
+    def __init__(self, size: int = TRACE_SIZE) -> None:
+        """Initialize the trace."""
+        self._entries: deque[TraceEntry] = deque(maxlen=size)
+
+    def add(
+        self,
+        entity_id: str | None,
+        event: str,
+        command: str | None = None,
+        planned: float | None = None,
+        actual: float | None = None,
+    ) -> None:
+        """Add an entry to the trace."""
+        self._entries.append(
+            TraceEntry(time.time(), entity_id, event, command, planned, actual)
+        )
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return the trace for diagnostics, oldest first."""
+        return [entry._asdict() for entry in self._entries]
+
+
+def trace(
+    hass: HomeAssistant,
+    entity_id: str | None,
+    event: str,
+    command: str | None = None,
+    planned: float | None = None,
+    actual: float | None = None,
+) -> None:
+    """Add an entry to the trace of the integration."""
+    if (buffer := hass.data[DOMAIN].get(DATA_TRACE)) is not None:
+        buffer.add(entity_id, event, command, planned, actual)
@@ -45,6 +45,11 @@ from .entity import RfxtrxEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+##############################
+from .ext import sensor as ext_sensor
+
+##############################
+
 
 def _battery_convert(value: int | None) -> int | None:
     """Battery is given as a value between 0 and 9."""
@@ -246,6 +251,11 @@ async def async_setup_entry(
 ) -> None:
     """Set up config entry."""
 
+    ##############################
+    index = ext_sensor.SensorIndex()
+    index.async_setup(hass, config_entry)
+    ##############################
+
     def _supported(event: RFXtrxEvent) -> bool:
         return isinstance(event, (ControlEvent, SensorEvent))
 
@@ -255,7 +265,7 @@ async def async_setup_entry(
         device_id: DeviceTuple,
         entity_info: dict[str, Any],
     ) -> list[Entity]:
-        return [
+        sensors: list[Entity] = [
             RfxtrxSensor(
                 event.device,
                 device_id,
@@ -264,6 +274,21 @@ async def async_setup_entry(
             )
             for data_type in set(event.values) & set(SENSOR_TYPES_DICT)
         ]
+        ##############################
+        sensors.extend(
+            RfxtrxSensor(
+                event.device,
+                device_id,
+                description,
+                event=event if auto else None,
+            )
+            for description in ext_sensor.peak_descriptions(
+                [sensor.entity_description for sensor in sensors], entity_info
+            )
+        )
+        ext_sensor.init_sensors(index, sensors, entity_info)
+        ##############################
+        return sensors
 
     await async_setup_platform_entry(
         hass, config_entry, async_add_entities, _supported, _constructor
@@ -280,6 +305,12 @@ class RfxtrxSensor(RfxtrxEntity, SensorEntity):
 
     _attr_force_update = True
     entity_description: RfxtrxSensorEntityDescription
+    ##############################
+    _myattr_index: ext_sensor.SensorIndex | None = None
+    _myattr_throttle: ext_sensor.SensorThrottle | None = None
+    _myattr_aggregate: ext_sensor.SensorAggregate | None = None
+    _myattr_value_key: str
+    ##############################
 
     def __init__(
         self,
@@ -292,11 +323,24 @@ class RfxtrxSensor(RfxtrxEntity, SensorEntity):
         super().__init__(device, device_id, event=event)
         self.entity_description = entity_description
         self._attr_unique_id = "_".join(x for x in (*device_id, entity_description.key))
+        ##############################
+        self._myattr_value_key = entity_description.key
+        ##############################
 
     async def async_added_to_hass(self) -> None:
         """Restore device state."""
         await super().async_added_to_hass()
 
+        ##############################
+        if self._myattr_index is not None:
+            # Packets arrive through the bundle of the device instead
+            self.async_on_remove(self._myattr_index.async_add(self))
+
+        if self._myattr_aggregate is not None:
+            # The raw packet is not the aggregate or peak that was shown
+            return
+        ##############################
+
         if (
             self._event is None
             and (old_state := await self.async_get_last_state()) is not None
@@ -307,9 +351,15 @@ class RfxtrxSensor(RfxtrxEntity, SensorEntity):
     @property
     def native_value(self) -> StateType | date | datetime | Decimal:
         """Return the state of the sensor."""
+        ##############################
+        if (aggregate := self._myattr_aggregate) is not None and (
+            aggregate.value is not None
+        ):
+            return aggregate.value
+        ##############################
         if not self._event:
             return None
-        value = self._event.values.get(self.entity_description.key)
+        value = self._event.values.get(self._myattr_value_key)
         return self.entity_description.convert(value)
 
     @callback
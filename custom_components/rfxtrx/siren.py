@@ -2,22 +2,25 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 from typing import Any
 
 import RFXtrx as rfxtrxmod
 
 from homeassistant.components.siren import ATTR_TONE, SirenEntity, SirenEntityFeature
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
-from homeassistant.helpers.event import async_call_later
 
 from . import DEFAULT_OFF_DELAY, DeviceTuple, async_setup_platform_entry
 from .const import CONF_OFF_DELAY
 from .entity import RfxtrxCommandEntity
 
+##############################
+from .ext import off_delay as ext_off_delay
+
+##############################
+
 SECURITY_PANIC_ON = "Panic"
 SECURITY_PANIC_OFF = "End Panic"
 SECURITY_PANIC_ALL = {SECURITY_PANIC_ON, SECURITY_PANIC_OFF}
@@ -99,22 +102,29 @@ class RfxtrxOffDelayMixin(Entity):  # pylint: disable=hass-enforce-class-module
     they go inactive.
     """
 
-    _timeout: CALLBACK_TYPE | None = None
+    _timeout: bool = False
     _off_delay: float | None = None
 
+    ##############################
     def _setup_timeout(self) -> None:
-        @callback
-        def _done(_: datetime) -> None:
-            self._timeout = None
-            self.async_write_ha_state()
-
+        """Start the timeout, or push it back if it is already running."""
         if self._off_delay:
-            self._timeout = async_call_later(self.hass, self._off_delay, _done)
+            self._timeout = True
+            ext_off_delay.async_get_off_delay(self.hass).async_schedule(
+                self, self._off_delay, self._done
+            )
 
     def _cancel_timeout(self) -> None:
         if self._timeout:
-            self._timeout()
-            self._timeout = None
+            ext_off_delay.async_get_off_delay(self.hass).async_cancel(self)
+            self._timeout = False
+
+    @callback
+    def _done(self) -> None:
+        self._timeout = False
+        self.async_write_ha_state()
+
+    ##############################
 
     async def async_will_remove_from_hass(self) -> None:
         """Run when entity will be removed from hass."""
@@ -144,7 +154,7 @@ class RfxtrxChime(RfxtrxCommandEntity, SirenEntity, RfxtrxOffDelayMixin):
     @property
     def is_on(self) -> bool:
         """Return true if device is on."""
-        return self._timeout is not None
+        return self._timeout
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the device on."""
@@ -167,7 +177,6 @@ class RfxtrxChime(RfxtrxCommandEntity, SirenEntity, RfxtrxOffDelayMixin):
 
         sound = event.values.get("Sound")
         if sound is not None:
-            self._cancel_timeout()
             self._setup_timeout()
 
     @callback
@@ -203,7 +212,7 @@ class RfxtrxSecurityPanic(RfxtrxCommandEntity, SirenEntity, RfxtrxOffDelayMixin)
     @property
     def is_on(self) -> bool:
         """Return true if device is on."""
-        return self._timeout is not None
+        return self._timeout
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the device on."""
@@ -230,7 +239,6 @@ class RfxtrxSecurityPanic(RfxtrxCommandEntity, SirenEntity, RfxtrxOffDelayMixin)
         status = event.values.get("Sensor Status")
 
         if status == SECURITY_PANIC_ON:
-            self._cancel_timeout()
             self._setup_timeout()
         elif status == SECURITY_PANIC_OFF:
             self._cancel_timeout()
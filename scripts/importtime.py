@@ -0,0 +1,136 @@
+"""Measure the import time of the RFXtrx integration.
+
+Imports the integration the way Home Assistant loads it, in a fresh
+interpreter under ``python -X importtime``, and reports the time spent
+importing its own modules and anything only they pull in. The modules
+Home Assistant has always imported by then are imported first so they
+are not counted.
+
+Run from the root of the repository with the Python of a Home Assistant
+install::
+
+    python scripts/importtime.py
+    python scripts/importtime.py --runs 20 --modules config_flow
+
+Each run is a new interpreter, and the median of the runs is reported
+to keep the figures stable from one measurement to the next.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections import defaultdict
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+
+PACKAGE = "custom_components.rfxtrx"
+
+# Loaded by Home Assistant before any integration platform is set up
+PRELOAD = (
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.device_registry",
+    "homeassistant.helpers.restore_state",
+    "homeassistant.components.binary_sensor",
+    "homeassistant.components.cover",
+    "homeassistant.components.event",
+    "homeassistant.components.light",
+    "homeassistant.components.sensor",
+    "homeassistant.components.siren",
+    "homeassistant.components.switch",
+)
+
+# The integration and the platforms Home Assistant loads with it
+MODULES = (
+    "",
+    "config_flow",
+    "binary_sensor",
+    "cover",
+    "event",
+    "light",
+    "sensor",
+    "siren",
+    "switch",
+)
+
+
+def _measure(modules: list[str]) -> list[tuple[str, int, bool]]:
+    """Import the modules in a new interpreter and return what was imported.
+
+    Each import is returned with its cumulative time in microseconds and
+    whether it was imported at the top level rather than by another one.
+    """
+    code = ";".join(
+        [f"import {module}" for module in PRELOAD]
+        + ["import sys", "print('-', file=sys.stderr)"]
+        + [f"import {module}" for module in modules]
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=Path(__file__).resolve().parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    _, _, measured = result.stderr.partition("-\n")
+
+    imports = []
+    for line in measured.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        # Nested imports are indented and already counted in their parent
+        imports.append((name.strip(), int(cumulative), not name.startswith("  ")))
+    return imports
+
+
+def main() -> None:
+    """Run the benchmark and print the report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="interpreters to run")
+    parser.add_argument(
+        "--modules",
+        nargs="+",
+        default=MODULES,
+        help="modules of the integration to import, '' for the package",
+    )
+    parser.add_argument(
+        "--top", type=int, default=15, help="slowest imports to list"
+    )
+    args = parser.parse_args()
+
+    modules = [
+        f"{PACKAGE}.{module}" if module else PACKAGE for module in args.modules
+    ]
+    totals: list[int] = []
+    imports: defaultdict[str, list[int]] = defaultdict(list)
+    for _ in range(args.runs):
+        measured = _measure(modules)
+        totals.append(sum(cumulative for _, cumulative, top in measured if top))
+        for name, cumulative, _ in measured:
+            imports[name].append(cumulative)
+
+    print(f"Import time of {', '.join(modules)}")
+    print(
+        f"median of {args.runs} runs: {statistics.median(totals) / 1000:.1f} ms,"
+        f" fastest {min(totals) / 1000:.1f} ms"
+    )
+    print()
+    print("Slowest imports, cumulative median ms:")
+    slowest = sorted(
+        ((statistics.median(times), name) for name, times in imports.items()),
+        reverse=True,
+    )
+    for median, name in slowest[: args.top]:
+        print(f"  {median / 1000:8.1f}  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+"""Test configuration for the RFXtrx custom integration."""
+
+from pathlib import Path
+import sys
+
+# Import the integration as custom_components.rfxtrx from the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,39 @@
+"""Tests for the RFXtrx device object cache."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+
+from custom_components.rfxtrx.ext.device_cache import DeviceObjectCache
+
+
+def test_cache_follows_registry_while_loaded(tmp_path: Path) -> None:
+    """Test that the registry listener is removed when the entry unloads."""
+
+    async def _run() -> None:
+        hass = HomeAssistant(str(tmp_path))
+        await dr.async_load(hass)
+        unloads = []
+        config_entry = MagicMock(entry_id="rfxtrx")
+        config_entry.async_on_unload = unloads.append
+
+        def _listeners() -> int:
+            return hass.bus.async_listeners().get(dr.EVENT_DEVICE_REGISTRY_UPDATED, 0)
+
+        listeners = _listeners()
+        cache = DeviceObjectCache(hass)
+        cache.async_setup(config_entry)
+        assert _listeners() == listeners + 1
+
+        for unload in unloads:
+            unload()
+        assert _listeners() == listeners
+
+        await hass.async_stop(force=True)
+
+    asyncio.run(_run())
@@ -0,0 +1,99 @@
+"""Tests for the RFXtrx device trigger index."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
+from custom_components.rfxtrx.const import EVENT_RFXTRX_EVENT
+from custom_components.rfxtrx.ext.device_trigger import DeviceTriggerIndex
+
+
+def test_index_runs_matching_triggers(tmp_path: Path) -> None:
+    """Test that an event runs only the triggers for its device and value."""
+
+    async def _run() -> None:
+        hass = HomeAssistant(str(tmp_path))
+        index = DeviceTriggerIndex(hass)
+        runs: list[tuple[str, dict[str, str]]] = []
+
+        def _attach(
+            device_id: str, value_key: str, subtype: str, name: str
+        ) -> CALLBACK_TYPE:
+            async def _action(run_variables: dict[str, Any], context=None) -> None:
+                runs.append((name, run_variables["trigger"]["event"].data["values"]))
+
+            return index.async_attach(
+                device_id,
+                value_key,
+                subtype,
+                _action,
+                {"trigger_data": {"id": name, "idx": name}},
+            )
+
+        def _listeners() -> int:
+            return hass.bus.async_listeners().get(EVENT_RFXTRX_EVENT, 0)
+
+        detach_on = _attach("remote", "Command", "On", "on")
+        detach_off = _attach("remote", "Command", "Off", "off")
+        _attach("other", "Command", "On", "other")
+        detach_status = _attach("remote", "Sensor Status", "Panic", "panic")
+        assert _listeners() == 1
+
+        async def _fire(device_id: str, values: dict[str, str]) -> None:
+            hass.bus.async_fire(
+                EVENT_RFXTRX_EVENT, {ATTR_DEVICE_ID: device_id, "values": values}
+            )
+            await hass.async_block_till_done()
+
+        await _fire("remote", {"Command": "On"})
+        await _fire("remote", {"Sensor Status": "Panic"})
+        await _fire("remote", {"Command": "Dim"})
+        await _fire("unknown", {"Command": "On"})
+        assert runs == [
+            ("on", {"Command": "On"}),
+            ("panic", {"Sensor Status": "Panic"}),
+        ]
+
+        runs.clear()
+        detach_on()
+        detach_status()
+        await _fire("remote", {"Command": "On"})
+        await _fire("remote", {"Sensor Status": "Panic"})
+        assert runs == []
+
+        detach_off()
+        assert _listeners() == 1
+        await _fire("other", {"Command": "On"})
+        assert runs == [("other", {"Command": "On"})]
+
+        await hass.async_stop(force=True)
+
+    asyncio.run(_run())
+
+
+def test_index_stops_listening_once_empty(tmp_path: Path) -> None:
+    """Test that the event listener is removed with the last trigger."""
+
+    async def _run() -> None:
+        hass = HomeAssistant(str(tmp_path))
+        index = DeviceTriggerIndex(hass)
+        listeners = hass.bus.async_listeners().get(EVENT_RFXTRX_EVENT, 0)
+
+        async def _action(run_variables: dict[str, Any], context=None) -> None:
+            """Do nothing."""
+
+        detach = index.async_attach(
+            "remote", "Command", "On", _action, {"trigger_data": {}}
+        )
+        assert hass.bus.async_listeners()[EVENT_RFXTRX_EVENT] == listeners + 1
+        detach()
+        assert hass.bus.async_listeners().get(EVENT_RFXTRX_EVENT, 0) == listeners
+
+        await hass.async_stop(force=True)
+
+    asyncio.run(_run())
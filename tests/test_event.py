@@ -0,0 +1,111 @@
+"""Tests for the RFXtrx event entities."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+import pytest
+
+from custom_components.rfxtrx import get_device_id, get_rfx_object
+from custom_components.rfxtrx.const import DOMAIN
+from custom_components.rfxtrx.event import RfxtrxEventEntity
+from custom_components.rfxtrx.ext.const import (
+    ATTR_PRESS,
+    CONF_EVENT_BURST_MS,
+    CONF_EVENT_LONG_PRESS_MS,
+    DATA_OFF_DELAY,
+    PRESS,
+    PRESS_LONG,
+    PRESS_RELEASE,
+)
+from custom_components.rfxtrx.ext.off_delay import OffDelayScheduler
+
+PACKET = "0b1100cd0213c7f210010f70"
+
+
+def _remote(
+    hass: HomeAssistant | None, entity_info: dict[str, Any]
+) -> RfxtrxEventEntity:
+    """Make the command event entity of a remote."""
+    event = get_rfx_object(PACKET)
+    remote = RfxtrxEventEntity(
+        event.device,
+        get_device_id(event.device),
+        "COMMANDS",
+        "Command",
+        "command",
+        entity_info,
+    )
+    remote.hass = hass
+    remote.entity_id = "event.remote"
+    return remote
+
+
+def _presses(
+    remote: RfxtrxEventEntity, frames: list[tuple[float, str]]
+) -> list[str | None]:
+    """Return the press fired for each frame received at a time."""
+    presses = []
+    for now, event_type in frames:
+        with patch(
+            "custom_components.rfxtrx.ext.event.time.monotonic", return_value=now
+        ):
+            presses.append(remote._burst_press(event_type))
+    return presses
+
+
+@pytest.mark.parametrize(
+    ("entity_info", "frames", "presses"),
+    [
+        # Repeats within the burst gap of the frame before are one press
+        (
+            {},
+            [(0, "on"), (0.3, "on"), (0.6, "on"), (1.2, "on")],
+            [PRESS, None, None, PRESS],
+        ),
+        # A different command starts a new press
+        ({}, [(0, "on"), (0.1, "off"), (0.2, "on")], [PRESS, PRESS, PRESS]),
+        # Without a burst gap every frame is a press
+        ({CONF_EVENT_BURST_MS: 0}, [(0, "on"), (0.1, "on")], [PRESS, PRESS]),
+    ],
+)
+def test_burst_collapses_repeats(
+    entity_info: dict[str, Any],
+    frames: list[tuple[float, str]],
+    presses: list[str | None],
+) -> None:
+    """Test which frames of a burst fire a press."""
+    assert _presses(_remote(None, entity_info), frames) == presses
+
+
+def test_long_burst_fires_long_press_and_release(tmp_path: Path) -> None:
+    """Test that a held button fires a long press once and a release after it."""
+
+    async def _run() -> None:
+        hass = HomeAssistant(str(tmp_path))
+        hass.data[DOMAIN] = {DATA_OFF_DELAY: OffDelayScheduler(hass)}
+        remote = _remote(
+            hass, {CONF_EVENT_BURST_MS: 50, CONF_EVENT_LONG_PRESS_MS: 100}
+        )
+
+        assert _presses(
+            remote, [(0, "on"), (0.04, "on"), (0.08, "on"), (0.12, "on"), (0.16, "on")]
+        ) == [PRESS, None, None, PRESS_LONG, None]
+
+        with (
+            patch.object(remote, "_trigger_event") as trigger_event,
+            patch.object(remote, "async_write_ha_state"),
+        ):
+            await asyncio.sleep(0.1)
+        trigger_event.assert_called_once_with("on", {ATTR_PRESS: PRESS_RELEASE})
+
+        # The next frame starts a new press
+        assert _presses(remote, [(1, "on")]) == [PRESS]
+
+        await hass.async_stop(force=True)
+
+    asyncio.run(_run())
@@ -0,0 +1,101 @@
+"""Tests for the RFXtrx frame timer."""
+
+from __future__ import annotations
+
+from concurrent.futures import CancelledError
+import time
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.rfxtrx.ext.frame_timer import FRAME_SECS, FrameTimer
+
+NOW = 100.0
+
+
+def _reserve(timer: FrameTimer, offsets: tuple[float, ...]) -> float:
+    """Reserve slots as though it were NOW, returning the start given."""
+    with patch(
+        "custom_components.rfxtrx.ext.frame_timer.time.monotonic", return_value=NOW
+    ):
+        start, _ = timer._reserve(offsets)
+    return start
+
+
+def test_frames_are_sent_earliest_deadline_first() -> None:
+    """Test that frames queued out of order are sent in deadline order."""
+    timer = FrameTimer()
+    timer.start()
+    sent: list[str] = []
+    now = time.monotonic()
+    futures = [
+        timer.send_at(now + offset, lambda name=name: sent.append(name))
+        for name, offset in (("c", 0.3), ("a", 0.1), ("b", 0.2))
+    ]
+    for future in futures:
+        future.result(timeout=1)
+    timer.stop()
+
+    assert sent == ["a", "b", "c"]
+    assert timer.frames_sent == 3
+
+
+def test_frames_are_not_sent_early() -> None:
+    """Test that a frame is sent on its deadline, spinning for the last moment."""
+    timer = FrameTimer()
+    timer.start()
+    deadline = time.monotonic() + 0.05
+    sent = timer.send_at(deadline, lambda: None).result(timeout=1)
+    timer.stop()
+
+    assert sent >= deadline
+    assert timer.max_late < 0.05
+
+
+def test_reserve_gives_each_frame_its_own_slot() -> None:
+    """Test that frames due together are staggered by a frame each."""
+    timer = FrameTimer()
+
+    assert _reserve(timer, (0,)) == NOW
+    assert _reserve(timer, (0,)) == pytest.approx(NOW + FRAME_SECS)
+    assert _reserve(timer, (0,)) == pytest.approx(NOW + 2 * FRAME_SECS)
+
+
+def test_reserve_fits_start_and_stop_of_a_pulse() -> None:
+    """Test that a pulse starts once neither of its frames clashes."""
+    timer = FrameTimer()
+    # A pulse whose stop is due 0.35 after its start
+    assert _reserve(timer, (0, 0.35)) == NOW
+
+    # Starting at NOW or one frame later would stop during the first stop
+    assert _reserve(timer, (0, 0.3)) == pytest.approx(NOW + 0.15)
+    slots = sorted(timer._slots)
+    for (_, end), (start, _) in zip(slots, slots[1:], strict=False):
+        assert end <= start + 1e-9
+
+
+def test_cancelled_pulse_frees_its_slots() -> None:
+    """Test that the frames of a cancelled pulse no longer hold their slots."""
+    timer = FrameTimer()
+    timer.start()
+    pulse = timer.pulse(lambda: None, lambda: None, 1.0)
+    pulse.started.result(timeout=1)
+    pulse.cancel()
+
+    with pytest.raises(CancelledError):
+        pulse.stopped.result(timeout=2)
+    # Only the slot of the start, which was sent, is still held
+    assert len(timer._slots) == 1
+    timer.stop()
+
+
+def test_pulse_stop_follows_start() -> None:
+    """Test that the stop of a pulse is chained to when its start was sent."""
+    timer = FrameTimer()
+    timer.start()
+    pulse = timer.pulse(lambda: None, lambda: None, 0.05)
+    timing = pulse.stopped.result(timeout=1)
+    timer.stop()
+
+    assert timing.started == pulse.started.result()
+    assert 0.05 <= timing.width < 0.1
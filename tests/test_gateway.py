@@ -0,0 +1,42 @@
+"""Tests for the RFXtrx gateway connection."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import RFXtrx as rfxtrxmod
+
+from custom_components.rfxtrx.ext.gateway import lock_transport
+
+
+class _SlowTransport(rfxtrxmod.RFXtrxTransport):
+    """Transport that notes how many frames are being written at once."""
+
+    def __init__(self) -> None:
+        self.writing = 0
+        self.max_writing = 0
+        self.frames: list[bytes] = []
+
+    def send(self, data: bytes) -> None:
+        self.writing += 1
+        self.max_writing = max(self.max_writing, self.writing)
+        time.sleep(0.01)
+        self.frames.append(data)
+        self.writing -= 1
+
+
+def test_transport_writes_one_frame_at_a_time() -> None:
+    """Test that frames written from several threads do not overlap."""
+    transport = lock_transport(_SlowTransport())
+    threads = [
+        threading.Thread(target=transport.send, args=(bytes([frame]),))
+        for frame in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert transport.max_writing == 1
+    assert sorted(transport.frames) == [bytes([frame]) for frame in range(8)]
@@ -0,0 +1,108 @@
+"""Tests for the RFXtrx cover groups."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+import sys
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.rfxtrx import get_device_id, get_rfx_object
+from custom_components.rfxtrx.const import DOMAIN
+from custom_components.rfxtrx.ext.const import (
+    CONF_GROUP_MEMBERS,
+    DATA_GATEWAY,
+    DATA_GROUP_INDEX,
+)
+from custom_components.rfxtrx.ext.cover import COVER_MODULES, load_cover_modules
+from custom_components.rfxtrx.ext.gateway import GatewayConnection
+from custom_components.rfxtrx.ext.group import CoverGroupIndex, GroupMixin
+from custom_components.rfxtrx.ext.somfy_roller_blind import (
+    LIFT_POS_CLOSED,
+    LIFT_POS_OPEN,
+    SomfyRollerBlind,
+)
+
+# RFY frames for unit 0, used as the group, and unit 1 of remote 030101
+GROUP_PACKET = "0c1a0000030101001300000003"
+MEMBER_PACKET = "0c1a0000030101011300000003"
+
+
+def _blind(hass: HomeAssistant, packet: str, entity_info: dict) -> SomfyRollerBlind:
+    """Make a roller blind for an RFY frame."""
+    event = get_rfx_object(packet)
+    blind = SomfyRollerBlind(
+        event.device, get_device_id(event.device), entity_info=entity_info
+    )
+    blind.hass = hass
+    blind.entity_id = f"cover.rfy_{blind._device_id.id_string.replace(':', '_')}"
+    return blind
+
+
+def test_group_updates_member(tmp_path: Path) -> None:
+    """Test that a configured group writes its state to its members."""
+
+    async def _run() -> None:
+        hass = HomeAssistant(str(tmp_path))
+        index = CoverGroupIndex()
+        gateway = GatewayConnection(hass, None, None, 0)
+        gateway.connected = True
+        hass.data[DOMAIN] = {DATA_GATEWAY: gateway, DATA_GROUP_INDEX: index}
+
+        member = _blind(hass, MEMBER_PACKET, {})
+        group = _blind(
+            hass, GROUP_PACKET, {CONF_GROUP_MEMBERS: member._device_id.id_string}
+        )
+
+        with patch.object(SomfyRollerBlind, "async_get_last_state", return_value=None):
+            await member.async_added_to_hass()
+            await group.async_added_to_hass()
+
+        assert index.covers == {member._device_id: member, group._device_id: group}
+        assert member._myattr_lift_step == LIFT_POS_CLOSED
+
+        group._set_position(LIFT_POS_OPEN)
+        group.async_write_ha_state()
+        # The group and then the member write their coalesced states
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert member._myattr_lift_step == LIFT_POS_OPEN
+        assert member._attr_current_cover_position == 100
+        assert hass.states.get(member.entity_id).attributes["current_position"] == 100
+
+        await hass.async_stop(force=True)
+
+    asyncio.run(_run())
+
+
+def test_covers_implement_group_hooks() -> None:
+    """Test that every stateful cover implements the group and scene hooks."""
+    load_cover_modules(COVER_MODULES)
+    hooks = (
+        "_group_state",
+        "_apply_group_state",
+        "_scene_target",
+        "_at_target",
+        "_scene_secs",
+        "_async_start_scene_move",
+    )
+    covers = [
+        cover
+        for module in sys.modules.values()
+        if getattr(module, "__package__", None) == "custom_components.rfxtrx.ext"
+        for cover in vars(module).values()
+        if isinstance(cover, type)
+        and issubclass(cover, GroupMixin)
+        and cover.__module__ == module.__name__
+        and cover is not GroupMixin
+        and not cover.__name__.startswith("Abstract")
+    ]
+    assert covers
+    for cover in covers:
+        for hook in hooks:
+            assert getattr(cover, hook) is not getattr(GroupMixin, hook), (
+                f"{cover.__name__} does not implement {hook}"
+            )
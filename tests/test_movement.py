@@ -0,0 +1,48 @@
+"""Tests for the background movements of the RFXtrx stateful covers."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.rfxtrx import get_device_id, get_rfx_object
+from custom_components.rfxtrx.ext.const import CONF_RESYNC_COMMANDS, CONF_RESYNC_HOURS
+from custom_components.rfxtrx.ext.somfy_roller_blind import SomfyRollerBlind
+
+PACKET = "0c1a0000030101011300000003"
+
+NOW = 100000.0
+
+
+@pytest.mark.parametrize(
+    ("entity_info", "last_sent", "skipped"),
+    [
+        # Skipped until enough commands have been skipped in a row
+        ({CONF_RESYNC_COMMANDS: 2}, NOW, [True, True, False, False]),
+        ({CONF_RESYNC_COMMANDS: 0}, NOW, [False, False]),
+        ({CONF_RESYNC_COMMANDS: 5}, None, [True, True, True]),
+        # Sent anyway once enough time has passed since the last frame
+        (
+            {CONF_RESYNC_COMMANDS: 5, CONF_RESYNC_HOURS: 1},
+            NOW - 1800,
+            [True, True, True],
+        ),
+        ({CONF_RESYNC_COMMANDS: 5, CONF_RESYNC_HOURS: 1}, NOW - 3600, [False]),
+        # Nothing has been sent since startup
+        ({CONF_RESYNC_COMMANDS: 5, CONF_RESYNC_HOURS: 1}, None, [False]),
+    ],
+)
+def test_skip_redundant_move(
+    entity_info: dict[str, Any], last_sent: float | None, skipped: list[bool]
+) -> None:
+    """Test when a move to the state a blind is already in is skipped."""
+    event = get_rfx_object(PACKET)
+    blind = SomfyRollerBlind(event.device, get_device_id(event.device), entity_info)
+    blind._myattr_last_sent = last_sent
+
+    with patch(
+        "custom_components.rfxtrx.ext.movement.time.monotonic", return_value=NOW
+    ):
+        assert [blind._skip_redundant_move() for _ in skipped] == skipped
@@ -0,0 +1,137 @@
+"""Tests for the RFXtrx platform selection."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+from unittest.mock import MagicMock, patch
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import Platform
+import pytest
+
+from custom_components.rfxtrx import (
+    ConfiguredDevice,
+    _parse_devices,
+    get_device_id,
+    get_rfx_object,
+)
+from custom_components.rfxtrx.ext.auto_add import AutoAddRouter
+from custom_components.rfxtrx.ext.platforms import PLATFORM_SUPPORTED
+
+# Packets of the kinds of device the platforms tell apart
+PACKETS = {
+    "lighting2": "0b1100cd0213c7f210010f70",
+    "lighting2_dim": "0b1100cd0213c7f210020f70",
+    "lighting4": "0913000022670e013970",
+    "rfy": "0c1a0000030101011300000003",
+    "temp_hum": "0a52080705020095220269",
+    "security_motion": "0a20070000e1d4040e0070",
+    "security_normal": "0a20070000e1d4000e0070",
+    "security_panic": "0a20070000e1d4060e0070",
+    "chime": "0716000100900970",
+}
+
+
+async def _platform_supported(platform: Platform):
+    """Return the supported() check a platform sets itself up with."""
+    module = importlib.import_module(f"custom_components.rfxtrx.{platform}")
+    if hasattr(module, "supported"):
+        return module.supported
+    # The check is local to the setup of the platform
+    with patch.object(module, "async_setup_platform_entry") as setup:
+        await module.async_setup_entry(MagicMock(), MagicMock(), MagicMock())
+    return setup.call_args.args[3]
+
+
+@pytest.mark.parametrize("platform", list(PLATFORM_SUPPORTED))
+def test_platform_checks_match_platforms(platform: Platform) -> None:
+    """Test that no platform is left out for a device it makes entities for."""
+    supported = asyncio.run(_platform_supported(platform))
+    for packet in PACKETS.values():
+        event = get_rfx_object(packet)
+        if supported(event):
+            assert PLATFORM_SUPPORTED[platform](event), packet
+
+
+def test_table_partitions_devices_by_platform() -> None:
+    """Test that each platform is given only the devices it may use."""
+    table = _parse_devices(
+        {PACKETS["rfy"]: {}, PACKETS["temp_hum"]: {}, PACKETS["chime"]: {}}
+    )
+
+    assert [device.event.data.hex() for device in table.devices] == [
+        PACKETS["rfy"],
+        PACKETS["temp_hum"],
+        PACKETS["chime"],
+    ]
+    assert [d.event.data.hex() for d in table.for_platform(Platform.COVER)] == [
+        PACKETS["rfy"]
+    ]
+    assert [d.event.data.hex() for d in table.for_platform(Platform.SIREN)] == [
+        PACKETS["chime"]
+    ]
+    assert table.for_platform(Platform.LIGHT) == []
+    assert Platform.LIGHT not in table.platforms
+    assert {Platform.COVER, Platform.SENSOR, Platform.SIREN} <= table.platforms
+
+
+def test_table_adds_and_removes_devices() -> None:
+    """Test that devices added automatically reach their platforms."""
+    table = _parse_devices({PACKETS["temp_hum"]: {}})
+    assert Platform.COVER not in table.platforms
+
+    event = get_rfx_object(PACKETS["rfy"])
+    device_id = get_device_id(event.device)
+    table.add(ConfiguredDevice(event, device_id, {}))
+    assert [d.device_id for d in table.for_platform(Platform.COVER)] == [device_id]
+
+    table.remove(device_id)
+    assert table.for_platform(Platform.COVER) == []
+    assert Platform.COVER not in table.platforms
+    assert len(table.devices) == 1
+
+
+def test_router_offers_devices_again_once_loaded() -> None:
+    """Test that a device seen during setup still has its platforms set up."""
+    config_entry = MagicMock(state=ConfigEntryState.SETUP_IN_PROGRESS)
+    router = AutoAddRouter(MagicMock(), config_entry)
+    event = get_rfx_object(PACKETS["rfy"])
+    device_id = get_device_id(event.device)
+
+    with patch(
+        "custom_components.rfxtrx.ext.auto_add.async_load_platforms_for_event"
+    ) as load:
+        router._async_handle_event(event, device_id)
+        load.assert_not_called()
+
+        config_entry.state = ConfigEntryState.LOADED
+        router._async_handle_event(event, device_id)
+        load.assert_called_once()
+
+        router._async_handle_event(event, device_id)
+        load.assert_called_once()
+
+
+def test_router_offers_status_packets_until_accepted() -> None:
+    """Test that a siren is added for a device's first panic, not its first packet."""
+    router = AutoAddRouter(MagicMock(), MagicMock(state=ConfigEntryState.LOADED))
+    siren = asyncio.run(_platform_supported(Platform.SIREN))
+    sensor = asyncio.run(_platform_supported(Platform.SENSOR))
+    added: list[tuple[Platform, str]] = []
+    for platform, supported in ((Platform.SIREN, siren), (Platform.SENSOR, sensor)):
+        router.async_register(
+            platform,
+            supported,
+            lambda event, device_id, platform=platform: added.append(
+                (platform, event.values["Sensor Status"])
+            ),
+        )
+
+    with patch("custom_components.rfxtrx.ext.auto_add.async_load_platforms_for_event"):
+        for packet in ("security_normal", "security_motion", "security_panic"):
+            event = get_rfx_object(PACKETS[packet])
+            router._async_handle_event(event, get_device_id(event.device))
+        router._async_handle_event(event, get_device_id(event.device))
+
+    assert added == [(Platform.SENSOR, "Normal"), (Platform.SIREN, "Panic")]
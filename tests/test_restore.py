@@ -0,0 +1,59 @@
+"""Tests for restoring the state of RFXtrx entities."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from unittest.mock import patch
+
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant, State
+from homeassistant.helpers.restore_state import RestoreEntity
+import pytest
+
+from custom_components.rfxtrx import get_device_id, get_rfx_object
+from custom_components.rfxtrx.const import DOMAIN
+from custom_components.rfxtrx.ext.const import DATA_GROUP_INDEX
+from custom_components.rfxtrx.ext.group import CoverGroupIndex
+from custom_components.rfxtrx.ext.somfy_roller_blind import (
+    LIFT_POS_CLOSED,
+    LIFT_POS_OPEN,
+    SomfyRollerBlind,
+)
+
+PACKET = "0c1a0000030101011300000003"
+ENTITY_ID = "cover.rfy_030101_1"
+
+
+@pytest.mark.parametrize(
+    ("old_state", "lift_step"),
+    [
+        (State(ENTITY_ID, "open", {"current_position": 100}), LIFT_POS_OPEN),
+        # Saved while the gateway was not connected
+        (State(ENTITY_ID, STATE_UNAVAILABLE), LIFT_POS_CLOSED),
+        (State(ENTITY_ID, "open"), LIFT_POS_CLOSED),
+    ],
+)
+def test_roller_blind_restores_position(
+    tmp_path: Path, old_state: State, lift_step: int
+) -> None:
+    """Test that only a state with a position is restored."""
+
+    async def _run() -> None:
+        hass = HomeAssistant(str(tmp_path))
+        hass.data[DOMAIN] = {DATA_GROUP_INDEX: CoverGroupIndex()}
+        event = get_rfx_object(PACKET)
+        blind = SomfyRollerBlind(event.device, get_device_id(event.device), {})
+        blind.hass = hass
+        blind.entity_id = ENTITY_ID
+
+        with patch.object(
+            RestoreEntity, "async_get_last_state", return_value=old_state
+        ):
+            await blind.async_added_to_hass()
+
+        assert blind._myattr_lift_step == lift_step
+
+        await hass.async_stop(force=True)
+
+    asyncio.run(_run())
@@ -0,0 +1,175 @@
+"""Tests for the RFXtrx multi-cover scenes."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from homeassistant.components.cover import ATTR_POSITION
+from homeassistant.core import HomeAssistant
+
+from custom_components.rfxtrx import get_device_id, get_rfx_object
+from custom_components.rfxtrx.const import DOMAIN
+from custom_components.rfxtrx.entity import RfxtrxCommandEntity
+from custom_components.rfxtrx.ext.const import (
+    ATTR_COVERS,
+    CONF_CLOSE_SECONDS,
+    CONF_GROUP_MEMBERS,
+    CONF_OPEN_SECONDS,
+    DATA_GATEWAY,
+    DATA_GROUP_INDEX,
+    SVC_MOVE_COVERS,
+)
+from custom_components.rfxtrx.ext.gateway import GatewayConnection
+from custom_components.rfxtrx.ext.group import CoverGroupIndex
+from custom_components.rfxtrx.ext.scene import (
+    SceneMove,
+    async_setup_move_covers_service,
+    plan_scene,
+)
+from custom_components.rfxtrx.ext.somfy_roller_blind import (
+    LIFT_POS_CLOSED,
+    LIFT_POS_MID,
+    LIFT_POS_OPEN,
+    SomfyRollerBlind,
+)
+
+# RFY frames for unit 0, used as the group, and units 1 and 2 of remote 030101
+GROUP_PACKET = "0c1a0000030101001300000003"
+MEMBER_PACKETS = ("0c1a0000030101011300000003", "0c1a0000030101021300000003")
+
+
+def _blind(
+    hass: HomeAssistant | None, packet: str, entity_info: dict[str, Any]
+) -> SomfyRollerBlind:
+    """Make a roller blind for an RFY frame."""
+    event = get_rfx_object(packet)
+    blind = SomfyRollerBlind(
+        event.device, get_device_id(event.device), entity_info=entity_info
+    )
+    blind.hass = hass
+    blind.entity_id = f"cover.rfy_{blind._device_id.id_string.replace(':', '_')}"
+    return blind
+
+
+def _covers(
+    hass: HomeAssistant | None,
+) -> tuple[CoverGroupIndex, SomfyRollerBlind, SomfyRollerBlind, SomfyRollerBlind]:
+    """Make a group of two blinds, all of them closed, and index them."""
+    index = CoverGroupIndex()
+    first = _blind(hass, MEMBER_PACKETS[0], {CONF_OPEN_SECONDS: 20})
+    second = _blind(hass, MEMBER_PACKETS[1], {CONF_OPEN_SECONDS: 40})
+    group = _blind(
+        hass,
+        GROUP_PACKET,
+        {
+            CONF_GROUP_MEMBERS: ", ".join(
+                (first._device_id.id_string, second._device_id.id_string)
+            )
+        },
+    )
+    for cover in (first, second, group):
+        cover._set_position(LIFT_POS_CLOSED)
+        index.async_add(cover)
+    return index, first, second, group
+
+
+def test_plan_scene_skips_covers_in_position() -> None:
+    """Test that covers already at their target are left alone."""
+    index, first, second, _ = _covers(None)
+
+    assert plan_scene(
+        index, {first: {ATTR_POSITION: 100}, second: {ATTR_POSITION: 0}}
+    ) == [SceneMove(first, LIFT_POS_OPEN, 20)]
+
+    second._set_position(LIFT_POS_OPEN)
+    assert plan_scene(index, {second: {ATTR_POSITION: 100}}) == []
+
+
+def test_plan_scene_moves_group_for_members() -> None:
+    """Test that a group is moved when all its members share a target."""
+    index, first, second, group = _covers(None)
+
+    assert plan_scene(
+        index, {first: {ATTR_POSITION: 100}, second: {ATTR_POSITION: 100}}
+    ) == [SceneMove(group, LIFT_POS_OPEN, group._myattr_open_secs)]
+
+    # Including members already at the target
+    second._set_position(LIFT_POS_OPEN)
+    assert plan_scene(
+        index, {first: {ATTR_POSITION: 100}, second: {ATTR_POSITION: 100}}
+    ) == [SceneMove(group, LIFT_POS_OPEN, group._myattr_open_secs)]
+    second._set_position(LIFT_POS_CLOSED)
+
+    # Not every member is heading for the same target
+    assert plan_scene(
+        index, {first: {ATTR_POSITION: 100}, second: {ATTR_POSITION: 50}}
+    ) == [
+        SceneMove(second, LIFT_POS_MID, 40),
+        SceneMove(first, LIFT_POS_OPEN, 20),
+    ]
+
+    # Not every member is in the scene
+    assert plan_scene(index, {first: {ATTR_POSITION: 100}}) == [
+        SceneMove(first, LIFT_POS_OPEN, 20)
+    ]
+
+
+def test_plan_scene_orders_longest_first() -> None:
+    """Test that the covers with the furthest to go are moved first."""
+    index, first, second, _ = _covers(None)
+    fast = _blind(None, "0c1a0000030102011300000003", {CONF_CLOSE_SECONDS: 5})
+    fast._set_position(LIFT_POS_OPEN)
+    index.async_add(fast)
+
+    assert [
+        move.cover
+        for move in plan_scene(
+            index,
+            {
+                fast: {ATTR_POSITION: 0},
+                first: {ATTR_POSITION: 100},
+                second: {ATTR_POSITION: 50},
+            },
+        )
+    ] == [second, first, fast]
+
+
+def test_move_covers_sends_frames_in_planned_order(tmp_path: Path) -> None:
+    """Test that the frames of a scene reach the gateway in the planned order."""
+
+    async def _run() -> None:
+        hass = HomeAssistant(str(tmp_path))
+        gateway = GatewayConnection(hass, None, None, 0)
+        gateway.connected = True
+        index, first, second, _ = _covers(hass)
+        hass.data[DOMAIN] = {DATA_GATEWAY: gateway, DATA_GROUP_INDEX: index}
+        async_setup_move_covers_service(hass, MagicMock())
+
+        sent: list[str] = []
+
+        async def _send(self, fun, *args) -> None:
+            # The first frame planned takes the longest to hand over
+            await asyncio.sleep(0.05 if self is second else 0)
+            sent.append(self.entity_id)
+
+        with patch.object(RfxtrxCommandEntity, "_async_send", _send):
+            await hass.services.async_call(
+                DOMAIN,
+                SVC_MOVE_COVERS,
+                {
+                    ATTR_COVERS: {
+                        first.entity_id: {ATTR_POSITION: 100},
+                        second.entity_id: {ATTR_POSITION: 50},
+                    }
+                },
+                blocking=True,
+            )
+
+        assert sent == [second.entity_id, first.entity_id]
+
+        await hass.async_stop(force=True)
+
+    asyncio.run(_run())
@@ -0,0 +1,275 @@
+"""Tests for the RFXtrx sensors."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.entity import Entity
+import pytest
+
+from custom_components.rfxtrx import get_device_id, get_rfx_object
+from custom_components.rfxtrx.const import DOMAIN, SIGNAL_EVENT
+from custom_components.rfxtrx.ext.const import (
+    CONF_SENSOR_AGGREGATE,
+    CONF_SENSOR_DEADBAND,
+    CONF_SENSOR_HEARTBEAT,
+    CONF_SENSOR_MIN_INTERVAL,
+    DATA_GATEWAY,
+)
+from custom_components.rfxtrx.ext.gateway import GatewayConnection
+from custom_components.rfxtrx.ext.sensor import (
+    SensorAggregate,
+    SensorIndex,
+    SensorThrottle,
+    init_sensors,
+    parse_aggregate,
+    parse_deadband,
+    peak_descriptions,
+)
+from custom_components.rfxtrx.sensor import SENSOR_TYPES_DICT, RfxtrxSensor
+
+# Temperature 14.9 and humidity 34 from a TH sensor
+PACKET = "0a52080705020095220269"
+
+
+def _sensors(
+    hass: HomeAssistant | None,
+    index: SensorIndex,
+    keys: list[str],
+    entity_info: dict[str, Any],
+) -> list[RfxtrxSensor]:
+    """Make the sensors of a device for a packet, set up as the platform does."""
+    event = get_rfx_object(PACKET)
+    device_id = get_device_id(event.device)
+    descriptions = [SENSOR_TYPES_DICT[key] for key in keys]
+    sensors = [
+        RfxtrxSensor(event.device, device_id, description)
+        for description in (
+            *descriptions,
+            *peak_descriptions(descriptions, entity_info),
+        )
+    ]
+    for sensor in sensors:
+        sensor.hass = hass
+        key = sensor.entity_description.key.lower().replace(" ", "_")
+        sensor.entity_id = f"sensor.th_{key}"
+    init_sensors(index, sensors, entity_info)
+    return sensors
+
+
+def test_sensor_updates_through_index(tmp_path: Path) -> None:
+    """Test that a sensor is added in full but updated through its bundle."""
+
+    async def _run() -> None:
+        hass = HomeAssistant(str(tmp_path))
+        gateway = GatewayConnection(hass, None, None, 0)
+        gateway.connected = True
+        hass.data[DOMAIN] = {DATA_GATEWAY: gateway}
+        index = SensorIndex()
+        index.async_setup(hass, MagicMock())
+        (sensor,) = _sensors(hass, index, ["Temperature"], {})
+
+        with (
+            patch.object(RfxtrxSensor, "async_get_last_state", return_value=None),
+            patch.object(Entity, "async_added_to_hass") as added,
+        ):
+            await sensor.async_added_to_hass()
+        # The whole chain of mixins was run
+        added.assert_called_once()
+
+        with patch.object(RfxtrxSensor, "_handle_event") as handle_event:
+            event = get_rfx_object(PACKET)
+            async_dispatcher_send(
+                hass, SIGNAL_EVENT, event, get_device_id(event.device)
+            )
+            await asyncio.sleep(0)
+        handle_event.assert_not_called()
+        assert hass.states.get(sensor.entity_id).state == "14.9"
+
+        await hass.async_stop(force=True)
+
+    asyncio.run(_run())
+
+
+@pytest.mark.parametrize(
+    ("option", "deadbands"),
+    [
+        ("", {}),
+        ("0.5", {None: 0.5}),
+        ("Temperature=0.2, Humidity=1", {"Temperature": 0.2, "Humidity": 1.0}),
+        ("Temperature=warm, 2", {None: 2.0}),
+    ],
+)
+def test_parse_deadband(option: str, deadbands: dict[str | None, float]) -> None:
+    """Test that a deadband option gives the deadband of each key."""
+    assert parse_deadband(option) == deadbands
+
+
+@pytest.mark.parametrize(
+    ("option", "modes"),
+    [
+        ("", {}),
+        (
+            "Energy usage=mean, Wind gust=peak",
+            {"Energy usage": "mean", "Wind gust": "peak"},
+        ),
+        ("Temperature=median, Humidity=min, max", {"Humidity": "min"}),
+    ],
+)
+def test_parse_aggregate(option: str, modes: dict[str, str]) -> None:
+    """Test that only known aggregate modes of named keys are kept."""
+    assert parse_aggregate(option) == modes
+
+
+@pytest.mark.parametrize(
+    ("throttle", "readings", "written"),
+    [
+        # Within the deadband of the last value written, not the last reading
+        (
+            SensorThrottle(0.5, 0, 0),
+            [(0, 20.0), (1, 20.3), (2, 20.6), (3, 21.0)],
+            [20.0, 20.6],
+        ),
+        # Too soon after the last write
+        (
+            SensorThrottle(0, 10, 0),
+            [(0, 20.0), (5, 21.0), (10, 22.0), (15, 23.0)],
+            [20.0, 22.0],
+        ),
+        # A reading is written once the heartbeat has passed
+        (
+            SensorThrottle(1, 0, 60),
+            [(0, 20.0), (30, 20.1), (60, 20.2), (61, 20.3)],
+            [20.0, 20.2],
+        ),
+        # Readings that are not numbers are only throttled by time
+        (
+            SensorThrottle(1, 0, 0),
+            [(0, "Normal"), (1, "Normal"), (2, 20.0)],
+            ["Normal", "Normal", 20.0],
+        ),
+    ],
+)
+def test_sensor_throttle(
+    throttle: SensorThrottle, readings: list[tuple[float, Any]], written: list[Any]
+) -> None:
+    """Test which readings the throttle lets through."""
+    result = []
+    for now, value in readings:
+        with patch(
+            "custom_components.rfxtrx.ext.sensor.time.monotonic", return_value=now
+        ):
+            if throttle.should_write(value):
+                result.append(value)
+
+    assert result == written
+    assert throttle.writes_saved == len(readings) - len(written)
+
+
+@pytest.mark.parametrize(
+    ("entity_info", "throttled"),
+    [
+        ({}, False),
+        ({CONF_SENSOR_HEARTBEAT: 60}, False),
+        ({CONF_SENSOR_DEADBAND: "0.5"}, True),
+        ({CONF_SENSOR_MIN_INTERVAL: 10}, True),
+    ],
+)
+def test_sensor_throttle_needs_deadband_or_interval(
+    entity_info: dict[str, Any], throttled: bool
+) -> None:
+    """Test that a heartbeat on its own does not throttle the sensors."""
+    (sensor,) = _sensors(None, SensorIndex(), ["Temperature"], entity_info)
+
+    assert (sensor._myattr_throttle is not None) == throttled
+
+
+@pytest.mark.parametrize(
+    ("aggregate", "readings", "published"),
+    [
+        # Only the last samples are kept once the ring buffer wraps around
+        (
+            SensorAggregate("mean", 60, size=4),
+            [(0, 1), (10, 2), (20, 3), (30, 4), (40, 5), (50, 6), (60, 7)],
+            [1.0, 5.5],
+        ),
+        # Each window ends at the reading that published the last one
+        (
+            SensorAggregate("max", 60),
+            [(0, 9), (30, 5), (61, 3), (90, 4), (121, 1)],
+            [9.0, 5.0, 4.0],
+        ),
+        # The window before a gap is published with the next reading
+        (
+            SensorAggregate("min", 60),
+            [(0, 5.0), (10, 1.234), (20, 4.0), (300, 2.0)],
+            [5.0, 1.23],
+        ),
+        # A reading that is not a number is shown as is and starts a new window
+        (
+            SensorAggregate("mean", 60),
+            [(0, 1), (10, "Unknown"), (20, 3)],
+            [1.0, None, 3.0],
+        ),
+    ],
+)
+def test_sensor_aggregate(
+    aggregate: SensorAggregate,
+    readings: list[tuple[float, Any]],
+    published: list[float | None],
+) -> None:
+    """Test the aggregates published over the windows of readings."""
+    result = []
+    for now, value in readings:
+        with patch(
+            "custom_components.rfxtrx.ext.sensor.time.monotonic", return_value=now
+        ):
+            if aggregate.add(value):
+                result.append(aggregate.value)
+
+    assert result == published
+
+
+def test_peak_sensor_follows_its_sensor(tmp_path: Path) -> None:
+    """Test that a peak sensor shows the maximum of the sensor it is the peak of."""
+
+    async def _run() -> None:
+        hass = HomeAssistant(str(tmp_path))
+        gateway = GatewayConnection(hass, None, None, 0)
+        gateway.connected = True
+        hass.data[DOMAIN] = {DATA_GATEWAY: gateway}
+        index = SensorIndex()
+        index.async_setup(hass, MagicMock())
+        sensors = _sensors(
+            hass,
+            index,
+            ["Temperature", "Humidity"],
+            {CONF_SENSOR_AGGREGATE: "Temperature=peak"},
+        )
+        assert [sensor.entity_description.key for sensor in sensors] == [
+            "Temperature",
+            "Humidity",
+            "Temperature peak",
+        ]
+        peak = sensors[2]
+        assert peak._myattr_value_key == "Temperature"
+        assert peak.unique_id != sensors[0].unique_id
+
+        for sensor in sensors:
+            with patch.object(RfxtrxSensor, "async_get_last_state", return_value=None):
+                await sensor.async_added_to_hass()
+
+        event = get_rfx_object(PACKET)
+        async_dispatcher_send(hass, SIGNAL_EVENT, event, get_device_id(event.device))
+        await asyncio.sleep(0)
+        assert hass.states.get("sensor.th_temperature").state == "14.9"
+        assert hass.states.get("sensor.th_temperature_peak").state == "14.9"
+
+        await hass.async_stop(force=True)
+
+    asyncio.run(_run())
@@ -0,0 +1,59 @@
+"""Tests for the RFXtrx sirens."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.rfxtrx import get_device_id, get_rfx_object
+from custom_components.rfxtrx.const import DOMAIN
+from custom_components.rfxtrx.ext.const import DATA_OFF_DELAY
+from custom_components.rfxtrx.ext.off_delay import OffDelayScheduler
+from custom_components.rfxtrx.siren import RfxtrxSecurityPanic
+
+# Security sensor reporting a panic, and the end of it
+PANIC_PACKET = "0a20070000e1d4060e0070"
+END_PANIC_PACKET = "0a20070000e1d4070e0070"
+
+OFF_DELAY = 0.2
+
+
+def test_repeated_panic_pushes_off_delay_back(tmp_path: Path) -> None:
+    """Test that a second panic within the off delay extends the time on."""
+
+    async def _run() -> None:
+        hass = HomeAssistant(str(tmp_path))
+        hass.data[DOMAIN] = {DATA_OFF_DELAY: OffDelayScheduler(hass)}
+        event = get_rfx_object(PANIC_PACKET)
+        siren = RfxtrxSecurityPanic(
+            event.device, get_device_id(event.device), off_delay=OFF_DELAY
+        )
+        siren.hass = hass
+        siren.entity_id = "siren.panic"
+
+        siren._apply_event(event)
+        assert siren.is_on
+        await asyncio.sleep(OFF_DELAY / 2)
+        siren._apply_event(event)
+
+        # Past the first off time, but not the second
+        await asyncio.sleep(OFF_DELAY * 3 / 4)
+        assert siren.is_on
+        await asyncio.sleep(OFF_DELAY / 2)
+        assert not siren.is_on
+
+        # The end of a panic, and then a new panic starts a fresh off delay
+        siren._apply_event(event)
+        siren._apply_event(get_rfx_object(END_PANIC_PACKET))
+        assert not siren.is_on
+        siren._apply_event(event)
+        await asyncio.sleep(OFF_DELAY * 3 / 4)
+        assert siren.is_on
+        await asyncio.sleep(OFF_DELAY / 2)
+        assert not siren.is_on
+
+        await hass.async_stop(force=True)
+
+    asyncio.run(_run())
@@ -0,0 +1,57 @@
+"""Tests for the coalesced state writes of the RFXtrx covers."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.rfxtrx import get_device_id, get_rfx_object
+from custom_components.rfxtrx.const import DOMAIN
+from custom_components.rfxtrx.ext.const import DATA_GATEWAY, DATA_GROUP_INDEX
+from custom_components.rfxtrx.ext.gateway import GatewayConnection
+from custom_components.rfxtrx.ext.group import CoverGroupIndex
+from custom_components.rfxtrx.ext.somfy_roller_blind import SomfyRollerBlind
+
+PACKET = "0c1a0000030101011300000003"
+
+
+def test_unchanged_writes_are_dropped(tmp_path: Path) -> None:
+    """Test that only writes that change the state reach the state machine."""
+
+    async def _run() -> None:
+        hass = HomeAssistant(str(tmp_path))
+        gateway = GatewayConnection(hass, None, None, 0)
+        gateway.connected = True
+        hass.data[DOMAIN] = {
+            DATA_GATEWAY: gateway,
+            DATA_GROUP_INDEX: CoverGroupIndex(),
+        }
+        event = get_rfx_object(PACKET)
+        blind = SomfyRollerBlind(event.device, get_device_id(event.device), {})
+        blind.hass = hass
+        blind.entity_id = "cover.blind"
+
+        blind.async_write_ha_state()
+        blind.async_write_ha_state()
+        await asyncio.sleep(0)
+        assert blind.write_diagnostics() == {"writes": 2, "writes_saved": 1}
+        assert hass.states.get("cover.blind") is not None
+
+        # Nothing has changed since the last write
+        blind.async_write_ha_state()
+        await asyncio.sleep(0)
+        assert blind.write_diagnostics() == {"writes": 3, "writes_saved": 2}
+
+        # Removed and added again under a new entity_id
+        await blind.async_will_remove_from_hass()
+        hass.states.async_remove("cover.blind")
+        blind.entity_id = "cover.renamed"
+        blind.async_write_ha_state()
+        await asyncio.sleep(0)
+        assert hass.states.get("cover.renamed") is not None
+
+        await hass.async_stop(force=True)
+
+    asyncio.run(_run())
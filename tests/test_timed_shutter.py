@@ -0,0 +1,123 @@
+"""Tests for the RFXtrx timed shutter covers."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Future
+from pathlib import Path
+import time
+from unittest.mock import MagicMock
+
+from homeassistant.core import HomeAssistant
+import pytest
+
+from custom_components.rfxtrx import get_device_id, get_rfx_object
+from custom_components.rfxtrx.const import DATA_RFXOBJECT, DOMAIN
+from custom_components.rfxtrx.ext.const import (
+    CONF_CLOSE_SECONDS,
+    CONF_OPEN_SECONDS,
+    DATA_FRAME_TIMER,
+    DATA_GATEWAY,
+    DATA_GROUP_INDEX,
+)
+from custom_components.rfxtrx.ext.frame_timer import Pulse, PulseTiming
+from custom_components.rfxtrx.ext.gateway import GatewayConnection
+from custom_components.rfxtrx.ext.group import CoverGroupIndex
+from custom_components.rfxtrx.ext.timed_shutter_cover import Move, TimedShutterCover
+
+PACKET = "0b1100cd0213c7f210010f70"
+
+
+class _Timer:
+    """Frame timer whose pulses are sent when the test says so."""
+
+    def __init__(self) -> None:
+        self.pulses: list[Pulse] = []
+
+    def pulse(self, start, stop, secs: float, stagger: bool = True) -> Pulse:
+        pulse = Pulse(Future(), Future())
+        pulse.started.set_running_or_notify_cancel()
+        pulse.stopped.set_running_or_notify_cancel()
+        self.pulses.append(pulse)
+        return pulse
+
+
+def _shutter(hass: HomeAssistant | None) -> TimedShutterCover:
+    """Make a shutter that opens and closes in a second."""
+    event = get_rfx_object(PACKET)
+    shutter = TimedShutterCover(
+        event.device,
+        get_device_id(event.device),
+        {CONF_OPEN_SECONDS: 1, CONF_CLOSE_SECONDS: 1},
+    )
+    shutter.hass = hass
+    shutter.entity_id = "cover.shutter"
+    return shutter
+
+
+@pytest.mark.parametrize(
+    ("move", "when", "position"),
+    [
+        (Move(10, 50, True, 20), 12, 60),
+        (Move(10, 50, True, 20), 30, 100),
+        (Move(10, 50, False, 10), 12, 30),
+        (Move(10, 50, False, 10), 20, 0),
+        # Before the start frame was sent
+        (Move(10, 50, True, 20), 5, 50),
+    ],
+)
+def test_position_at(move: Move, when: float, position: float) -> None:
+    """Test the position a move has reached at a time."""
+    assert _shutter(None)._position_at(move, when) == pytest.approx(position)
+
+
+def test_drift_builds_up_until_an_end_stop(tmp_path: Path) -> None:
+    """Test that late stops add to the drift until the shutter reaches an end."""
+
+    async def _run() -> None:
+        hass = HomeAssistant(str(tmp_path))
+        gateway = GatewayConnection(hass, None, None, 0)
+        gateway.connected = True
+        timer = _Timer()
+        hass.data[DOMAIN] = {
+            DATA_GATEWAY: gateway,
+            DATA_GROUP_INDEX: CoverGroupIndex(),
+            DATA_FRAME_TIMER: timer,
+            DATA_RFXOBJECT: MagicMock(),
+        }
+        shutter = _shutter(hass)
+
+        async def _move(position: int, late: float) -> None:
+            await shutter._async_move_to(position, False)
+            await asyncio.sleep(0)
+            pulse = timer.pulses[-1]
+            started = time.monotonic()
+            pulse.started.set_result(started)
+            secs = abs(position - shutter._myattr_exact_position) / 100
+            pulse.stopped.set_result(
+                PulseTiming(secs, started, started + secs + late)
+            )
+            await asyncio.wait((shutter._move_task,))
+
+        # Each stop is 20 ms late, and the shutter travels 2% in that time
+        await _move(60, 0.02)
+        assert shutter._myattr_exact_position == pytest.approx(62)
+        assert shutter._attr_current_cover_position == 62
+        await _move(40, 0.02)
+        assert shutter._myattr_exact_position == pytest.approx(38)
+        assert shutter.timing_diagnostics()["drift"] == pytest.approx(0)
+        await _move(50, 0.02)
+        diagnostics = shutter.timing_diagnostics()
+        assert diagnostics["drift"] == pytest.approx(2)
+        assert diagnostics["moves_since_sync"] == 3
+        assert diagnostics["pulses"] == 3
+
+        await _move(100, 0)
+        diagnostics = shutter.timing_diagnostics()
+        assert shutter._myattr_exact_position == 100
+        assert diagnostics["drift"] == 0
+        assert diagnostics["moves_since_sync"] == 0
+
+        await hass.async_stop(force=True)
+
+    asyncio.run(_run())
@@ -0,0 +1,173 @@
+"""Tests for the Somfy venetian blinds."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+import pytest
+
+from custom_components.rfxtrx import get_device_id, get_rfx_object
+from custom_components.rfxtrx.const import (
+    CONF_VENETIAN_BLIND_MODE,
+    CONST_VENETIAN_BLIND_MODE_EU,
+    CONST_VENETIAN_BLIND_MODE_US,
+    DOMAIN,
+)
+from custom_components.rfxtrx.entity import RfxtrxCommandEntity
+from custom_components.rfxtrx.ext.abs_tilting_cover import (
+    TILT_MID_STEP,
+    TILT_MIN_STEP,
+)
+from custom_components.rfxtrx.ext.const import (
+    CONF_TILT_POS1_MS,
+    CONF_TILT_POS2_MS,
+    CONF_TILT_PRESS_MS,
+    DATA_GATEWAY,
+    DATA_GROUP_INDEX,
+)
+from custom_components.rfxtrx.ext.gateway import GatewayConnection
+from custom_components.rfxtrx.ext.group import CoverGroupIndex
+from custom_components.rfxtrx.ext.somfy_venetian_blind import (
+    SomfyVenetianBlind,
+    TiltStep,
+)
+
+PACKET = "0c1a0000030101011300000003"
+
+
+def _blind(
+    hass: HomeAssistant | None, entity_info: dict[str, Any]
+) -> SomfyVenetianBlind:
+    """Make a venetian blind for an RFY frame."""
+    event = get_rfx_object(PACKET)
+    blind = SomfyVenetianBlind(
+        event.device, get_device_id(event.device), entity_info=entity_info
+    )
+    blind.hass = hass
+    blind.entity_id = "cover.venetian"
+    return blind
+
+
+# The mid point step, at the default sync time
+MID = TiltStep("send_stop", 1, 0.002, False, TILT_MID_STEP)
+
+
+@pytest.mark.parametrize(
+    "mode", [None, CONST_VENETIAN_BLIND_MODE_US, CONST_VENETIAN_BLIND_MODE_EU]
+)
+@pytest.mark.parametrize(
+    ("options", "state", "tilt_step", "plan"),
+    [
+        # Timed pulses, from the mid point and via the mid point
+        (
+            {},
+            (False, TILT_MID_STEP),
+            3,
+            [TiltStep("send_up05sec", 1, 1.75, True, 3)],
+        ),
+        (
+            {CONF_TILT_POS1_MS: 1200},
+            (False, TILT_MID_STEP),
+            1,
+            [TiltStep("send_down05sec", 1, 1.2, True, 1)],
+        ),
+        (
+            {},
+            (False, 1),
+            3,
+            [MID, TiltStep("send_up05sec", 1, 1.75, True, 3)],
+        ),
+        (
+            {},
+            (False, 3),
+            1,
+            [MID, TiltStep("send_down05sec", 1, 1.75, True, 1)],
+        ),
+        ({}, (False, TILT_MID_STEP), TILT_MID_STEP, [MID]),
+        # Native presses, once their tilt has been set
+        (
+            {CONF_TILT_PRESS_MS: 1800},
+            (False, TILT_MID_STEP),
+            3,
+            [TiltStep("send_up2sec", 1, 1.8, False, 3)],
+        ),
+        (
+            {CONF_TILT_PRESS_MS: 900},
+            (False, TILT_MIN_STEP),
+            1,
+            [MID, TiltStep("send_down2sec", 2, 0.9, False, 1)],
+        ),
+        # Too far from a whole number of presses
+        (
+            {CONF_TILT_PRESS_MS: 1000},
+            (False, TILT_MID_STEP),
+            3,
+            [TiltStep("send_up05sec", 1, 1.75, True, 3)],
+        ),
+    ],
+)
+def test_plan_tilt(
+    mode: str | None,
+    options: dict[str, Any],
+    state: tuple[bool, int],
+    tilt_step: int,
+    plan: list[TiltStep],
+) -> None:
+    """Test the frames planned to reach each tilt step in either mode."""
+    blind = _blind(None, {CONF_VENETIAN_BLIND_MODE: mode, **options})
+    blind._set_position(*state)
+
+    assert blind._plan_tilt(tilt_step) == plan
+
+
+def test_plan_tilt_halts_running_motor() -> None:
+    """Test that a running motor is halted before going to the mid point."""
+    blind = _blind(None, {})
+    blind._set_position(False, TILT_MID_STEP)
+    blind._myattr_motor_running = True
+
+    assert blind._plan_tilt(3) == [
+        TiltStep("send_stop", 1, 0.25, False, None),
+        MID,
+        TiltStep("send_up05sec", 1, 1.75, True, 3),
+    ]
+
+
+def test_preempt_during_pulse_halts_motor(tmp_path: Path) -> None:
+    """Test that a movement preempted during a tilt pulse halts the motor first."""
+
+    async def _run() -> None:
+        hass = HomeAssistant(str(tmp_path))
+        gateway = GatewayConnection(hass, None, None, 0)
+        gateway.connected = True
+        hass.data[DOMAIN] = {
+            DATA_GATEWAY: gateway,
+            DATA_GROUP_INDEX: CoverGroupIndex(),
+        }
+        blind = _blind(hass, {CONF_TILT_POS2_MS: 300})
+        blind._set_position(False, TILT_MIN_STEP)
+
+        sent: list[str] = []
+
+        async def _send(self, fun, *args) -> None:
+            sent.append(fun.__name__)
+
+        with patch.object(RfxtrxCommandEntity, "_async_send", _send):
+            # Via the mid point, then a timed pulse up to step 3
+            await blind._async_move_to(False, 3, False)
+            await asyncio.sleep(0.1)
+            assert blind._myattr_pulsing
+
+            await blind._async_move_to(False, TILT_MID_STEP, True)
+
+        # The pulse is halted before the stop that sends the blind to My
+        assert sent == ["send_stop", "send_up05sec", "send_stop", "send_stop"]
+        assert blind._myattr_tilt_step == TILT_MID_STEP
+
+        await hass.async_stop(force=True)
+
+    asyncio.run(_run())